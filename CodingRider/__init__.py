@@ -1,8 +1,13 @@
 __all__ = [
+    "asyncdrone",
     "crc",
+    "discovery",
     "drone",
+    "dronehub",
     "protocol",
     "receiver",
     "storage",
     "system",
+    "transmitter",
+    "transport",
     ]
\ No newline at end of file
@@ -0,0 +1,299 @@
+import asyncio
+import functools
+import time
+
+from CodingRider.drone import *
+
+
+
+# asyncio 이벤트 루프에서 사용하는 Drone
+# 수신은 스레드 대신 이벤트 루프의 reader 콜백에서 처리하고, send* 함수는 await로 호출
+# 송신은 이벤트 루프 스레드에서 바로 전송(프레임이 짧아서 OS 버퍼에 바로 들어감)
+class AsyncDrone(Drone):
+
+# BaseFunctions Start
+
+    def __init__(self, flagShowErrorMessage = False, flagShowLogMessage = False, flagShowTransferData = False, flagShowReceiveData = False, sizeReadChunk = 4096, timeoutRead = 0.01, clock = None, sizeStreamQueue = 64):
+
+        super().__init__(False, flagShowErrorMessage, flagShowLogMessage, flagShowTransferData, flagShowReceiveData, sizeReadChunk, timeoutRead, clock, False)
+
+        self._loop                      = None
+        self._fd                        = None
+        self._sizeStreamQueue           = max(sizeStreamQueue, 1)   # stream()별 대기열 최대 길이(가득 차면 오래된 데이터 삭제)
+
+        self._dictStream                = {dataType: [] for dataType in DataType}      # stream()별 asyncio.Queue
+        self._dictRequest               = {dataType: [] for dataType in DataType}      # 응답을 기다리는 Future
+
+
+
+    def __del__(self):
+
+        self._stopReading()
+
+        if self.isOpen():
+            self._transport.close()
+
+
+
+    # portname 대신 transport를 지정하면 시리얼 포트가 아닌 다른 통신 경로(TCP, pty)를 사용
+    # 이벤트 루프에서 수신을 기다려야 하므로 fileno()를 지원하는 통신 경로만 사용 가능
+    # 시리얼 포트는 POSIX(Linux, macOS)에서만 사용 가능(Windows에서는 False를 반환)
+    async def open(self, portname = "None", transport = None, baudrate = 57600, bytesize = serial.EIGHTBITS, parity = serial.PARITY_NONE, stopbits = serial.STOPBITS_ONE):
+
+        self._loop = asyncio.get_running_loop()
+
+        portname = self._openTransport(portname, transport, baudrate, bytesize, parity, stopbits)
+
+        if portname == None:
+            return False
+
+        self._fd = self._transport.fileno()
+
+        if self._fd == None:
+            self._transport.close()
+
+            # 오류 메세지 출력
+            self._printError("Could not connect to CodingRider.")
+
+            return False
+
+        self._loop.add_reader(self._fd, self._receiving)
+
+        # 통신 속도 자동 확인
+        if (baudrate == None) and (await self._detectBaudrate(portname) == None):
+            await self.close()
+
+            # 오류 메세지 출력
+            self._printError("Could not detect baudrate.({0})".format(portname))
+
+            return False
+
+        # 로그 출력
+        self._printLog("Connected.({0})".format(portname))
+
+        return True
+
+
+
+    async def _detectBaudrate(self, portname, timeout = 0.3):
+
+        for baudrate in self._getListBaudrate(portname):
+
+            # 통신 속도를 바꿀 수 없는 경로는 확인하지 않음
+            if not self._transport.setBaudrate(baudrate):
+                return 0
+
+            future = self._addRequest(DataType.Ack)
+
+            Drone.sendPing(self, DeviceType.Controller)
+            Drone.sendPing(self, DeviceType.Drone)
+
+            timeEnd = self._clock() + timeout
+
+            # Ping이 아닌 다른 요청에 대한 Ack는 무시
+            while True:
+                ack = await self._waitRequest(DataType.Ack, future, timeEnd - self._clock())
+
+                if (ack == None) or (ack.dataType == DataType.Ping):
+                    break
+
+                future = self._addRequest(DataType.Ack)
+
+            if ack != None:
+                Drone._dictBaudrate[portname] = baudrate
+
+                # 로그 출력
+                self._printLog("Baudrate {0}.".format(baudrate))
+
+                return baudrate
+
+        return None
+
+
+
+    async def close(self):
+        # 로그 출력
+        if self.isOpen():
+            self._printLog("Closing serial port.")
+
+        self._stopReading()
+
+        # 진행중인 stream() 종료
+        for listQueue in self._dictStream.values():
+            for queue in listQueue:
+                if queue.full():
+                    queue.get_nowait()
+
+                queue.put_nowait(None)
+
+        # 응답을 기다리는 request()는 None 반환
+        for listFuture in self._dictRequest.values():
+            for future in listFuture:
+                if not future.done():
+                    future.set_result(None)
+
+        self._printLog("Port Close.")
+
+        if self.isOpen() == True:
+            self._transport.close()
+
+
+
+    def _stopReading(self):
+        if (self._loop != None) and (self._fd != None):
+            self._loop.remove_reader(self._fd)
+            self._fd = None
+
+
+
+    # 이벤트 루프 reader 콜백
+    def _receiving(self):
+
+        try:
+            dataArray = self._transport.read(self._sizeReadChunk)
+
+        except OSError:
+            dataArray = b''
+
+        if len(dataArray) == 0:
+            # 상대편에서 연결을 끊은 경우
+            self._stopReading()
+
+            # 오류 메세지 출력
+            self._printError("Connection closed.")
+
+            return
+
+        self._bufferQueue.put((self._clock(), dataArray))
+
+        self.checkBatch()
+
+
+
+    def _runEventHandler(self, dataType):
+
+        result  = super()._runEventHandler(dataType)
+        data    = self._storage.d.get(dataType)
+
+        if data != None:
+
+            for future in self._dictRequest[dataType]:
+                if not future.done():
+                    future.set_result(data)
+
+            for queue in self._dictStream[dataType]:
+                # 대기열이 가득 차면 가장 오래된 데이터 삭제
+                if queue.full():
+                    queue.get_nowait()
+
+                queue.put_nowait(data)
+
+        return result
+
+
+
+    def _addRequest(self, dataType):
+
+        future = self._loop.create_future()
+        self._dictRequest[dataType].append(future)
+
+        return future
+
+
+
+    async def _waitRequest(self, dataType, future, timeout):
+
+        try:
+            return await asyncio.wait_for(future, max(timeout, 0))
+
+        except asyncio.TimeoutError:
+            return None
+
+        finally:
+            if future in self._dictRequest[dataType]:
+                self._dictRequest[dataType].remove(future)
+
+# BaseFunctions End
+
+
+
+# Receive Start
+
+    # 데이터 요청 후 응답을 기다림(timeout 초과 시 None 반환)
+    async def request(self, deviceType, dataType, timeout = 1):
+
+        if  ( (not isinstance(deviceType, DeviceType)) or (not isinstance(dataType, DataType)) ):
+            return None
+
+        future = self._addRequest(dataType)
+
+        if Drone.sendRequest(self, deviceType, dataType) == None:
+            self._dictRequest[dataType].remove(future)
+            return None
+
+        return await self._waitRequest(dataType, future, timeout)
+
+
+
+    # 수신한 데이터를 차례로 반환
+    # async for motion in drone.stream(DataType.Motion):
+    async def stream(self, dataType):
+
+        if (not isinstance(dataType, DataType)):
+            return
+
+        queue = asyncio.Queue(self._sizeStreamQueue)
+        self._dictStream[dataType].append(queue)
+
+        try:
+            while True:
+                data = await queue.get()
+
+                # close() 호출 시 종료
+                if data == None:
+                    return
+
+                yield data
+
+        finally:
+            self._dictStream[dataType].remove(queue)
+
+# Receive End
+
+
+
+# Control Start
+
+    async def sendControlWhile(self, roll, pitch, yaw, throttle, timeMs):
+
+        if  ( (not isinstance(roll, int)) or (not isinstance(pitch, int)) or (not isinstance(yaw, int)) or (not isinstance(throttle, int)) ):
+            return None
+
+        timeSec     = timeMs / 1000
+        timeStart   = time.perf_counter()
+
+        while ((time.perf_counter() - timeStart) < timeSec):
+            Drone.sendControl(self, roll, pitch, yaw, throttle)
+            await asyncio.sleep(0.02)
+
+        return Drone.sendControl(self, roll, pitch, yaw, throttle)
+
+# Control End
+
+
+
+# Drone의 send* 함수를 await로 호출할 수 있도록 변환
+def _makeSendAsync(method):
+
+    @functools.wraps(method)
+    async def sendAsync(self, *args, **kwargs):
+        return method(self, *args, **kwargs)
+
+    return sendAsync
+
+
+for _name in dir(Drone):
+    if _name.startswith("send") and (_name not in AsyncDrone.__dict__):
+        setattr(AsyncDrone, _name, _makeSendAsync(getattr(Drone, _name)))
+
+del _name
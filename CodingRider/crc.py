@@ -27,8 +27,12 @@
     */
 """
 
+from binascii import crc_hqx
 
 
+
+# CRC16-CCITT(XModem, 다항식 0x1021)
+# 바이트 배열은 표준 라이브러리의 binascii.crc_hqx(C 구현)로 계산
 class CRC16:
 
     table = (
@@ -74,6 +78,8 @@ class CRC16:
         if type(data) == int:
             index   = ((crc >> 8) ^ data) & 0x00FF
             crc2    = ((crc << 8) ^ cls.table[index]) & 0xFFFF
+        elif isinstance(data, (bytes, bytearray, memoryview)):
+            crc2 = crc_hqx(data, crc)
         elif hasattr(data, "__len__"):
             crc2 = crc
             for i in range(0, len(data)):
@@ -82,3 +88,50 @@ class CRC16:
         
         return crc2
 
+
+
+    # 데이터 전체의 CRC16을 계산하여 crc16과 비교
+    @classmethod
+    def verify(cls, dataArray, crc16):
+        return cls.calc(dataArray, 0) == crc16
+
+
+
+    # 전송 프레임(0x0A, 0x55, 헤더, 데이터, CRC16) 전체를 확인
+    @classmethod
+    def verifyFrame(cls, dataArray):
+
+        if len(dataArray) < 8:
+            return False
+
+        if (dataArray[0] != 0x0A) or (dataArray[1] != 0x55):
+            return False
+
+        if len(dataArray) != dataArray[3] + 8:
+            return False
+
+        crc16 = dataArray[-2] | (dataArray[-1] << 8)
+
+        return cls.verify(dataArray[2:-2], crc16)
+
+
+
+# CRC16 순차 계산
+# 데이터를 나누어 update()로 전달한 뒤 digest()로 전송 순서(little endian)의 CRC16을 얻음
+class CRC16Stream:
+
+    def __init__(self, crc = 0):
+        self.crc = crc
+
+
+    def update(self, data):
+        self.crc = CRC16.calc(data, self.crc)
+        return self
+
+
+    def digest(self):
+        return bytes((self.crc & 0xFF, (self.crc >> 8) & 0xFF))
+
+
+    def reset(self, crc = 0):
+        self.crc = crc
@@ -0,0 +1,140 @@
+import time
+import threading
+from time import sleep
+from concurrent.futures import ThreadPoolExecutor
+from serial.tools.list_ports import comports
+
+from CodingRider.drone import *
+
+
+
+# 포트 확인 결과
+class PortInformation:
+
+    def __init__(self, portname, key = None):
+        self.portname               = portname
+        self.key                    = key       # 캐시 키(USB 시리얼 번호 또는 VID:PID)
+        self.baudrate               = 57600
+
+        self.informationDrone       = None      # 드론의 Information(응답이 없으면 None)
+        self.informationController  = None      # 조종기의 Information(응답이 없으면 None)
+
+        self.flagCached             = False     # 캐시에서 가져온 결과인지 여부
+
+
+    def isDevice(self):
+        return (self.informationDrone != None) or (self.informationController != None)
+
+
+
+_dictCache      = {}                # 캐시 키별 PortInformation
+_lockCache      = threading.Lock()
+
+
+
+# USB 시리얼 번호가 있으면 시리얼 번호, 없으면 VID:PID와 포트 이름을 캐시 키로 사용
+def getPortKey(node):
+
+    if node.serial_number:
+        return "SN:{0}".format(node.serial_number)
+
+    if node.vid != None:
+        return "{0:04X}:{1:04X}@{2}".format(node.vid, node.pid, node.device)
+
+    return None
+
+
+
+def clearCache():
+
+    with _lockCache:
+        _dictCache.clear()
+
+
+
+# 연결된 모든 포트를 동시에 열고 드론과 조종기에 Information을 요청
+# 캐시에 확인 결과가 있는 포트는 다시 확인하지 않음
+def discover(listPortname = None, timeout = 1, baudrate = 57600, flagUseCache = True):
+
+    nodes = comports()
+
+    if listPortname != None:
+        nodes = [node for node in nodes if node.device in listPortname]
+        listPortnameUnknown = [portname for portname in listPortname if portname not in [node.device for node in nodes]]
+    else:
+        listPortnameUnknown = []
+
+    listPortInformation = []
+    listProbe           = []
+
+    for node in nodes:
+        key = getPortKey(node)
+
+        with _lockCache:
+            portInformationCached = _dictCache.get(key) if (flagUseCache and key != None) else None
+
+        if portInformationCached != None:
+            portInformation                         = PortInformation(node.device, key)
+            portInformation.baudrate                = portInformationCached.baudrate
+            portInformation.informationDrone        = portInformationCached.informationDrone
+            portInformation.informationController   = portInformationCached.informationController
+            portInformation.flagCached              = True
+            listPortInformation.append(portInformation)
+        else:
+            listProbe.append(PortInformation(node.device, key))
+
+    # comports()에 나오지 않는 포트(가상 포트 등)는 캐시 없이 확인
+    for portname in listPortnameUnknown:
+        listProbe.append(PortInformation(portname))
+
+    if len(listProbe) > 0:
+        with ThreadPoolExecutor(max_workers = len(listProbe)) as executor:
+            listPortInformation.extend(executor.map(lambda portInformation: _probe(portInformation, timeout, baudrate), listProbe))
+
+    return listPortInformation
+
+
+
+def _probe(portInformation, timeout, baudrate):
+
+    drone = Drone(flagTransferBackground = False)
+
+    portInformation.baudrate = baudrate
+
+    if drone.open(portInformation.portname, baudrate = baudrate):
+        dictInformation = _requestInformation(drone, (DeviceType.Controller, DeviceType.Drone), timeout)
+
+        portInformation.informationController   = dictInformation.get(DeviceType.Controller)
+        portInformation.informationDrone        = dictInformation.get(DeviceType.Drone)
+
+    drone.close()
+
+    # 응답한 장치가 있는 경우만 캐시에 저장
+    if (portInformation.key != None) and portInformation.isDevice():
+        with _lockCache:
+            _dictCache[portInformation.key] = portInformation
+
+    return portInformation
+
+
+
+# 여러 장치에 Information을 한 번에 요청하고 응답을 모두 받거나 timeout이 지날 때까지 대기
+def _requestInformation(drone, listDeviceType, timeout):
+
+    dictInformation = {}
+
+    # 이벤트 핸들러는 수신 데이터를 저장한 직후에 호출되므로 헤더와 데이터가 항상 일치
+    def eventHandler(information):
+        dictInformation[drone.getHeader(DataType.Information).from_] = information
+
+    drone.setEventHandler(DataType.Information, eventHandler)
+
+    for deviceType in listDeviceType:
+        drone.sendRequest(deviceType, DataType.Information)
+
+    timeEnd = time.perf_counter() + timeout
+
+    while (time.perf_counter() < timeEnd) and (len(dictInformation) < len(listDeviceType)):
+        sleep(0.01)
+
+    return dictInformation
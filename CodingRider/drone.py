@@ -9,6 +9,7 @@ from struct import *
 import time
 from serial.tools.list_ports import comports
 from queue import Queue
+from concurrent.futures import Future
 from operator import eq
 import colorama
 from colorama import Fore, Back, Style
@@ -18,6 +19,8 @@ from CodingRider.storage import *
 from CodingRider.receiver import *
 from CodingRider.system import *
 from CodingRider.crc import *
+from CodingRider.transport import *
+from CodingRider.transmitter import *
 
 
 
@@ -36,21 +39,174 @@ def convertByteArrayToString(dataArray):
 
 
 
+# 헤더가 고정된 프레임
+# 데이터 구조는 메세지 클래스의 schema를 사용하며, 시작 코드와 헤더는 미리 만들어 두고 헤더의 CRC도 미리 계산해 둠
+# 완성된 프레임은 송신 대기열에 들어가므로 버퍼를 재사용하지 않고 매번 새로 만듦
+# (CPython에서는 bytearray 복사 후 pack_into로 채우는 것보다 bytes를 이어 붙이는 것이 빠름)
+class FrameTemplate:
+
+    structCrc16 = Struct('<H')
+
+    def __init__(self, schema, from_ = DeviceType.Base, to_ = DeviceType.Drone):
+
+        self.struct         = schema.struct
+        self.prefix         = bytes((0x0A, 0x55, schema.dataType.value, self.struct.size, from_.value, to_.value))
+        self.crc16Header    = CRC16.calc(self.prefix[2:6], 0)
+
+
+    def make(self, *values):
+
+        data = self.struct.pack(*values)
+
+        return self.prefix + data + self.structCrc16.pack(binascii.crc_hqx(data, self.crc16Header))
+
+
+
+# 여러 프레임을 하나의 버퍼에 모아서 한 번에 전송
+# add()로 (header, data)를 추가하거나, with drone.batch(): 안에서 send* 함수를 호출하면 바로 전송하지 않고 여기에 모음
+# add()를 호출한 시점에 프레임을 완성해 두므로(header, data 객체를 재사용해도 됨) flush()에서는 이어 붙여서 한 번에 전송
+# with 블록은 블록을 시작한 스레드의 send*만 모으며, 중첩된 블록의 프레임은 바깥 블록에 모임
+class TransferBatch:
+
+    structCrc16 = Struct('<H')
+
+    def __init__(self, drone, priority = TransferPriority.Normal):
+        self._drone         = drone
+        self.priority       = priority              # 전송 우선 순위(모은 프레임 중 가장 높은 우선 순위를 사용)
+
+        self._listItem      = []                    # 완성된 프레임
+        self._listPrevious  = []                    # with 블록 시작 전에 같은 스레드에서 프레임을 모으던 TransferBatch
+
+
+    def __len__(self):
+        return len(self._listItem)
+
+
+    def __enter__(self):
+        local = self._drone._batchLocal
+        self._listPrevious.append(getattr(local, "batch", None))
+        local.batch = self
+        return self
+
+
+    def __exit__(self, typeException, valueException, traceback):
+        self._drone._batchLocal.batch = self._listPrevious.pop()
+
+        # 블록 안에서 예외가 발생하면 모은 프레임을 전송하지 않음
+        if typeException == None:
+            self.flush()
+        else:
+            self.clear()
+
+
+    # 현재 스레드에서 프레임을 모으는 중인지 확인
+    def isCapturing(self):
+        return self._drone._getBatch() is self
+
+
+    def add(self, header, data, priority = TransferPriority.Normal):
+
+        if (header == None) or (data == None) or (not isinstance(header, Header)):
+            return False
+
+        # schema가 있으면 프레임 버퍼에 바로 기록
+        if isinstance(data, ISerializable) and (data.schema != None):
+            size        = data.schema.size
+            dataArray   = bytearray(size + 8)
+            data.packInto(dataArray, 6)
+        else:
+            if isinstance(data, ISerializable):
+                data = data.toArray()
+
+            size        = len(data)
+            dataArray   = bytearray(size + 8)
+            dataArray[6:6 + size] = data
+
+        dataArray[0] = 0x0A
+        dataArray[1] = 0x55
+        header.packInto(dataArray, 2)
+
+        self.structCrc16.pack_into(dataArray, 6 + size, binascii.crc_hqx(memoryview(dataArray)[2:6 + size], 0))
+
+        self._listItem.append(dataArray)
+        self._updatePriority(priority)
+
+        return True
+
+
+    # 완성된 프레임 추가
+    def addArray(self, dataArray, priority = TransferPriority.Normal):
+
+        self._listItem.append(bytes(dataArray))
+        self._updatePriority(priority)
+
+        return True
+
+
+    def clear(self):
+        self._listItem = []
+
+
+    def encode(self):
+        return bytearray().join(self._listItem)
+
+
+    # 모은 프레임을 한 번에 전송(모은 프레임이 없으면 None 반환)
+    def flush(self, flagFuture = False):
+
+        if len(self._listItem) == 0:
+            return None
+
+        dataArray = self.encode()
+        self.clear()
+
+        return self._drone._transferArray(dataArray, flagFuture, self.priority)
+
+
+    def _updatePriority(self, priority):
+        if priority.value < self.priority.value:
+            self.priority = priority
+
+
+
 class Drone:
 
+    listBaudrate                    = (57600, 115200, 230400, 460800, 921600)     # 통신 속도 자동 확인 시 시도할 속도 목록
+    _dictBaudrate                   = {}        # 포트별로 확인된 통신 속도
+
 # BaseFunctions Start
 
-    def __init__(self, flagCheckBackground = True, flagShowErrorMessage = False, flagShowLogMessage = False, flagShowTransferData = False, flagShowReceiveData = False):
+    def __init__(self, flagCheckBackground = True, flagShowErrorMessage = False, flagShowLogMessage = False, flagShowTransferData = False, flagShowReceiveData = False, sizeReadChunk = 4096, timeoutRead = 0.01, clock = None, flagTransferBackground = False, sizeTransferQueue = 256, flagReconnect = False, intervalReconnect = 1, sizeReceiveQueue = 65536, overflowPolicy = OverflowPolicy.Block):
         
-        self._serialport                = None
-        self._bufferQueue               = Queue(4096)
-        self._bufferHandler             = bytearray()
+        self._transport                 = None
+        self._sizeReadChunk             = max(sizeReadChunk, 1)     # 한 번에 읽을 최대 크기(1이면 1바이트씩 읽음)
+        self._timeoutRead               = timeoutRead               # 수신 대기 시간(초, None이면 데이터가 들어올 때까지 대기)
+        self._clock                     = clock if clock != None else time.perf_counter     # 현재 시각(초)을 반환하는 함수
+        self._bufferQueue               = ReceiveQueue(sizeReceiveQueue, overflowPolicy)     # 수신 대기열(크기는 바이트 단위)
+        self._bufferHandler             = ReceiveBuffer()
         self._index                     = 0
 
         self._thread                    = None
         self._flagThreadRun             = False
+        self._eventClose                = threading.Event()     # close() 호출 시 설정(다시 연결 대기를 바로 중단)
+
+        self._flagReconnect             = flagReconnect             # 연결이 끊어지면 같은 통신 경로로 다시 연결
+        self._intervalReconnect         = intervalReconnect         # 다시 연결 시도 간격(초)
+        self._eventHandlerReconnect     = None                      # 다시 연결된 후 호출할 함수
+        self._eventHandlerPassthrough   = None                      # 정의되지 않은 DataType의 데이터를 받을 함수
+        self._batchLocal                = threading.local()         # 스레드별로 send* 함수의 프레임을 모으는 중인 TransferBatch(batch)
+        self.countReconnect             = 0
 
-        self._receiver                  = Receiver()
+        self._receiver                  = Receiver(self._clock)
+        self._transmitter               = Transmitter(self._clock, sizeTransferQueue, eventHandlerError = self._printError)
+
+        # 자주 보내는 프레임
+        self._templateControl           = FrameTemplate(ControlQuad8.schema)
+        self._templateControlPosition   = FrameTemplate(ControlPosition.schema)
+        self._templateRequest           = {}        # 받는 장치별 FrameTemplate
+
+        # 송신 스레드를 사용하면 send* 함수가 전송 전에 반환되며, close()하지 않고 끝난 경우 프로그램 종료 시 남은 데이터를 전송
+        self._flagTransferBackground    = flagTransferBackground    # 송신 스레드 사용 여부(False이면 호출한 스레드에서 바로 전송)
 
         self._flagCheckBackground       = flagCheckBackground
 
@@ -63,7 +219,9 @@ class Drone:
         self._storageHeader             = StorageHeader()
         self._storage                   = Storage()
         self._storageCount              = StorageCount()
+        self._storageTime               = StorageTime()
         self._parser                    = Parser()
+        self._batchStatistics           = BatchStatistics()
 
         self.timeStartProgram           = time.time()           # 프로그램 시작 시각 기록
 
@@ -85,62 +243,220 @@ class Drone:
     def _receiving(self):
         while self._flagThreadRun:
             
-            self._bufferQueue.put(self._serialport.read())
+            # 수신 대기중인 데이터를 한 번에 읽음(없으면 timeoutRead 동안 기다림)
+            try:
+                dataArray = self._transport.read(self._sizeReadChunk)
+
+            except Exception:
+                dataArray = None
+
+            # 연결이 끊어진 경우(USB 분리, TCP 연결 종료 등)
+            if (dataArray == None) or (not self._transport.isOpen()):
+                if not self._flagThreadRun:
+                    break
+
+                if self._flagReconnect and self._reconnect():
+                    continue
+
+                # 오류 메세지 출력(close() 호출로 종료한 경우 제외)
+                if self._flagThreadRun:
+                    self._printError("Connection lost.")
+
+                self._flagThreadRun = False
+                break
+
+            if len(dataArray) == 0:
+                continue
+
+            # 수신 시각은 읽어온 데이터 묶음 단위로 기록
+            self._bufferQueue.put((self._clock(), dataArray))
 
             # 수신 데이터 백그라운드 확인이 활성화 된 경우 데이터 자동 업데이트
             if self._flagCheckBackground == True:
-                while self.check() != DataType.None_:
-                    pass
+                self.checkBatch()
 
             #sleep(0.001)
 
 
 
+    # 연결이 다시 될 때까지 intervalReconnect 간격으로 시도(close() 호출 시 False 반환)
+    # 이벤트 핸들러와 수신 데이터, 통신 속도는 그대로 유지
+    def _reconnect(self):
+
+        # 오류 메세지 출력
+        self._printError("Connection lost. Reconnecting.")
+
+        try:
+            self._transport.close()
+        except Exception:
+            pass
+
+        while not self._eventClose.wait(self._intervalReconnect):
+
+            try:
+                self._transport.open()
+            except Exception:
+                continue
+
+            if self.isOpen():
+                self.countReconnect += 1
+
+                # 로그 출력
+                self._printLog("Reconnected.")
+
+                if self._eventHandlerReconnect != None:
+                    self._eventHandlerReconnect()
+
+                return True
+
+        return False
+
+
+
     def isOpen(self):
-        if self._serialport != None:
-            return self._serialport.isOpen()
+        if self._transport != None:
+            return self._transport.isOpen()
         else:
             return False
 
 
 
-    def open(self, portname = "None"):
-        if eq(portname, "None"):
+    # portname 대신 transport를 지정하면 시리얼 포트가 아닌 다른 통신 경로(TCP, pty, 메모리)를 사용
+    # baudrate가 None이면 listBaudrate의 속도를 차례로 시도하여 Ping에 대한 Ack 응답이 오는 속도를 사용
+    def open(self, portname = "None", transport = None, baudrate = 57600, bytesize = serial.EIGHTBITS, parity = serial.PARITY_NONE, stopbits = serial.STOPBITS_ONE):
+        portname = self._openTransport(portname, transport, baudrate, bytesize, parity, stopbits)
+
+        if portname == None:
+            return False
+
+        self._eventClose.clear()
+        self._bufferQueue.resume()
+
+        if self._flagTransferBackground == True:
+            self._transmitter.start(self._transport)
+
+        self._flagThreadRun = True
+        self._thread = Thread(target=self._receiving, args=(), daemon=True)
+        self._thread.start()
+
+        # 통신 속도 자동 확인
+        if (baudrate == None) and (self._detectBaudrate(portname) == None):
+            self.close()
+
+            # 오류 메세지 출력
+            self._printError("Could not detect baudrate.({0})".format(portname))
+
+            return False
+
+        # 로그 출력
+        self._printLog("Connected.({0})".format(portname))
+
+        return True
+
+
+
+    # 통신 경로만 열고 수신/송신 스레드는 시작하지 않음(열린 포트 이름 반환, 실패 시 None)
+    def _openTransport(self, portname, transport, baudrate, bytesize, parity, stopbits):
+        if transport != None:
+            portname = type(transport).__name__
+
+        elif eq(portname, "None"):
             nodes = comports()
             size = len(nodes)
             if size > 0:
                 portname = nodes[size - 1].device
             else:
-                return False
+                return None
+
+            # 포트가 여러 개이면 Information에 응답하는 포트를 사용(확인 결과는 캐시에 저장)
+            if size > 1:
+                from CodingRider.discovery import discover
+
+                for portInformation in discover(timeout = 0.3):
+                    if portInformation.isDevice():
+                        portname = portInformation.portname
+                        break
 
         try:
 
-            self._serialport = serial.Serial(
-                port        = portname,
-                baudrate    = 57600)
+            if transport == None:
+                transport = SerialTransport(portname, baudrate if baudrate != None else Drone.listBaudrate[0], self._timeoutRead, bytesize, parity, stopbits)
+
+            self._transport = transport
+            self._transport.open()
+
+        except:
+            pass
+
+        if self.isOpen():
+            return portname
+
+        # 오류 메세지 출력
+        self._printError("Could not connect to CodingRider.")
+
+        return None
+
+
+
+    # 통신 속도 자동 확인 시 시도할 순서(이전에 확인된 속도를 먼저 시도)
+    def _getListBaudrate(self, portname):
+
+        listBaudrate = list(Drone.listBaudrate)
 
-            if( self.isOpen() ):
-                self._flagThreadRun = True
-                self._thread = Thread(target=self._receiving, args=(), daemon=True)
-                self._thread.start()
+        if portname in Drone._dictBaudrate:
+            baudrate = Drone._dictBaudrate[portname]
+            if baudrate in listBaudrate:
+                listBaudrate.remove(baudrate)
+            listBaudrate.insert(0, baudrate)
+
+        return listBaudrate
+
+
+
+    def _detectBaudrate(self, portname, timeout = 0.3):
+
+        for baudrate in self._getListBaudrate(portname):
+
+            # 이전 속도로 보낸 데이터가 모두 전송된 후 속도 변경
+            self._transmitter.flush(timeout)
+
+            # 통신 속도를 바꿀 수 없는 경로는 확인하지 않음
+            if not self._transport.setBaudrate(baudrate):
+                return 0
+
+            if self._checkBaudrate(timeout):
+                Drone._dictBaudrate[portname] = baudrate
 
                 # 로그 출력
-                self._printLog("Connected.({0})".format(portname))
+                self._printLog("Baudrate {0}.".format(baudrate))
 
-                return True
-            else:
-                # 오류 메세지 출력
-                self._printError("Could not connect to CodingRider.")
+                return baudrate
 
-                return False
+        return None
 
-        except:
-                # 오류 메세지 출력
-                self._printError("Could not connect to CodingRider.")
 
-                return False
 
+    # 현재 통신 속도에서 Ping을 보내고 Ack 응답이 오는지 확인
+    def _checkBaudrate(self, timeout):
+
+        countAck = self._storageCount.d[DataType.Ack]
+
+        self.sendPing(DeviceType.Controller)
+        self.sendPing(DeviceType.Drone)
+
+        timeEnd = self._clock() + timeout
+
+        while self._clock() < timeEnd:
+            
+            if self._flagCheckBackground == False:
+                self.checkBatch()
+
+            if (self._storageCount.d[DataType.Ack] > countAck) and (self._storage.d[DataType.Ack].dataType == DataType.Ping):
+                return True
+
+            sleep(0.01)
 
+        return False
 
 
 
@@ -149,22 +465,30 @@ class Drone:
         if self.isOpen():
             self._printLog("Closing serial port.")
 
+        # 송신 대기열에 남은 데이터를 전송한 후 송신 스레드 종료
+        self._transmitter.stop()
+
         self._printLog("Thread Flag False.")
 
-        if self._flagThreadRun == True:
-            self._flagThreadRun = False
-            sleep(0.1)
+        # 수신 스레드의 read()와 다시 연결 대기를 바로 중단
+        self._flagThreadRun = False
+        self._eventClose.set()
+        self._bufferQueue.cancel()
+
+        if self._transport != None:
+            self._transport.cancelRead()
         
         self._printLog("Thread Join.")
 
-        if self._thread != None:
+        if (self._thread != None) and (self._thread != threading.current_thread()):
             self._thread.join(timeout=1)
 
+        self._thread = None
+
         self._printLog("Port Close.")
 
         if self.isOpen() == True:
-            self._serialport.close()
-            sleep(0.2)
+            self._transport.close()
 
 
 
@@ -191,42 +515,125 @@ class Drone:
 
 
 
-    def transfer(self, header, data):
+    # flagFuture가 True이면 전송 완료 시 데이터 배열을 결과로 갖는 Future를 반환
+    # priority가 높은 데이터는 대기중인 낮은 우선 순위의 데이터보다 먼저 전송
+    def transfer(self, header, data, flagFuture = False, priority = TransferPriority.Normal):
         if not self.isOpen():
             return
 
+        # with drone.batch(): 블록 안에서는 전송하지 않고 모음
+        batch = self._getBatch()
+
+        if batch != None:
+            return batch.add(header, data, priority) or None
+
         dataArray = self.makeTransferDataArray(header, data)
 
-        self._serialport.write(dataArray)
+        if dataArray == None:
+            return
+
+        return self._transferArray(dataArray, flagFuture, priority)
+
+
+
+    # 완성된 프레임 전송
+    def _transferArray(self, dataArray, flagFuture = False, priority = TransferPriority.Normal):
+        if not self.isOpen():
+            return
+
+        batch = self._getBatch()
+
+        if batch != None:
+            return batch.addArray(dataArray, priority)
+
+        if self._transmitter.isRunning():
+            future = self._transmitter.put(dataArray, priority)
+        else:
+            self._transport.write(dataArray)
+            future = None
 
         # 송신 데이터 출력
         self._printTransferData(dataArray)
 
+        if flagFuture == True:
+            if future == None:
+                future = Future()
+                future.set_result(dataArray)
+
+            return future
+
         return dataArray
 
 
 
-    def check(self):
-        while self._bufferQueue.empty() == False:
-            dataArray = self._bufferQueue.get_nowait()
-            self._bufferQueue.task_done()
+    # 여러 프레임을 한 번에 전송
+    # with drone.batch():
+    #     drone.sendTrim(0, 0, 0, 0)
+    #     drone.sendHeadless(Headless.Headless)
+    # 블록 안의 send* 함수는 True를 반환하고, 블록이 끝날 때 모은 프레임을 한 번의 write로 전송
+    def batch(self, priority = TransferPriority.Normal):
+        return TransferBatch(self, priority)
+
+
+
+    # 현재 스레드에서 프레임을 모으는 중인 TransferBatch(없으면 None)
+    def _getBatch(self):
+        return getattr(self._batchLocal, "batch", None)
+
+
+
+    # (header, data) 목록을 하나의 버퍼로 만들어 한 번에 전송
+    def transferBatch(self, listData, flagFuture = False, priority = TransferPriority.Normal):
+        if not self.isOpen():
+            return
+
+        batch = TransferBatch(self, priority)
+
+        for header, data in listData:
+            if not batch.add(header, data, priority):
+                return None
+
+        return batch.flush(flagFuture)
+
+
+
+    # 송신 대기열이 빌 때까지 대기(timeout 초과 시 False 반환)
+    def flush(self, timeout = None):
+        return self._transmitter.flush(timeout)
+
+
+
+    # 수신 큐에 쌓인 데이터를 수신 버퍼로 옮기고 옮긴 바이트 수를 반환
+    def _receiveQueue(self):
+
+        size = 0
+
+        for timeReceived, dataArray in self._bufferQueue.getAll():
 
             if (dataArray != None) and (len(dataArray) > 0):
                 # 수신 데이터 출력
                 self._printReceiveData(dataArray)
 
-                self._bufferHandler.extend(dataArray)
+                self._bufferHandler.write(dataArray, timeReceived)
+                size += len(dataArray)
+
+        return size
 
-        while len(self._bufferHandler) > 0:
-            stateLoading = self._receiver.call(self._bufferHandler.pop(0))
+
+
+    def check(self):
+        self._receiveQueue()
+
+        for stateLoading in self._receiver.decode(self._bufferHandler.buffer, self._bufferHandler.indexRead, self._bufferHandler.indexWrite, self._bufferHandler.timestamps):
 
             # 오류 출력
             if stateLoading == StateLoading.Failure:
                 # 수신 데이터 출력(줄넘김)
                 self._printReceiveDataEnd()
 
-                # 오류 메세지 출력
-                self._printError(self._receiver.message)
+                # 오류 메세지 출력(메세지는 출력할 때만 생성)
+                if self._flagShowErrorMessage:
+                    self._printError(self._receiver.message)
                 
 
             # 로그 출력
@@ -234,38 +641,36 @@ class Drone:
                 # 수신 데이터 출력(줄넘김)
                 self._printReceiveDataEnd()
 
-                # 로그 출력
-                self._printLog(self._receiver.message)
+                # 로그 출력(메세지는 출력할 때만 생성)
+                if self._flagShowLogMessage:
+                    self._printLog(self._receiver.message)
+
+                # 처리한 데이터 삭제
+                self._bufferHandler.consume(self._receiver.indexDecode - self._bufferHandler.indexRead)
 
-            if self._receiver.state == StateLoading.Loaded:
                 self._handler(self._receiver.header, self._receiver.data)
                 return self._receiver.header.dataType
 
+        # 처리한 데이터 삭제(수신중인 프레임은 남겨둠)
+        self._bufferHandler.consume(self._receiver.indexDecode - self._bufferHandler.indexRead)
+
         return DataType.None_
 
 
 
     def checkDetail(self):
-        while self._bufferQueue.empty() == False:
-            dataArray = self._bufferQueue.get_nowait()
-            self._bufferQueue.task_done()
-
-            if (dataArray != None) and (len(dataArray) > 0):
-                # 수신 데이터 출력
-                self._printReceiveData(dataArray)
+        self._receiveQueue()
 
-                self._bufferHandler.extend(dataArray)
-
-        while len(self._bufferHandler) > 0:
-            stateLoading = self._receiver.call(self._bufferHandler.pop(0))
+        for stateLoading in self._receiver.decode(self._bufferHandler.buffer, self._bufferHandler.indexRead, self._bufferHandler.indexWrite, self._bufferHandler.timestamps):
 
             # 오류 출력
             if stateLoading == StateLoading.Failure:
                 # 수신 데이터 출력(줄넘김)
                 self._printReceiveDataEnd()
 
-                # 오류 메세지 출력
-                self._printError(self._receiver.message)
+                # 오류 메세지 출력(메세지는 출력할 때만 생성)
+                if self._flagShowErrorMessage:
+                    self._printError(self._receiver.message)
                 
 
             # 로그 출력
@@ -273,17 +678,72 @@ class Drone:
                 # 수신 데이터 출력(줄넘김)
                 self._printReceiveDataEnd()
 
-                # 로그 출력
-                self._printLog(self._receiver.message)
+                # 로그 출력(메세지는 출력할 때만 생성)
+                if self._flagShowLogMessage:
+                    self._printLog(self._receiver.message)
+
+                # 처리한 데이터 삭제
+                self._bufferHandler.consume(self._receiver.indexDecode - self._bufferHandler.indexRead)
 
-            if self._receiver.state == StateLoading.Loaded:
                 self._handler(self._receiver.header, self._receiver.data)
-                return self._receiver.header, self._receiver.data
+                return self._receiver.header, self._receiver.frame.detach()
+
+        # 처리한 데이터 삭제(수신중인 프레임은 남겨둠)
+        self._bufferHandler.consume(self._receiver.indexDecode - self._bufferHandler.indexRead)
 
         return None, None
 
 
 
+    # 수신 버퍼에 있는 모든 프레임을 한 번에 처리하고 처리한 DataType 목록을 반환
+    # 처리 결과는 getBatchStatistics()로 확인
+    def checkBatch(self):
+
+        timeStart   = time.perf_counter()
+        size        = self._receiveQueue()
+        dataTypes   = []
+
+        # 이벤트 핸들러에서 예외가 발생해도 이미 처리한 프레임은 버퍼에서 삭제(다음 호출에서 다시 처리하지 않음)
+        try:
+            for stateLoading in self._receiver.decode(self._bufferHandler.buffer, self._bufferHandler.indexRead, self._bufferHandler.indexWrite, self._bufferHandler.timestamps):
+
+                # 오류 출력
+                if stateLoading == StateLoading.Failure:
+                    # 수신 데이터 출력(줄넘김)
+                    self._printReceiveDataEnd()
+
+                    # 오류 메세지 출력(메세지는 출력할 때만 생성)
+                    if self._flagShowErrorMessage:
+                        self._printError(self._receiver.message)
+
+                elif stateLoading == StateLoading.Loaded:
+                    # 수신 데이터 출력(줄넘김)
+                    self._printReceiveDataEnd()
+
+                    # 로그 출력(메세지는 출력할 때만 생성)
+                    if self._flagShowLogMessage:
+                        self._printLog(self._receiver.message)
+
+                    header = self._receiver.header
+
+                    # 들어오는 데이터를 저장
+                    self._runHandler(header, self._receiver.data)
+
+                    # 콜백 이벤트 실행
+                    self._runEventHandler(header.dataType)
+
+                    dataTypes.append(header.dataType)
+
+        finally:
+            # 처리한 데이터 삭제(수신중인 프레임은 남겨둠)
+            self._bufferHandler.consume(self._receiver.indexDecode - self._bufferHandler.indexRead)
+
+        self._batchStatistics.update(len(dataTypes), size, time.perf_counter() - timeStart)
+
+        return dataTypes
+
+
+
     def _handler(self, header, dataArray):
 
         # 들어오는 데이터를 저장
@@ -302,10 +762,15 @@ class Drone:
     def _runHandler(self, header, dataArray):
         
         # 일반 데이터 처리
-        if self._parser.d[header.dataType] != None:
+        if self._parser.d.get(header.dataType) != None:
             self._storageHeader.d[header.dataType]   = header
             self._storage.d[header.dataType]         = self._parser.d[header.dataType](dataArray)
             self._storageCount.d[header.dataType]    += 1
+            self._storageTime.d[header.dataType]     = self._receiver.frame.timeReceived
+
+        # 정의되지 않은 DataType(새 펌웨어의 데이터 등)은 저장하지 않고 내용을 그대로 전달
+        elif self._eventHandlerPassthrough != None:
+            self._eventHandlerPassthrough(header, bytes(dataArray))
 
 
 
@@ -327,6 +792,34 @@ class Drone:
 
 
 
+    # 수신 데이터를 객체 대신 튜플로 받음(getData()와 이벤트 핸들러에 튜플이 전달됨)
+    # DecodeMode.Tuple, DecodeMode.Record는 Enum 변환 없이 숫자 값을 그대로 전달
+    # 통신 속도 확인에 사용하는 Ack는 DecodeMode.Object로 유지해야 함
+    def setDecodeMode(self, dataType, decodeMode):
+
+        if  ( (not isinstance(dataType, DataType)) or (not isinstance(decodeMode, DecodeMode)) ):
+            return False
+
+        return self._parser.setDecodeMode(dataType, decodeMode)
+
+
+
+    # 정의되지 않은 DataType의 데이터를 받을 함수(header, bytes)
+    # 함수를 지정하면 DataType이 정의되지 않은 프레임도 CRC 확인 후 수신 처리함(header.dataType은 숫자)
+    def setEventHandlerPassthrough(self, eventHandler):
+
+        self._eventHandlerPassthrough   = eventHandler
+        self._receiver.flagPassthrough  = (eventHandler != None)
+
+
+
+    # 다시 연결된 후 호출할 함수(데이터 요청 재시작 등에 사용)
+    def setEventHandlerReconnect(self, eventHandler):
+
+        self._eventHandlerReconnect = eventHandler
+
+
+
     def getHeader(self, dataType):
     
         if (not isinstance(dataType, DataType)):
@@ -345,6 +838,16 @@ class Drone:
 
 
 
+    # 마지막으로 데이터를 수신한 시각(clock 기준, 초)
+    def getTime(self, dataType):
+
+        if (not isinstance(dataType, DataType)):
+            return None
+
+        return self._storageTime.d[dataType]
+
+
+
     def getCount(self, dataType):
 
         if (not isinstance(dataType, DataType)):
@@ -354,6 +857,45 @@ class Drone:
 
 
 
+    def getBatchStatistics(self):
+
+        return self._batchStatistics
+
+
+
+    # 수신 대기열 크기와 대기열이 가득 차서 버린 데이터
+    def getReceiveQueueStatistics(self):
+
+        return self._bufferQueue.statistics
+
+
+
+    # 송신 대기열 길이와 전송 지연 시간(priority를 지정하지 않으면 전체)
+    def getTransferStatistics(self, priority = None):
+
+        if priority == None:
+            return self._transmitter.statistics
+
+        if (not isinstance(priority, TransferPriority)):
+            return None
+
+        return self._transmitter.statisticsPriority[priority]
+
+
+
+    # 수신 결과별 누적 횟수(receiveStatus를 지정하지 않으면 전체)
+    def getReceiveCount(self, receiveStatus = None):
+
+        if receiveStatus == None:
+            return dict(self._receiver.countStatus)
+
+        if (not isinstance(receiveStatus, ReceiveStatus)):
+            return None
+
+        return self._receiver.countStatus[receiveStatus]
+
+
+
     def _printLog(self, message):
         
         # 로그 출력
@@ -427,18 +969,10 @@ class Drone:
         if  ( (not isinstance(deviceType, DeviceType)) or (not isinstance(dataType, DataType)) ):
             return None
 
-        header = Header()
-        
-        header.dataType = DataType.Request
-        header.length   = Request.getSize()
-        header.from_    = DeviceType.Base
-        header.to_      = deviceType
-
-        data = Request()
+        if deviceType not in self._templateRequest:
+            self._templateRequest[deviceType] = FrameTemplate(Request.schema, DeviceType.Base, deviceType)
 
-        data.dataType   = dataType
-
-        return self.transfer(header, data)
+        return self._transferArray(self._templateRequest[deviceType].make(dataType.value))
 
 
 
@@ -493,7 +1027,7 @@ class Drone:
         data.commandType    = CommandType.FlightEvent
         data.option         = FlightEvent.Takeoff.value
 
-        return self.transfer(header, data)
+        return self.transfer(header, data, priority = TransferPriority.High)
 
 
 
@@ -511,7 +1045,7 @@ class Drone:
         data.commandType    = CommandType.FlightEvent
         data.option         = FlightEvent.Landing.value
 
-        return self.transfer(header, data)
+        return self.transfer(header, data, priority = TransferPriority.High)
 
 
 
@@ -529,7 +1063,7 @@ class Drone:
         data.commandType    = CommandType.Stop
         data.option         = 0
 
-        return self.transfer(header, data)
+        return self.transfer(header, data, priority = TransferPriority.High)
 
 
 
@@ -538,21 +1072,7 @@ class Drone:
         if  ( (not isinstance(roll, int)) or (not isinstance(pitch, int)) or (not isinstance(yaw, int)) or (not isinstance(throttle, int)) ):
             return None
 
-        header = Header()
-        
-        header.dataType = DataType.Control
-        header.length   = ControlQuad8.getSize()
-        header.from_    = DeviceType.Base
-        header.to_      = DeviceType.Drone
-
-        data = ControlQuad8()
-
-        data.roll       = roll
-        data.pitch      = pitch
-        data.yaw        = yaw
-        data.throttle   = throttle
-
-        return self.transfer(header, data)
+        return self._transferArray(self._templateControl.make(roll, pitch, yaw, throttle))
 
 
 
@@ -617,23 +1137,7 @@ class Drone:
         if  ( (not isinstance(heading, int)) or (not isinstance(rotationalVelocity, int)) ):
             return None
 
-        header = Header()
-        
-        header.dataType = DataType.Control
-        header.length   = ControlPosition.getSize()
-        header.from_    = DeviceType.Base
-        header.to_      = DeviceType.Drone
-
-        data = ControlPosition()
-
-        data.positionX          = float(positionX)
-        data.positionY          = float(positionY)
-        data.positionZ          = float(positionZ)
-        data.velocity           = float(velocity)
-        data.heading            = heading
-        data.rotationalVelocity = rotationalVelocity
-
-        return self.transfer(header, data)
+        return self._transferArray(self._templateControlPosition.make(positionX, positionY, positionZ, velocity, heading, rotationalVelocity))
 
 
 # Control End
@@ -879,7 +1383,7 @@ class Drone:
         data.commandType    = CommandType.FlightEvent
         data.option         = flightEvent.value
 
-        return self.transfer(header, data)
+        return self.transfer(header, data, priority = TransferPriority.High)
 
 
 
@@ -1023,7 +1527,7 @@ class Drone:
         data.flags      = flags
         data.brightness = brightness
 
-        return self.transfer(header, data)
+        return self.transfer(header, data, priority = TransferPriority.Low)
 
 
 
@@ -1058,7 +1562,7 @@ class Drone:
         data.color.g        = g
         data.color.b        = b
 
-        return self.transfer(header, data)
+        return self.transfer(header, data, priority = TransferPriority.Low)
 
 
 
@@ -1089,7 +1593,7 @@ class Drone:
 
         data.colors         = colors
 
-        return self.transfer(header, data)
+        return self.transfer(header, data, priority = TransferPriority.Low)
 
 
 
@@ -1126,7 +1630,7 @@ class Drone:
         data.color.g        = g
         data.color.b        = b
 
-        return self.transfer(header, data)
+        return self.transfer(header, data, priority = TransferPriority.Low)
 
 
 
@@ -1159,7 +1663,7 @@ class Drone:
 
         data.colors         = colors
 
-        return self.transfer(header, data)
+        return self.transfer(header, data, priority = TransferPriority.Low)
 
 
 # Light End
@@ -1187,7 +1691,7 @@ class Drone:
         data.value      = value
         data.time       = time
 
-        return self.transfer(header, data)
+        return self.transfer(header, data, priority = TransferPriority.Low)
 
 
 
@@ -1209,7 +1713,7 @@ class Drone:
         data.value      = BuzzerScale.Mute.value
         data.time       = time
 
-        return self.transfer(header, data)
+        return self.transfer(header, data, priority = TransferPriority.Low)
 
 
 
@@ -1231,7 +1735,7 @@ class Drone:
         data.value      = BuzzerScale.Mute.value
         data.time       = time
 
-        return self.transfer(header, data)
+        return self.transfer(header, data, priority = TransferPriority.Low)
 
 
 
@@ -1253,7 +1757,7 @@ class Drone:
         data.value      = scale.value
         data.time       = time
 
-        return self.transfer(header, data)
+        return self.transfer(header, data, priority = TransferPriority.Low)
 
 
 
@@ -1275,7 +1779,7 @@ class Drone:
         data.value      = scale.value
         data.time       = time
 
-        return self.transfer(header, data)
+        return self.transfer(header, data, priority = TransferPriority.Low)
 
 
 
@@ -1297,7 +1801,7 @@ class Drone:
         data.value      = hz
         data.time       = time
 
-        return self.transfer(header, data)
+        return self.transfer(header, data, priority = TransferPriority.Low)
 
 
 
@@ -1319,7 +1823,7 @@ class Drone:
         data.value      = hz
         data.time       = time
 
-        return self.transfer(header, data)
+        return self.transfer(header, data, priority = TransferPriority.Low)
 
 
 # Buzzer End
@@ -0,0 +1,253 @@
+import selectors
+import socket
+import threading
+import time
+
+from CodingRider.drone import *
+
+
+
+# 여러 대의 Drone을 하나의 스레드에서 처리
+# 각 Drone은 수신/송신 스레드를 만들지 않고, DroneHub의 selectors 루프에서 수신 데이터를 처리
+# 송신은 send* 함수를 호출한 스레드에서 바로 전송
+class DroneHub:
+
+    def __init__(self, clock = None):
+
+        self._clock             = clock if clock != None else time.perf_counter
+        self._selector          = selectors.DefaultSelector()
+        self._lock              = threading.Lock()
+
+        self._dictStatistics    = {}        # Drone별 HubStatistics
+
+        self._thread            = None
+        self._flagThreadRun     = False
+
+        # 다른 스레드에서 add(), remove(), stop() 호출 시 select() 대기를 깨우는데 사용
+        self._socketWakeRead, self._socketWakeWrite = socket.socketpair()
+        self._socketWakeRead.setblocking(False)
+        self._selector.register(self._socketWakeRead, selectors.EVENT_READ, None)
+
+
+
+    def __del__(self):
+
+        self.close()
+
+
+
+    # drone의 통신 경로를 열고 DroneHub에 등록
+    # 이벤트 대기에 fileno()가 필요하므로 메모리 연결(LoopbackTransport)은 사용할 수 없음
+    # 시리얼 포트는 POSIX(Linux, macOS)에서만 사용 가능(Windows에서는 False를 반환)
+    def add(self, drone, portname = "None", transport = None, baudrate = 57600, bytesize = serial.EIGHTBITS, parity = serial.PARITY_NONE, stopbits = serial.STOPBITS_ONE):
+
+        if (not isinstance(drone, Drone)) or (baudrate == None):
+            return False
+
+        portname = drone._openTransport(portname, transport, baudrate, bytesize, parity, stopbits)
+
+        if portname == None:
+            return False
+
+        fd = drone._transport.fileno()
+
+        if fd == None:
+            drone._transport.close()
+            drone._printError("Could not connect to CodingRider.")
+            return False
+
+        with self._lock:
+            # 다른 곳에서 닫힌 포트의 번호가 재사용된 경우 이전 등록 정보 삭제
+            if fd in self._selector.get_map():
+                self._selector.unregister(fd)
+
+            self._selector.register(fd, selectors.EVENT_READ, drone)
+            self._dictStatistics[drone] = HubStatistics(self._clock())
+
+        self._wake()
+
+        # 로그 출력
+        drone._printLog("Connected.({0})".format(portname))
+
+        return True
+
+
+
+    # DroneHub에서 제거하고 통신 경로를 닫음
+    def remove(self, drone):
+
+        if drone not in self._dictStatistics:
+            return False
+
+        self._unregister(drone)
+
+        with self._lock:
+            del self._dictStatistics[drone]
+
+        if drone.isOpen():
+            drone._transport.close()
+
+        return True
+
+
+
+    def getDrones(self):
+
+        return list(self._dictStatistics.keys())
+
+
+
+    # drone별 수신량과 CPU 사용 시간(drone을 지정하지 않으면 전체를 dict로 반환)
+    def getStatistics(self, drone = None):
+
+        if drone == None:
+            return dict(self._dictStatistics)
+
+        if drone not in self._dictStatistics:
+            return None
+
+        return self._dictStatistics[drone]
+
+
+
+    # 수신 이벤트를 한 번 처리(timeout 동안 이벤트가 없으면 0 반환, 처리한 프레임 수 반환)
+    def poll(self, timeout = None):
+
+        countFrame = 0
+
+        for key, events in self._selector.select(timeout):
+
+            drone = key.data
+
+            # wake 신호
+            if drone == None:
+                try:
+                    self._socketWakeRead.recv(4096)
+                except OSError:
+                    pass
+
+                continue
+
+            # select() 이후 다른 스레드에서 remove()한 경우
+            statistics = self._dictStatistics.get(drone)
+
+            if statistics == None:
+                continue
+
+            # 이벤트 핸들러에서 발생한 예외로 다른 Drone의 처리나 _run() 스레드가 멈추지 않게 함
+            try:
+                countFrame += self._process(drone, statistics)
+
+            except Exception as e:
+                # 오류 메세지 출력
+                drone._printError("DroneHub / {0}: {1}".format(type(e).__name__, e))
+
+        return countFrame
+
+
+
+    # poll()을 반복 실행하는 스레드 시작
+    def start(self):
+
+        if self._thread != None:
+            return
+
+        self._flagThreadRun = True
+        self._thread = threading.Thread(target=self._run, args=(), daemon=True)
+        self._thread.start()
+
+
+
+    def stop(self):
+
+        if self._thread == None:
+            return
+
+        self._flagThreadRun = False
+        self._wake()
+
+        self._thread.join(timeout=1)
+        self._thread = None
+
+
+
+    def close(self):
+
+        self.stop()
+
+        for drone in self.getDrones():
+            self.remove(drone)
+
+        if self._socketWakeRead != None:
+            self._selector.close()
+            self._socketWakeRead.close()
+            self._socketWakeWrite.close()
+            self._socketWakeRead = None
+
+
+
+    def _run(self):
+
+        while self._flagThreadRun:
+            self.poll(1)
+
+
+
+    # drone 하나의 수신 데이터를 처리하고 처리한 프레임 수를 반환
+    def _process(self, drone, statistics):
+
+        timeCpuStart = time.thread_time()
+
+        try:
+            dataArray = drone._transport.read(drone._sizeReadChunk)
+
+        except Exception:
+            # 읽기 오류(USB 분리, TCP 연결 초기화 등)는 포트가 열려 있다고 나와도 연결이 끊어진 것으로 처리
+            # (등록을 유지하면 fd가 계속 읽기 가능 상태로 남아 poll()이 멈추지 않고 반복됨)
+            self._unregister(drone)
+
+            try:
+                drone._transport.close()
+            except Exception:
+                pass
+
+            # 오류 메세지 출력
+            drone._printError("Connection lost.")
+
+            return 0
+
+        if len(dataArray) == 0:
+            # 상대편에서 연결을 끊었거나 다른 곳에서 포트를 닫은 경우(통계는 remove() 전까지 유지)
+            if not drone.isOpen():
+                self._unregister(drone)
+
+                # 오류 메세지 출력
+                drone._printError("Connection closed.")
+
+            return 0
+
+        drone._bufferQueue.put((self._clock(), dataArray))
+
+        dataTypes = drone.checkBatch()
+
+        statistics.update(len(dataArray), len(dataTypes), time.thread_time() - timeCpuStart)
+
+        return len(dataTypes)
+
+
+
+    def _wake(self):
+
+        try:
+            self._socketWakeWrite.send(b'\x00')
+        except OSError:
+            pass
+
+
+
+    def _unregister(self, drone):
+
+        with self._lock:
+            for key in list(self._selector.get_map().values()):
+                if key.data is drone:
+                    self._selector.unregister(key.fileobj)
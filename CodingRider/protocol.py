@@ -3,6 +3,7 @@ import abc
 import numpy as np
 from struct import *
 from enum import Enum
+from collections import namedtuple
 
 from CodingRider.system import *
 
@@ -10,17 +11,263 @@ from CodingRider.system import *
 # ISerializable Start
 
 
-class ISerializable:
-    
-    __metaclass__ = abc.ABCMeta
+# 메세지 구조
+# fields는 (이름, 형식) 목록이며 형식은 아래 중 하나
+#   (이름, 'h')                 struct 형식 문자
+#   (이름, 'B', Enum 클래스)      Enum 값(flagLazy가 True이면 읽을 때 변환, False이면 parse()에서 변환)
+#   (이름, 클래스)               schema가 있는 다른 클래스
+#   (이름, 클래스, 개수)          schema가 있는 다른 클래스의 목록
+# 형식 문자열은 한 번만 컴파일하고 크기도 형식에서 계산
+# compile()은 필드를 하나씩 풀어 쓴 toArray(), packInto(), parse(), unpackFrom()을 만들어서 클래스에 넣음
+# parseTuple()은 값 튜플, parseRecord()는 이름이 있는 튜플을 반환(Enum 변환과 객체 생성 없음)
+class Schema:
+
+    # flagLazy가 True이면 Enum 필드는 숫자로 저장하고 읽을 때 변환(정의되지 않은 값은 숫자 그대로 사용)
+    # flagLazy가 False이면 parse()에서 변환하고 정의되지 않은 값이 있으면 None 반환
+    def __init__(self, dataType, fields, flagLazy = True):
+        self.dataType       = dataType          # 이 구조를 사용하는 DataType(하나의 DataType에 여러 구조가 있을 수 있음)
+        self.fields         = tuple(fields)
+        self.names          = tuple([field[0] for field in self.fields])
+        self.flagLazy       = flagLazy
+
+        # 인스턴스에 실제로 저장하는 이름(읽을 때 변환하는 Enum 필드는 앞에 _를 붙인 이름에 숫자로 저장)
+        self.slots          = tuple([("_" + field[0]) if self._isLazy(field) else field[0] for field in self.fields])
+
+        self.format         = ''
+        self._listDefault   = []                # (이름, 기본값, 하위 클래스, 개수)
+
+        for field in self.fields:
+            name, type_ = field[0], field[1]
+
+            if isinstance(type_, str):
+                enumType    = field[2] if len(field) > 2 else None
+                default     = 0
+
+                # Enum은 값이 0인 항목, 없으면 첫 번째 항목을 기본값으로 사용
+                if enumType != None:
+                    default = next((member for member in enumType if member.value == 0), list(enumType)[0])
+
+                self.format += type_
+                self._listDefault.append((name, default, None, None))
+
+            else:
+                count       = field[2] if len(field) > 2 else None
+
+                self.format += type_.schema.format * (count if count != None else 1)
+                self._listDefault.append((name, None, type_, count))
+
+        self.struct         = Struct('<' + self.format)
+        self.size           = self.struct.size
+
+        # parseTuple(), parseRecord()에서 사용하는 값 이름(하위 클래스 필드는 이름을 이어 붙임, 예: versionBuild, motor0Rotation)
+        self.namesFlat      = tuple(self._getNamesFlat(''))
+
+
+    def _isLazy(self, field):
+        return self.flagLazy and isinstance(field[1], str) and (len(field) > 2) and (field[2] != None)
+
+
+    def _getNamesFlat(self, prefix):
+        listName = []
+
+        for field in self.fields:
+            name = (prefix + field[0][0].upper() + field[0][1:]) if prefix else field[0]
+
+            if isinstance(field[1], str):
+                listName.append(name)
+            elif len(field) > 2:
+                for index in range(field[2]):
+                    listName.extend(field[1].schema._getNamesFlat(name + str(index)))
+            else:
+                listName.extend(field[1].schema._getNamesFlat(name))
+
+        return listName
+
+
+    def initialize(self, data):
+        for name, default, subClass, count in self._listDefault:
+            if subClass == None:
+                setattr(data, name, default)
+            elif count == None:
+                setattr(data, name, subClass())
+            else:
+                setattr(data, name, [subClass() for i in range(count)])
+
+
+    def compile(self, cls):
+
+        self.record = namedtuple(cls.__name__ + "Record", self.namesFlat)
+
+        namespace   = {'Enum': Enum, 'pack': self.struct.pack, 'pack_into': self.struct.pack_into, 'unpack_from': self.struct.unpack_from, 'new': object.__new__, 'newTuple': tuple.__new__, 'Record': self.record}
+        dictName    = {}                        # namespace에 넣은 Enum 변환 함수와 클래스의 이름
+        listValue   = []                        # toArray()에서 순서대로 기록할 값
+        listLine    = []                        # 읽은 값으로 객체를 만드는 코드
+        count       = {'v': 0, 'o': 0}
+
+        def getName(prefix, key, value):
+            if key not in dictName:
+                dictName[key] = "{0}{1}".format(prefix, len(dictName))
+                namespace[dictName[key]] = value
+            return dictName[key]
+
+        def addObject(schema, path, target):
+            for field in schema.fields:
+                name, type_ = field[0], field[1]
+
+                if isinstance(type_, str):
+                    value = "v{0}".format(count['v'])
+                    count['v'] += 1
+
+                    if schema._isLazy(field):
+                        # 숫자 그대로 저장(읽을 때 변환)
+                        listValue.append("{0}._{1}".format(path, name))
+                        listLine.append("    {0}._{1} = {2}".format(target, name, value))
+
+                    elif (len(field) > 2) and (field[2] != None):
+                        # 정의되지 않은 값은 None으로 변환
+                        convert = getName("e", field[2], {member.value: member for member in field[2]}.get)
+
+                        listValue.append("{0}.{1}.value".format(path, name))
+                        listLine.append("    {0}.{1} = {2}({3})".format(target, name, convert, value))
+                        listLine.append("    if {0}.{1} is None: return None".format(target, name))
+                    else:
+                        listValue.append("{0}.{1}".format(path, name))
+                        listLine.append("    {0}.{1} = {2}".format(target, name, value))
+
+                else:
+                    nameClass   = getName("c", type_, type_)
+                    countItem   = field[2] if len(field) > 2 else None
+                    listTarget  = []
+
+                    for index in range(countItem if countItem != None else 1):
+                        targetSub = "o{0}".format(count['o'])
+                        count['o'] += 1
+                        listTarget.append(targetSub)
+
+                        listLine.append("    {0} = new({1})".format(targetSub, nameClass))
+                        addObject(type_.schema, "{0}.{1}".format(path, name) + ("[{0}]".format(index) if countItem != None else ""), targetSub)
+
+                    if countItem == None:
+                        listLine.append("    {0}.{1} = {2}".format(target, name, listTarget[0]))
+                    else:
+                        listLine.append("    {0}.{1} = [{2}]".format(target, name, ", ".join(listTarget)))
+
+        addObject(self, "self", "data")
+
+        values  = ", ".join(listValue)
+        body    = "    {0}, = unpack_from(dataArray, offset)\n".format(", ".join(["v{0}".format(index) for index in range(count['v'])]))
+        body   += "    data = new(cls)\n"
+        body   += "\n".join(listLine) + "\n"
+        body   += "    return data\n"
+
+        source  = "def toArray(self):\n"
+        source += "    return pack({0})\n".format(values)
+        source += "def packInto(self, buffer, offset = 0):\n"
+        source += "    pack_into(buffer, offset, {0})\n".format(values)
+        source += "def unpackFrom(cls, dataArray, offset = 0):\n"
+        source += body
+        source += "def parse(cls, dataArray):\n"
+        source += "    if len(dataArray) != {0}: return None\n".format(self.size)
+        source += "    offset = 0\n"
+        source += body
+        source += "def parseTuple(cls, dataArray):\n"
+        source += "    if len(dataArray) != {0}: return None\n".format(self.size)
+        source += "    return unpack_from(dataArray, 0)\n"
+        source += "def parseRecord(cls, dataArray):\n"
+        source += "    if len(dataArray) != {0}: return None\n".format(self.size)
+        source += "    return newTuple(Record, unpack_from(dataArray, 0))\n"
+
+        # 읽을 때 변환하는 Enum 필드의 property(값을 지정할 때는 Enum과 숫자 모두 사용 가능)
+        listProperty = [field for field in self.fields if self._isLazy(field)]
+
+        for field in listProperty:
+            convert = getName("e", field[2], {member.value: member for member in field[2]}.get)
+
+            source += "def get_{0}(self):\n".format(field[0])
+            source += "    value = self._{0}\n".format(field[0])
+            source += "    return {0}(value, value)\n".format(convert)
+            source += "def set_{0}(self, value):\n".format(field[0])
+            source += "    self._{0} = value.value if isinstance(value, Enum) else value\n".format(field[0])
+
+        exec(compile(source, "<schema {0}>".format(cls.__name__), "exec"), namespace)
+
+        self.source = source
+
+        for field in listProperty:
+            if field[0] not in cls.__dict__:
+                setattr(cls, field[0], property(namespace["get_" + field[0]], namespace["set_" + field[0]]))
+
+        # 클래스에서 직접 구현한 함수는 그대로 사용
+        for name in ("toArray", "packInto"):
+            if name not in cls.__dict__:
+                setattr(cls, name, namespace[name])
+
+        for name in ("unpackFrom", "parse", "parseTuple", "parseRecord"):
+            if name not in cls.__dict__:
+                setattr(cls, name, classmethod(namespace[name]))
+
+
+
+# DataType별 메세지 클래스 목록(schema에 DataType이 지정된 클래스를 선언 순서대로 등록)
+dictMessage = {}
+
+
+def registerMessage(dataType, cls):
+    dictMessage.setdefault(dataType, [])
+    if cls not in dictMessage[dataType]:
+        dictMessage[dataType].append(cls)
+
+
+
+# 메세지 클래스에 __slots__를 넣어서 인스턴스마다 __dict__를 만들지 않게 함
+# schema가 있으면 필드 이름을 __slots__로 사용
+class SerializableMeta(type):
+
+    def __new__(mcs, name, bases, namespace, **kwargs):
+        schema = namespace.get('schema')
+
+        if ('__slots__' not in namespace) and (schema != None):
+            namespace['__slots__'] = schema.slots
+
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+
+
+# 수신 데이터 변환 방식
+class DecodeMode(Enum):
+
+    Object      = 0     # 메세지 객체(parse)
+    Tuple       = 1     # 값 튜플(parseTuple, Enum 변환 없음)
+    Record      = 2     # 이름이 있는 튜플(parseRecord, Enum 변환 없음)
+
+
+
+# 직렬화 클래스
+# 클래스에 schema가 있으면 toArray(), packInto(), parse(), unpackFrom(), parseTuple(), parseRecord()를 schema에서 만들어서 사용
+class ISerializable(metaclass = SerializableMeta):
+
+    __slots__   = ()
+
+    schema      = None
+
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        if ('schema' in cls.__dict__) and (cls.schema != None):
+            cls.schema.compile(cls)
+
+            if cls.schema.dataType != None:
+                registerMessage(cls.schema.dataType, cls)
+
+
+    def __init__(self):
+        self.schema.initialize(self)
 
-    @abc.abstractmethod
-    def getSize(self):
-        pass
 
-    @abc.abstractmethod
-    def ToArray(self):
-        pass
+    @classmethod
+    def getSize(cls):
+        return cls.schema.size
 
 
 # ISerializable End
@@ -79,6 +326,10 @@ class DataType(Enum):
     EndOfType                   = 0xDC
 
 
+
+tableDataType = makeEnumTable(DataType)
+
+
 # DataType End
 
 
@@ -121,2298 +372,1134 @@ class CommandType(Enum):
 # Header Start
 
 
+# Receiver에서 값을 확인하고 Enum으로 넣으므로 읽을 때 변환하지 않음
 class Header(ISerializable):
 
-    def __init__(self):
-        self.dataType    = DataType.None_
-        self.length      = 0
-        self.from_       = DeviceType.None_
-        self.to_         = DeviceType.None_
+    schema = Schema(None, (
+        ('dataType',  'B', DataType),
+        ('length',    'B'),
+        ('from_',     'B', DeviceType),
+        ('to_',       'B', DeviceType),
+    ), False)
 
 
-    @classmethod
-    def getSize(cls):
-        return 4
+# Header End
 
 
-    def toArray(self):
-        return pack('<BBBB', self.dataType.value, self.length, self.from_.value, self.to_.value)
 
+# Common Start
 
-    @classmethod
-    def parse(cls, dataArray):
-        header = Header()
 
-        if len(dataArray) != cls.getSize():
-            return None
+class Ping(ISerializable):
 
-        header.dataType, header.length, header.from_, header.to_ = unpack('<BBBB', dataArray)
+    schema = Schema(DataType.Ping, (
+        ('systemTime',  'Q'),
+    ))
 
-        header.dataType = DataType(header.dataType)
-        header.from_ = DeviceType(header.from_)
-        header.to_ = DeviceType(header.to_)
 
-        return header
 
+class Ack(ISerializable):
 
-# Header End
+    schema = Schema(DataType.Ack, (
+        ('systemTime',  'Q'),
+        ('dataType',    'B', DataType),
+        ('crc16',       'H'),
+    ))
 
 
 
-# Common Start
+class Error(ISerializable):
 
+    schema = Schema(DataType.Error, (
+        ('systemTime',           'Q'),
+        ('errorFlagsForSensor',  'I'),
+        ('errorFlagsForState',   'I'),
+    ))
 
-class Ping(ISerializable):
 
-    def __init__(self):
-        self.systemTime     = 0
 
+class Request(ISerializable):
 
-    @classmethod
-    def getSize(cls):
-        return 8
+    schema = Schema(DataType.Request, (
+        ('dataType',  'B', DataType),
+    ))
 
 
-    def toArray(self):
-        return pack('<Q', self.systemTime)
 
+class RequestOption(ISerializable):
 
-    @classmethod
-    def parse(cls, dataArray):
-        data = Ping()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-        
-        data.systemTime, = unpack('<Q', dataArray)
-        return data
+    schema = Schema(DataType.Request, (
+        ('dataType',  'B', DataType),
+        ('option',    'I'),
+    ))
 
 
 
-class Ack(ISerializable):
+class Message():
 
     def __init__(self):
-        self.systemTime     = 0
-        self.dataType       = DataType.None_
-        self.crc16          = 0
+        self.message    = ""
 
 
-    @classmethod
-    def getSize(cls):
-        return 11
+    def getSize(self):
+        return len(self.message)
 
 
     def toArray(self):
-        return pack('<QBH', self.systemTime, self.dataType.value, self.crc16)
+        dataArray = bytearray()
+        dataArray.extend(self.message.encode('ascii', 'ignore'))
+        return dataArray
 
 
     @classmethod
     def parse(cls, dataArray):
-        data = Ack()
-        
-        if len(dataArray) != cls.getSize():
-            return None
+        data = Message()
         
-        data.systemTime, data.dataType, data.crc16 = unpack('<QBH', dataArray)
-        data.dataType = DataType(data.dataType)
+        if len(dataArray) == 0:
+            return ""
 
+        data.message = bytes(dataArray).decode()
+        
         return data
 
 
 
-class Error(ISerializable):
-
-    def __init__(self):
-        self.systemTime             = 0
-        self.errorFlagsForSensor    = 0
-        self.errorFlagsForState     = 0
-
-
-    @classmethod
-    def getSize(cls):
-        return 16
+class SystemInformation(ISerializable):
 
+    schema = Schema(None, (
+        ('crc32bootloader',   'I'),
+        ('crc32application',  'I'),
+    ))
 
-    def toArray(self):
-        return pack('<QII', self.systemTime, self.errorFlagsForSensor, self.errorFlagsForState)
 
 
-    @classmethod
-    def parse(cls, dataArray):
-        data = Error()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-        
-        data.systemTime, data.errorFlagsForSensor, data.errorFlagsForState = unpack('<QII', dataArray)
+class Version(ISerializable):
 
-        return data
+    schema = Schema(None, (
+        ('build',   'H'),
+        ('minor',   'B'),
+        ('major',   'B'),
+    ))
 
 
+    # build, minor, major을 하나의 UInt32로 묶은 것(버젼 비교 시 사용)
+    @property
+    def v(self):
+        return self.build | (self.minor << 16) | (self.major << 24)
 
-class Request(ISerializable):
 
-    def __init__(self):
-        self.dataType    = DataType.None_
 
+class Information(ISerializable):
 
-    @classmethod
-    def getSize(cls):
-        return 1
+    schema = Schema(DataType.Information, (
+        ('modeUpdate',   'B', ModeUpdate),
+        ('modelNumber',  'I', ModelNumber),
+        ('version',      Version),
+        ('year',         'H'),
+        ('month',        'B'),
+        ('day',          'B'),
+    ))
 
 
-    def toArray(self):
-        return pack('<B', self.dataType.value)
 
+class UpdateLocation(ISerializable):
 
-    @classmethod
-    def parse(cls, dataArray):
-        data = Request()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-        
-        data.dataType, = unpack('<B', dataArray)
-        data.dataType = DataType(data.dataType)
+    schema = Schema(None, (
+        ('indexBlockNext',  'H'),
+    ))
 
-        return data
 
 
+class Address(ISerializable):
 
-class RequestOption(ISerializable):
+    __slots__ = ('address',)
 
     def __init__(self):
-        self.dataType   = DataType.None_
-        self.option     = 0
+        self.address    = bytearray()
 
 
     @classmethod
     def getSize(cls):
-        return 5
+        return 16
 
 
     def toArray(self):
-        return pack('<BI', self.dataType.value, self.option)
+        return self.address
 
 
     @classmethod
     def parse(cls, dataArray):
-        data = RequestOption()
+        data = Address()
         
         if len(dataArray) != cls.getSize():
             return None
         
-        data.dataType, data.option = unpack('<BI', dataArray)
-        data.dataType = DataType(data.dataType)
-
+        data.address = bytearray(dataArray[0:16])
         return data
 
 
 
-class Message():
-
-    def __init__(self):
-        self.message    = ""
-
-
-    def getSize(self):
-        return len(self.message)
-
-
-    def toArray(self):
-        dataArray = bytearray()
-        dataArray.extend(self.message.encode('ascii', 'ignore'))
-        return dataArray
-
-
-    @classmethod
-    def parse(cls, dataArray):
-        data = Message()
-        
-        if len(dataArray) == 0:
-            return ""
-
-        data.message = dataArray[0:len(dataArray)].decode()
-        
-        return data
-
-
+class Pairing(ISerializable):
 
-class SystemInformation(ISerializable):
+    __slots__ = ('address0', 'address1', 'address2', 'address3', 'address4', 'channel0')
 
     def __init__(self):
-        self.crc32bootloader    = 0
-        self.crc32application   = 0
+        self.address0       = 0
+        self.address1       = 0
+        self.address2       = 0
+        self.address3       = 0
+        self.address4       = 0
+        self.channel0       = 0
 
 
     @classmethod
     def getSize(cls):
-        return 8
+        return 11
 
 
     def toArray(self):
-        return pack('<II', self.crc32bootloader, self.crc32application)
+        return pack('<BBBBBB', self.address0, self.address1, self.address2, self.address3, self.address4, self.channel0)
 
 
     @classmethod
     def parse(cls, dataArray):
-        data = SystemInformation()
+        data = Pairing()
         
         if len(dataArray) != cls.getSize():
             return None
         
-        data.crc32bootloader, data.crc32application = unpack('<II', dataArray)
-
+        data.address0, data.address1, data.address2, data.address3, data.address4, data.channel0 = unpack('<BBBBBB', dataArray)
         return data
 
 
+class ResponseRate(ISerializable):
 
-class Version(ISerializable):
-
-    def __init__(self):
-        self.build          = 0
-        self.minor          = 0
-        self.major          = 0
-
-        self.v              = 0         # build, minor, major을 하나의 UInt32로 묶은 것(버젼 비교 시 사용)
-
-
-    @classmethod
-    def getSize(cls):
-        return 4
-
-
-    def toArray(self):
-        return pack('<HBB', self.build, self.minor, self.major)
-
-
-    @classmethod
-    def parse(cls, dataArray):
-        data = Version()
-        
-        if len(dataArray) != cls.getSize():
-            return None
+    schema = Schema(DataType.ResponseRate, (
+        ('responseRate',  'B'),
+    ))
 
-        data.v, = unpack('<I', dataArray)
 
-        data.build, data.minor, data.major = unpack('<HBB', dataArray)
 
-        return data
+class Rssi(ISerializable):
 
+    schema = Schema(None, (
+        ('rssi',  'b'),
+    ))
 
 
-class Information(ISerializable):
 
-    def __init__(self):
-        self.modeUpdate     = ModeUpdate.None_
+class Command(ISerializable):
 
-        self.modelNumber    = ModelNumber.None_
-        self.version        = Version()
+    schema = Schema(DataType.Command, (
+        ('commandType',  'B', CommandType),
+        ('option',       'B'),
+    ))
 
-        self.year           = 0
-        self.month          = 0
-        self.day            = 0
 
+# Common End
 
-    @classmethod
-    def getSize(cls):
-        return 13
 
+# Control Start
 
-    def toArray(self):
-        dataArray = bytearray()
-        dataArray.extend(pack('<B', self.modeUpdate.value))
-        dataArray.extend(pack('<I', self.modelNumber.value))
-        dataArray.extend(self.version.toArray())
-        dataArray.extend(pack('<H', self.year))
-        dataArray.extend(pack('<B', self.month))
-        dataArray.extend(pack('<B', self.day))
-        return dataArray
 
+class ControlQuad8(ISerializable):
 
-    @classmethod
-    def parse(cls, dataArray):
-        data = Information()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-        
-        indexStart = 0;        indexEnd = 1;                    data.modeUpdate,    = unpack('<B', dataArray[indexStart:indexEnd])
-        indexStart = indexEnd; indexEnd += 4;                   data.modelNumber,   = unpack('<I', dataArray[indexStart:indexEnd])
-        indexStart = indexEnd; indexEnd += Version.getSize();   data.version        = Version.parse(dataArray[indexStart:indexEnd])
-        indexStart = indexEnd; indexEnd += 2;                   data.year,          = unpack('<H', dataArray[indexStart:indexEnd])
-        indexStart = indexEnd; indexEnd += 1;                   data.month,         = unpack('<B', dataArray[indexStart:indexEnd])
-        indexStart = indexEnd; indexEnd += 1;                   data.day,           = unpack('<B', dataArray[indexStart:indexEnd])
+    schema = Schema(DataType.Control, (
+        ('roll',      'b'),
+        ('pitch',     'b'),
+        ('yaw',       'b'),
+        ('throttle',  'b'),
+    ))
 
-        data.modeUpdate     = ModeUpdate(data.modeUpdate)
-        data.modelNumber    = ModelNumber(data.modelNumber)
 
-        return data
 
+class ControlQuad8AndRequestData(ISerializable):
 
+    schema = Schema(DataType.Control, (
+        ('roll',      'b'),
+        ('pitch',     'b'),
+        ('yaw',       'b'),
+        ('throttle',  'b'),
+        ('dataType',  'B', DataType),
+    ))
 
-class UpdateLocation(ISerializable):
 
-    def __init__(self):
-        self.indexBlockNext    = 0
 
+class ControlPosition16(ISerializable):
 
-    @classmethod
-    def getSize(cls):
-        return 2
+    schema = Schema(DataType.Control, (
+        ('positionX',           'h'),
+        ('positionY',           'h'),
+        ('positionZ',           'h'),
+        ('velocity',            'h'),
+        ('heading',             'h'),
+        ('rotationalVelocity',  'h'),
+    ))
 
 
-    def toArray(self):
-        return pack('<H', self.indexBlockNext)
 
+class ControlPosition(ISerializable):
 
-    @classmethod
-    def parse(cls, dataArray):
-        data = UpdateLocation()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-        
-        data.indexBlockNext, = unpack('<H', dataArray)
+    schema = Schema(DataType.Control, (
+        ('positionX',           'f'),
+        ('positionY',           'f'),
+        ('positionZ',           'f'),
+        ('velocity',            'f'),
+        ('heading',             'h'),
+        ('rotationalVelocity',  'h'),
+    ))
 
-        return data
 
+# Control End
 
 
-class Address(ISerializable):
 
-    def __init__(self):
-        self.address    = bytearray()
+# Light Start
 
 
-    @classmethod
-    def getSize(cls):
-        return 16
-
-
-    def toArray(self):
-        return self.address
-
-
-    @classmethod
-    def parse(cls, dataArray):
-        data = Address()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-        
-        data.address = dataArray[0:16]
-        return data
-
-
-
-class Pairing(ISerializable):
-
-    def __init__(self):
-        self.address0       = 0
-        self.address1       = 0
-        self.address2       = 0
-        self.address3       = 0
-        self.address4       = 0
-        self.channel0       = 0
-
-
-    @classmethod
-    def getSize(cls):
-        return 11
-
-
-    def toArray(self):
-        return pack('<BBBBBB', self.address0, self.address1, self.address2, self.address3, self.address4, self.channel0)
-
-
-    @classmethod
-    def parse(cls, dataArray):
-        data = Pairing()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-        
-        data.address0, data.address1, data.address2, data.address3, data.address4, data.channel0 = unpack('<BBBBBB', dataArray)
-        return data
-
-
-class ResponseRate(ISerializable) :
-    
-    def __init__(self):
-        self.responseRate = 0
-        
-    @classmethod
-    def getSize(cls):
-        return 1
-
-
-    def toArray(self):
-        return pack('<B', self.responseRate)
-
-
-    @classmethod
-    def parse(cls, dataArray):
-        data = ResponseRate()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-        
-        data.responseRate, = unpack('<B', dataArray)
-
-        return data
-
-
-
-class Rssi(ISerializable):
-
-    def __init__(self):
-        self.rssi       = 0
-
-
-    @classmethod
-    def getSize(cls):
-        return 1
-
-
-    def toArray(self):
-        return pack('<b', self.rssi)
-
-
-    @classmethod
-    def parse(cls, dataArray):
-        data = Rssi()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-        
-        data.rssi, = unpack('<b', dataArray)
-
-        return data
-
-
-
-class Command(ISerializable):
-
-    def __init__(self):
-        self.commandType    = CommandType.None_
-        self.option         = ModeControlFlight.None_
-
-
-    @classmethod
-    def getSize(cls):
-        return 2
-
-
-    def toArray(self):
-        return pack('<BB', self.commandType.value, self.option)
-
-
-    @classmethod
-    def parse(cls, dataArray):
-        data = Command()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-        
-        data.commandType, data.option = unpack('<BB', dataArray)
-        data.commandType = CommandType(data.commandType)
-
-        return data
-
-
-
-class CommandLightEvent(ISerializable):
-
-    def __init__(self):
-        self.command    = Command()
-        self.event      = LightEvent()
-
-
-    @classmethod
-    def getSize(cls):
-        return Command.getSize() + LightEvent.getSize()
-
-
-    def toArray(self):
-        dataArray = bytearray()
-        dataArray.extend(self.command.toArray())
-        dataArray.extend(self.event.toArray())
-        return dataArray
-
-
-    @classmethod
-    def parse(cls, dataArray):
-        data = CommandLightEvent()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-        
-        indexStart = 0;        indexEnd = Command.getSize();         data.command    = Command.parse(dataArray[indexStart:indexEnd])
-        indexStart = indexEnd; indexEnd += LightEvent.getSize();     data.event      = LightEvent.parse(dataArray[indexStart:indexEnd])
-        
-        return data
-        
-
-
-class CommandLightEventColor(ISerializable):
-
-    def __init__(self):
-        self.command    = Command()
-        self.event      = LightEvent()
-        self.color      = Color()
-
-
-    @classmethod
-    def getSize(cls):
-        return Command.getSize() + LightEvent.getSize() + Color.getSize()
-
-
-    def toArray(self):
-        dataArray = bytearray()
-        dataArray.extend(self.command.toArray())
-        dataArray.extend(self.event.toArray())
-        dataArray.extend(self.color.toArray())
-        return dataArray
-
-
-    @classmethod
-    def parse(cls, dataArray):
-        data = CommandLightEventColor()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-
-        indexStart = 0;        indexEnd = Command.getSize();       data.command    = Command.parse(dataArray[indexStart:indexEnd])
-        indexStart = indexEnd; indexEnd += LightEvent.getSize();   data.event      = LightEvent.parse(dataArray[indexStart:indexEnd])
-        indexStart = indexEnd; indexEnd += Color.getSize();        data.color      = Color.parse(dataArray[indexStart:indexEnd])
-        
-        return data
-        
-
-
-class CommandLightEventColors(ISerializable):
-
-    def __init__(self):
-        self.command    = Command()
-        self.event      = LightEvent()
-        self.colors     = Colors.Black
-
-
-    @classmethod
-    def getSize(cls):
-        return Command.getSize() + LightEvent.getSize() + 1
-
-
-    def toArray(self):
-        dataArray = bytearray()
-        dataArray.extend(self.command.toArray())
-        dataArray.extend(self.event.toArray())
-        dataArray.extend(pack('<B', self.colors.value))
-        return dataArray
-
-
-    @classmethod
-    def parse(cls, dataArray):
-        data = CommandLightEventColors()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-        
-        indexStart = 0;        indexEnd = Command.getSize();       data.command    = Command.parse(dataArray[indexStart:indexEnd])
-        indexStart = indexEnd; indexEnd += LightEvent.getSize();   data.event      = LightEvent.parse(dataArray[indexStart:indexEnd])
-        indexStart = indexEnd; indexEnd += 1;                      data.colors    = unpack('<B', dataArray[indexStart:indexEnd])
-
-        data.colors     = Colors(data.colors)
-
-        return data
-
-
-# Common End
-
-
-# Control Start
-
-
-class ControlQuad8(ISerializable):
-
-    def __init__(self):
-        self.roll       = 0
-        self.pitch      = 0
-        self.yaw        = 0
-        self.throttle   = 0
-
-
-    @classmethod
-    def getSize(cls):
-        return 4
-
-
-    def toArray(self):
-        return pack('<bbbb', self.roll, self.pitch, self.yaw, self.throttle)
-
-
-    @classmethod
-    def parse(cls, dataArray):
-        data = ControlQuad8()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-        
-        data.roll, data.pitch, data.yaw, data.throttle = unpack('<bbbb', dataArray)
-        return data
-
-
-
-class ControlQuad8AndRequestData(ISerializable):
-
-    def __init__(self):
-        self.roll       = 0
-        self.pitch      = 0
-        self.yaw        = 0
-        self.throttle   = 0
-        self.dataType   = DataType.None_
-
-
-    @classmethod
-    def getSize(cls):
-        return 5
-
-
-    def toArray(self):
-        return pack('<bbbbb', self.roll, self.pitch, self.yaw, self.throttle, self.dataType)
-
-
-    @classmethod
-    def parse(cls, dataArray):
-        data = ControlQuad8AndRequestData()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-        
-        data.roll, data.pitch, data.yaw, data.throttle, data.dataType = unpack('<bbbbb', dataArray)
-        
-        data.dataType = DataType(data.dataType)
-        
-        return data
-
-
-
-class ControlPosition16(ISerializable):
-
-    def __init__(self):
-        self.positionX          = 0
-        self.positionY          = 0
-        self.positionZ          = 0
-
-        self.velocity           = 0
-        
-        self.heading            = 0
-        self.rotationalVelocity = 0
-
-
-    @classmethod
-    def getSize(cls):
-        return 12
-
-
-    def toArray(self):
-        return pack('<hhhhhh', self.positionX, self.positionY, self.positionZ, self.velocity, self.heading, self.rotationalVelocity)
-
-
-    @classmethod
-    def parse(cls, dataArray):
-        data = ControlPosition16()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-        
-        data.positionX, data.positionY, data.positionZ, data.velocity, data.heading, data.rotationalVelocity = unpack('<hhhhhh', dataArray)
-        return data
-
-
-
-class ControlPosition(ISerializable):
-
-    def __init__(self):
-        self.positionX          = 0
-        self.positionY          = 0
-        self.positionZ          = 0
-
-        self.velocity           = 0
-
-        self.heading            = 0
-        self.rotationalVelocity = 0
-
-
-    @classmethod
-    def getSize(cls):
-        return 20
-
-
-    def toArray(self):
-        return pack('<ffffhh', self.positionX, self.positionY, self.positionZ, self.velocity, self.heading, self.rotationalVelocity)
-
-
-    @classmethod
-    def parse(cls, dataArray):
-        data = ControlPosition()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-        
-        data.positionX, data.positionY, data.positionZ, data.velocity, data.heading, data.rotationalVelocity = unpack('<ffffhh', dataArray)
-        return data
-
-
-# Control End
-
-
-
-# Light Start
-
-
-class LightModeDrone(Enum):
-    
-    None_                   = 0x00
-    
-    # Team (Forward, Rear를 동시에 제어)
-    TeamRgbNone				= 0x10
-    TeamRgbManual			= 0x11		# 수동 제어
-    TeamRgbHold				= 0x12		# 지정한 색상을 계속 켬
-    TeamRgbFlicker			= 0x13		# 깜빡임			
-    TeamRgbFlickerDouble	= 0x14		# 깜빡임(두 번 깜빡이고 깜빡인 시간만큼 꺼짐)			
-    TeamRgbDimming			= 0x15		# 밝기 제어하여 천천히 깜빡임
-    TeamRgbSunrise			= 0x16		# 꺼진 상태에서 점점 밝아짐
-    TeamRgbSunset			= 0x17		# 켜진 상태에서 점점 어두워짐
-    TeamRgbRainbow			= 0x18		# 무지개색
-    TeamRgbRainbow2			= 0x19		# 무지개색
-    TeamRgbRedBlue			= 0x1A		# Red-Blue
-    
-    TeamFlowForward			= 0x1E		# 앞으로 흐름 
-    TeamWarning				= 0x1F		# 경고
-    
-    # Body
-    BodyNone				= 0x20		
-    BodyManual				= 0x21		# 수동 제어
-    BodyHold				= 0x22		# 지정한 색상을 계속 켬
-    BodyFlicker				= 0x23		# 깜빡임			
-    BodyFlickerDouble		= 0x24		# 깜빡임(두 번 깜빡이고 깜빡인 시간만큼 꺼짐)			
-    BodyDimming				= 0x25		# 밝기 제어하여 천천히 깜빡임
-    BodySunrise				= 0x26		# 꺼진 상태에서 점점 밝아짐
-    BodySunset				= 0x27		# 켜진 상태에서 점점 어두워짐
-    BodyRainbow				= 0x28		# 무지개색
-    BodyRainbow2			= 0x29		# 무지개색
-    BodyRedBlue				= 0x2A		# Red-Blue
-    BodyCard				= 0x2B		# 카드 색상 표시(이벤트용)
-    BodyWarning				= 0x2F		# 경고
-    
-    # Link
-    LinkNone				= 0x30		
-    LinkManual				= 0x31		# 수동 제어
-    LinkHold				= 0x32		# 지정한 색상을 계속 켬
-    LinkFlicker				= 0x33		# 깜빡임			
-    LinkFlickerDouble		= 0x34		# 깜빡임(두 번 깜빡이고 깜빡인 시간만큼 꺼짐)			
-    LinkDimming				= 0x35		# 밝기 제어하여 천천히 깜빡임
-    LinkSunrise				= 0x36		# 꺼진 상태에서 점점 밝아짐
-    LinkSunset				= 0x37		# 켜진 상태에서 점점 어두워짐
-    
-    EndOfType               = 0x60
-
-
-
-class LightFlagsDrone(Enum):
-    
-    None_			= 0x0000
-    
-    BodyRed			= 0x0001
-    BodyGreen		= 0x0002
-    BodyBlue		= 0x0004
-    
-    TeamRed			= 0x0008
-    TeamBlue		= 0x0010
-    
-    Link			= 0x0080
-
-
-
-class LightModeController(Enum):
-    
-    # Team
-    TeamNone						= 0x10
-    TeamManual						= 0x11		# 수동 제어
-    TeamHold						= 0x12		# 지정한 색상을 계속 켬
-    TeamFlicker						= 0x13		# 깜빡임			
-    TeamFlickerDouble				= 0x14		# 깜빡임(두 번 깜빡이고 깜빡인 시간만큼 꺼짐)			
-    TeamDimming						= 0x15		# 밝기 제어하여 천천히 깜빡임
-    TeamSunrise						= 0x16		# 꺼진 상태에서 점점 밝아짐
-    TeamSunset						= 0x17		# 켜진 상태에서 점점 어두워짐
-    TeamRedBlue						= 0x1A		# Red-Blue
-    
-    # Array 6
-    Array6None						= 0x30
-    Array6Manual					= 0x31		# 수동 제어
-    Array6Hold						= 0x32		# [전체] 지정한 색상을 계속 켬
-    Array6Flicker					= 0x33		# [전체] 깜빡임			
-    Array6FlickerDouble				= 0x34		# [전체] 깜빡임(두 번 깜빡이고 깜빡인 시간만큼 꺼짐)		
-    Array6Dimming					= 0x35		# [전체] 밝기 제어하여 천천히 깜빡임
-    
-    # Array 6 Value
-    Array6ValueNone					= 0x40		# [개별] 0 ~ 255 사이의 값 표시
-    Array6ValueHold					= 0x42		# [개별] 0 ~ 255 사이의 값 표시
-    Array6ValueFlicker				= 0x43		# [개별] 0 ~ 255 사이의 값 표시
-    Array6ValueFlickerDouble		= 0x44		# [개별] 0 ~ 255 사이의 값 표시
-    Array6ValueDimming				= 0x45		# [개별] 0 ~ 255 사이의 값 표시
-    
-    # Array 6 Function
-    Array6FunctionNone				= 0x50
-    Array6Pendulum					= 0x51
-    Array6FlowLeft					= 0x52		# [개별] 왼쪽으로 흐름
-    Array6FlowRight					= 0x53		# [개별] 오른쪽으로 흐름
-    
-    EndOfType                       = 0x60
-
-
-
-class LightFlagsController(Enum):
-    
-    None_               = 0x0000
-
-    TeamRed		        = 0x0001
-    TeamBlue	        = 0x0002
-            
-    E0			        = 0x0004
-    E1			        = 0x0008
-    E2			        = 0x0010
-    E3			        = 0x0020
-    E4			        = 0x0040
-    E5			        = 0x0080
-
-
-
-class Color(ISerializable):
-
-    def __init__(self):
-        self.r      = 0
-        self.g      = 0
-        self.b      = 0
-
-
-    @classmethod
-    def getSize(cls):
-        return 3
-
-
-    def toArray(self):
-        return pack('<BBB', self.r, self.g, self.b)
-
-
-    @classmethod
-    def parse(cls, dataArray):
-        data = Color()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-        
-        data.r, data.g, data.b = unpack('<BBB', dataArray)
-        return data
-
-
-
-class Colors(Enum):
-
-    AliceBlue              = 0
-    AntiqueWhite           = 1
-    Aqua                   = 2
-    Aquamarine             = 3
-    Azure                  = 4
-    Beige                  = 5
-    Bisque                 = 6
-    Black                  = 7
-    BlanchedAlmond         = 8
-    Blue                   = 9
-    BlueViolet             = 10
-    Brown                  = 11
-    BurlyWood              = 12
-    CadetBlue              = 13
-    Chartreuse             = 14
-    Chocolate              = 15
-    Coral                  = 16
-    CornflowerBlue         = 17
-    Cornsilk               = 18
-    Crimson                = 19
-    Cyan                   = 20
-    DarkBlue               = 21
-    DarkCyan               = 22
-    DarkGoldenRod          = 23
-    DarkGray               = 24
-    DarkGreen              = 25
-    DarkKhaki              = 26
-    DarkMagenta            = 27
-    DarkOliveGreen         = 28
-    DarkOrange             = 29
-    DarkOrchid             = 30
-    DarkRed                = 31
-    DarkSalmon             = 32
-    DarkSeaGreen           = 33
-    DarkSlateBlue          = 34
-    DarkSlateGray          = 35
-    DarkTurquoise          = 36
-    DarkViolet             = 37
-    DeepPink               = 38
-    DeepSkyBlue            = 39
-    DimGray                = 40
-    DodgerBlue             = 41
-    FireBrick              = 42
-    FloralWhite            = 43
-    ForestGreen            = 44
-    Fuchsia                = 45
-    Gainsboro              = 46
-    GhostWhite             = 47
-    Gold                   = 48
-    GoldenRod              = 49
-    Gray                   = 50
-    Green                  = 51
-    GreenYellow            = 52
-    HoneyDew               = 53
-    HotPink                = 54
-    IndianRed              = 55
-    Indigo                 = 56
-    Ivory                  = 57
-    Khaki                  = 58
-    Lavender               = 59
-    LavenderBlush          = 60
-    LawnGreen              = 61
-    LemonChiffon           = 62
-    LightBlue              = 63
-    LightCoral             = 64
-    LightCyan              = 65
-    LightGoldenRodYellow   = 66
-    LightGray              = 67
-    LightGreen             = 68
-    LightPink              = 69
-    LightSalmon            = 70
-    LightSeaGreen          = 71
-    LightSkyBlue           = 72
-    LightSlateGray         = 73
-    LightSteelBlue         = 74
-    LightYellow            = 75
-    Lime                   = 76
-    LimeGreen              = 77
-    Linen                  = 78
-    Magenta                = 79
-    Maroon                 = 80
-    MediumAquaMarine       = 81
-    MediumBlue             = 82
-    MediumOrchid           = 83
-    MediumPurple           = 84
-    MediumSeaGreen         = 85
-    MediumSlateBlue        = 86
-    MediumSpringGreen      = 87
-    MediumTurquoise        = 88
-    MediumVioletRed        = 89
-    MidnightBlue           = 90
-    MintCream              = 91
-    MistyRose              = 92
-    Moccasin               = 93
-    NavajoWhite            = 94
-    Navy                   = 95
-    OldLace                = 96
-    Olive                  = 97
-    OliveDrab              = 98
-    Orange                 = 99
-    OrangeRed              = 100
-    Orchid                 = 101
-    PaleGoldenRod          = 102
-    PaleGreen              = 103
-    PaleTurquoise          = 104
-    PaleVioletRed          = 105
-    PapayaWhip             = 106
-    PeachPuff              = 107
-    Peru                   = 108
-    Pink                   = 109
-    Plum                   = 110
-    PowderBlue             = 111
-    Purple                 = 112
-    RebeccaPurple          = 113
-    Red                    = 114
-    RosyBrown              = 115
-    RoyalBlue              = 116
-    SaddleBrown            = 117
-    Salmon                 = 118
-    SandyBrown             = 119
-    SeaGreen               = 120
-    SeaShell               = 121
-    Sienna                 = 122
-    Silver                 = 123
-    SkyBlue                = 124
-    SlateBlue              = 125
-    SlateGray              = 126
-    Snow                   = 127
-    SpringGreen            = 128
-    SteelBlue              = 129
-    Tan                    = 130
-    Teal                   = 131
-    Thistle                = 132
-    Tomato                 = 133
-    Turquoise              = 134
-    Violet                 = 135
-    Wheat                  = 136
-    White                  = 137
-    WhiteSmoke             = 138
-    Yellow                 = 139
-    YellowGreen            = 140
-    
-    EndOfType              = 141
-
-
-
-class LightManual(ISerializable):
-
-    def __init__(self):
-        self.flags          = 0
-        self.brightness     = 0
-
-
-    @classmethod
-    def getSize(cls):
-        return 3
-
-
-    def toArray(self):
-        return pack('<HB', self.flags, self.brightness)
-
-
-    @classmethod
-    def parse(cls, dataArray):
-        data = LightManual()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-        
-        data.flags, data.brightness = unpack('<HB', dataArray)
-        return data
-
-
-
-class LightMode(ISerializable):
-
-    def __init__(self):
-        self.mode        = 0
-        self.interval    = 0
-
-
-    @classmethod
-    def getSize(cls):
-        return 3
-
-
-    def toArray(self):
-        return pack('<BH', self.mode, self.interval)
-
-
-    @classmethod
-    def parse(cls, dataArray):
-        data = LightMode()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-
-        data.mode, data.interval = unpack('<BH', dataArray)
-        return data
-
-
-
-class LightEvent(ISerializable):
-
-    def __init__(self):
-        self.event      = 0
-        self.interval   = 0
-        self.repeat     = 0
-
-
-    @classmethod
-    def getSize(cls):
-        return 4
-
-
-    def toArray(self):
-        return pack('<BHB', self.event, self.interval, self.repeat)
-
-
-    @classmethod
-    def parse(cls, dataArray):
-        data = LightEvent()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-
-        data.event, data.interval, data.repeat = unpack('<BHB', dataArray)
-
-        return data
-
-
-
-class LightModeColor(ISerializable):
-    
-    def __init__(self):
-        self.mode       = LightMode()
-        self.color      = Color()
-
-
-    @classmethod
-    def getSize(cls):
-        return LightMode.getSize() + Color.getSize()
-
-
-    def toArray(self):
-        dataArray = bytearray()
-        dataArray.extend(self.mode.toArray())
-        dataArray.extend(self.color.toArray())
-        return dataArray
-
-
-    @classmethod
-    def parse(cls, dataArray):
-        data = LightModeColor()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-
-        indexStart = 0;        indexEnd = LightMode.getSize();      data.mode       = LightMode.parse(dataArray[indexStart:indexEnd])
-        indexStart = indexEnd; indexEnd += Color.getSize();         data.color      = Color.parse(dataArray[indexStart:indexEnd])
-        return data
-
-
-
-class LightModeColors(ISerializable):
-    
-    def __init__(self):
-        self.mode       = LightMode()
-        self.colors     = Colors.Black
-
-
-    @classmethod
-    def getSize(cls):
-        return LightMode.getSize() + 1
-
-
-    def toArray(self):
-        dataArray = bytearray()
-        dataArray.extend(self.mode.toArray())
-        dataArray.extend(pack('<B', self.colors.value))
-        return dataArray
-
-
-    @classmethod
-    def parse(cls, dataArray):
-        data = LightModeColors()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-
-        indexStart = 0;        indexEnd = LightMode.getSize();      data.mode       = LightMode.parse(dataArray[indexStart:indexEnd])
-        indexStart = indexEnd; indexEnd += 1;                       data.colors,    = unpack('<B', dataArray[indexStart:indexEnd])
-
-        data.colors     = Colors(data.colors)
-
-        return data
-
-
-
-class LightEventColor(ISerializable):
-    
-    def __init__(self):
-        self.event      = LightEvent()
-        self.color      = Color()
-
-
-    @classmethod
-    def getSize(cls):
-        return LightEvent.getSize() + Color.getSize()
-
-
-    def toArray(self):
-        dataArray = bytearray()
-        dataArray.extend(self.event.toArray())
-        dataArray.extend(self.color.toArray())
-        return dataArray
-
-
-    @classmethod
-    def parse(cls, dataArray):
-        data = LightEventColor()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-
-        indexStart = 0;        indexEnd = LightEvent.getSize();     data.event      = LightEvent.parse(dataArray[indexStart:indexEnd])
-        indexStart = indexEnd; indexEnd += Color.getSize();         data.command    = Color.parse(dataArray[indexStart:indexEnd])
-        
-        return data
-
-
-
-class LightEventColors(ISerializable):
-    
-    def __init__(self):
-        self.event      = LightEvent()
-        self.colors     = Colors.Black
-
-
-    @classmethod
-    def getSize(cls):
-        return LightEvent.getSize() + 1
-
-
-    def toArray(self):
-        dataArray = bytearray()
-        dataArray.extend(self.event.toArray())
-        dataArray.extend(pack('<B', self.colors.value))
-        return dataArray
-
-
-    @classmethod
-    def parse(cls, dataArray):
-        data = LightEventColors()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-
-        indexStart = 0;        indexEnd = LightEvent.getSize();     data.event      = LightEvent.parse(dataArray[indexStart:indexEnd])
-        indexStart = indexEnd; indexEnd += 1;                       data.colors,    = unpack('<B', dataArray[indexStart:indexEnd])
-
-        data.colors     = Colors(data.colors)
-
-        return data
-
-
-# Light End
-
-
-# Buzzer Start
-
-
-class BuzzerMode(Enum):
-
-    Stop                = 0    # 정지(Mode에서의 Stop은 통신에서 받았을 때 Buzzer를 끄는 용도로 사용, set으로만 호출)
-
-    MuteInstantly       = 1    # 묵음 즉시 적용
-    MuteContinually     = 2    # 묵음 예약
-
-    ScaleInstantly      = 3    # 음계 즉시 적용
-    ScaleContinually    = 4    # 음계 예약
-
-    HzInstantly         = 5    # 주파수 즉시 적용
-    HzContinually       = 6    # 주파수 예약
-
-    EndOfType           = 7
-
-
-
-class BuzzerScale(Enum):
-
-    C1 = 0x00; CS1 = 0x01; D1 = 0x02; DS1 = 0x03; E1 = 0x04; F1 = 0x05; FS1 = 0x06; G1 = 0x07; GS1 = 0x08; A1 = 0x09; AS1 = 0x0A; B1 = 0x0B
-    C2 = 0x0C; CS2 = 0x0D; D2 = 0x0E; DS2 = 0x0F; E2 = 0x10; F2 = 0x11; FS2 = 0x12; G2 = 0x13; GS2 = 0x14; A2 = 0x15; AS2 = 0x16; B2 = 0x17
-    C3 = 0x18; CS3 = 0x19; D3 = 0x1A; DS3 = 0x1B; E3 = 0x1C; F3 = 0x1D; FS3 = 0x1E; G3 = 0x1F; GS3 = 0x20; A3 = 0x21; AS3 = 0x22; B3 = 0x23
-    C4 = 0x24; CS4 = 0x25; D4 = 0x26; DS4 = 0x27; E4 = 0x28; F4 = 0x29; FS4 = 0x2A; G4 = 0x2B; GS4 = 0x2C; A4 = 0x2D; AS4 = 0x2E; B4 = 0x2F
-
-    C5 = 0x30; CS5 = 0x31; D5 = 0x32; DS5 = 0x33; E5 = 0x34; F5 = 0x35; FS5 = 0x36; G5 = 0x37; GS5 = 0x38; A5 = 0x39; AS5 = 0x3A; B5 = 0x3B
-    C6 = 0x3C; CS6 = 0x3D; D6 = 0x3E; DS6 = 0x3F; E6 = 0x40; F6 = 0x41; FS6 = 0x42; G6 = 0x43; GS6 = 0x44; A6 = 0x45; AS6 = 0x46; B6 = 0x47
-    C7 = 0x48; CS7 = 0x49; D7 = 0x4A; DS7 = 0x4B; E7 = 0x4C; F7 = 0x4D; FS7 = 0x4E; G7 = 0x4F; GS7 = 0x50; A7 = 0x51; AS7 = 0x52; B7 = 0x53
-    C8 = 0x54; CS8 = 0x55; D8 = 0x56; DS8 = 0x57; E8 = 0x58; F8 = 0x59; FS8 = 0x5A; G8 = 0x5B; GS8 = 0x5C; A8 = 0x5D; AS8 = 0x5E; B8 = 0x5F
-
-    EndOfType   = 0x60
-
-    Mute        = 0xEE  # 묵음
-    Fin         = 0xFF  # 악보의 끝
-
-
-
-
-
-class BuzzerMelody(Enum):
-    
-    DoMiSol     = 0x00		# 도미솔
-    SolMiDo     = 0x01		# 솔미도
-    LaLa        = 0x02		# 라라
-    SiRaSiRa    = 0x03		# 시라시라
+class LightModeDrone(Enum):
     
-    Warning1    = 0x04		# 경고 1
-    Warning2    = 0x05		# 경고 2
-    Warning3    = 0x06		# 경고 3
-    Warning4    = 0x07		# 경고 4
+    None_                   = 0x00
     
-    Du          = 0x08		# Trim -
-    DuDu        = 0x09		# Trim - End
-    DiDic       = 0x0A		# Trim Center
-    DiDic2      = 0x0B		# Trim Center 2
-    Di          = 0x0C		# Trim +
-    DiDi        = 0x0D		# Trim + End
+    # Team (Forward, Rear를 동시에 제어)
+    TeamRgbNone				= 0x10
+    TeamRgbManual			= 0x11		# 수동 제어
+    TeamRgbHold				= 0x12		# 지정한 색상을 계속 켬
+    TeamRgbFlicker			= 0x13		# 깜빡임			
+    TeamRgbFlickerDouble	= 0x14		# 깜빡임(두 번 깜빡이고 깜빡인 시간만큼 꺼짐)			
+    TeamRgbDimming			= 0x15		# 밝기 제어하여 천천히 깜빡임
+    TeamRgbSunrise			= 0x16		# 꺼진 상태에서 점점 밝아짐
+    TeamRgbSunset			= 0x17		# 켜진 상태에서 점점 어두워짐
+    TeamRgbRainbow			= 0x18		# 무지개색
+    TeamRgbRainbow2			= 0x19		# 무지개색
+    TeamRgbRedBlue			= 0x1A		# Red-Blue
     
-    BuzzSound1   = 0x0E
-    BuzzSound2   = 0x0F
-    BuzzSound3   = 0x10
-    BuzzSound4   = 0x11
+    TeamFlowForward			= 0x1E		# 앞으로 흐름 
+    TeamWarning				= 0x1F		# 경고
     
-    Button       = 0x12
-    Shot         = 0x13
+    # Body
+    BodyNone				= 0x20		
+    BodyManual				= 0x21		# 수동 제어
+    BodyHold				= 0x22		# 지정한 색상을 계속 켬
+    BodyFlicker				= 0x23		# 깜빡임			
+    BodyFlickerDouble		= 0x24		# 깜빡임(두 번 깜빡이고 깜빡인 시간만큼 꺼짐)			
+    BodyDimming				= 0x25		# 밝기 제어하여 천천히 깜빡임
+    BodySunrise				= 0x26		# 꺼진 상태에서 점점 밝아짐
+    BodySunset				= 0x27		# 켜진 상태에서 점점 어두워짐
+    BodyRainbow				= 0x28		# 무지개색
+    BodyRainbow2			= 0x29		# 무지개색
+    BodyRedBlue				= 0x2A		# Red-Blue
+    BodyCard				= 0x2B		# 카드 색상 표시(이벤트용)
+    BodyWarning				= 0x2F		# 경고
     
-    EndOfType    = 0x14
-
-
-
-
-class Buzzer(ISerializable):
-
-    def __init__(self):
-        self.mode       = BuzzerMode.Stop
-        self.value      = 0
-        self.time       = 0
-
-
-    @classmethod
-    def getSize(cls):
-        return 5
-
-
-    def toArray(self):
-        return pack('<BHH', self.mode.value, self.value, self.time)
-
-
-    @classmethod
-    def parse(cls, dataArray):
-        data = Buzzer()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-        
-        data.mode, data.value, data.time = unpack('<BHH', dataArray)
-
-        data.mode = BuzzerMode(data.mode)
-
-        return data
-
-
-# Buzzer End
-
-
-# Button Start
-
-
-class ButtonFlagController(Enum):
-
-    None_   			= 0x0000
-                
-    # 버튼
-    FrontLeft			= 0x0001
-    FrontRight			= 0x0002
-
-    MidUpLeft			= 0x0004
-    MidUpRight			= 0x0008
-
-    MidUp				= 0x0010
-    MidLeft				= 0x0020
-    MidRight			= 0x0040
-    MidDown				= 0x0080
-
-    BottomLeft			= 0x0100
-    BottomRight			= 0x0200
-
-
-
-class ButtonFlagDrone(Enum):
-
-    None_               = 0x0000
+    # Link
+    LinkNone				= 0x30		
+    LinkManual				= 0x31		# 수동 제어
+    LinkHold				= 0x32		# 지정한 색상을 계속 켬
+    LinkFlicker				= 0x33		# 깜빡임			
+    LinkFlickerDouble		= 0x34		# 깜빡임(두 번 깜빡이고 깜빡인 시간만큼 꺼짐)			
+    LinkDimming				= 0x35		# 밝기 제어하여 천천히 깜빡임
+    LinkSunrise				= 0x36		# 꺼진 상태에서 점점 밝아짐
+    LinkSunset				= 0x37		# 켜진 상태에서 점점 어두워짐
     
-    Reset               = 0x0001
-
+    EndOfType               = 0x60
 
 
-class ButtonEvent(Enum):
 
-    None_               = 0x00
+class LightFlagsDrone(Enum):
     
-    Down                = 0x01  # 누르기 시작
-    Press               = 0x02  # 누르는 중
-    Up                  = 0x03  # 뗌
+    None_			= 0x0000
     
-    EndContinuePress    = 0x04  # 연속 입력 종료
-
-
-
-class Button(ISerializable):
-
-    def __init__(self):
-        self.button     = 0
-        self.event      = ButtonEvent.None_
-
-
-    @classmethod
-    def getSize(cls):
-        return 3
-
-
-    def toArray(self):
-        return pack('<HB', self.button, self.event.value)
-
-
-    @classmethod
-    def parse(cls, dataArray):
-        data = Button()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-        
-        data.button, data.event = unpack('<HB', dataArray)
-
-        data.event = ButtonEvent(data.event)
-        
-        return data
+    BodyRed			= 0x0001
+    BodyGreen		= 0x0002
+    BodyBlue		= 0x0004
+    
+    TeamRed			= 0x0008
+    TeamBlue		= 0x0010
+    
+    Link			= 0x0080
 
 
-# Button End
 
+class LightModeController(Enum):
+    
+    # Team
+    TeamNone						= 0x10
+    TeamManual						= 0x11		# 수동 제어
+    TeamHold						= 0x12		# 지정한 색상을 계속 켬
+    TeamFlicker						= 0x13		# 깜빡임			
+    TeamFlickerDouble				= 0x14		# 깜빡임(두 번 깜빡이고 깜빡인 시간만큼 꺼짐)			
+    TeamDimming						= 0x15		# 밝기 제어하여 천천히 깜빡임
+    TeamSunrise						= 0x16		# 꺼진 상태에서 점점 밝아짐
+    TeamSunset						= 0x17		# 켜진 상태에서 점점 어두워짐
+    TeamRedBlue						= 0x1A		# Red-Blue
+    
+    # Array 6
+    Array6None						= 0x30
+    Array6Manual					= 0x31		# 수동 제어
+    Array6Hold						= 0x32		# [전체] 지정한 색상을 계속 켬
+    Array6Flicker					= 0x33		# [전체] 깜빡임			
+    Array6FlickerDouble				= 0x34		# [전체] 깜빡임(두 번 깜빡이고 깜빡인 시간만큼 꺼짐)		
+    Array6Dimming					= 0x35		# [전체] 밝기 제어하여 천천히 깜빡임
+    
+    # Array 6 Value
+    Array6ValueNone					= 0x40		# [개별] 0 ~ 255 사이의 값 표시
+    Array6ValueHold					= 0x42		# [개별] 0 ~ 255 사이의 값 표시
+    Array6ValueFlicker				= 0x43		# [개별] 0 ~ 255 사이의 값 표시
+    Array6ValueFlickerDouble		= 0x44		# [개별] 0 ~ 255 사이의 값 표시
+    Array6ValueDimming				= 0x45		# [개별] 0 ~ 255 사이의 값 표시
+    
+    # Array 6 Function
+    Array6FunctionNone				= 0x50
+    Array6Pendulum					= 0x51
+    Array6FlowLeft					= 0x52		# [개별] 왼쪽으로 흐름
+    Array6FlowRight					= 0x53		# [개별] 오른쪽으로 흐름
+    
+    EndOfType                       = 0x60
 
 
-# Joystick Start
 
+class LightFlagsController(Enum):
+    
+    None_               = 0x0000
 
-class JoystickDirection(Enum):
+    TeamRed		        = 0x0001
+    TeamBlue	        = 0x0002
+            
+    E0			        = 0x0004
+    E1			        = 0x0008
+    E2			        = 0x0010
+    E3			        = 0x0020
+    E4			        = 0x0040
+    E5			        = 0x0080
 
-    None_   = 0x00      # 정의하지 않은 영역(무시함)
 
-    VT      = 0x10      #   위(세로)
-    VM      = 0x20      # 중앙(세로)
-    VB      = 0x40      # 아래(세로)
 
-    HL      = 0x01      #   왼쪽(가로)
-    HM      = 0x02      #   중앙(가로)
-    HR      = 0x04      # 오른쪽(가로)
+class Color(ISerializable):
 
-    TL = 0x11  
-    TM = 0x12  
-    TR = 0x14
-    ML = 0x21  
-    CN = 0x22  
-    MR = 0x24
-    BL = 0x41  
-    BM = 0x42  
-    BR = 0x44
+    schema = Schema(None, (
+        ('r',  'B'),
+        ('g',  'B'),
+        ('b',  'B'),
+    ))
 
 
 
-class JoystickEvent(Enum):
+class Colors(Enum):
 
-    None_       = 0     # 이벤트 없음
-    
-    In          = 1     # 특정 영역에 진입
-    Stay        = 2     # 특정 영역에서 상태 유지
-    Out         = 3     # 특정 영역에서 벗어남
+    AliceBlue              = 0
+    AntiqueWhite           = 1
+    Aqua                   = 2
+    Aquamarine             = 3
+    Azure                  = 4
+    Beige                  = 5
+    Bisque                 = 6
+    Black                  = 7
+    BlanchedAlmond         = 8
+    Blue                   = 9
+    BlueViolet             = 10
+    Brown                  = 11
+    BurlyWood              = 12
+    CadetBlue              = 13
+    Chartreuse             = 14
+    Chocolate              = 15
+    Coral                  = 16
+    CornflowerBlue         = 17
+    Cornsilk               = 18
+    Crimson                = 19
+    Cyan                   = 20
+    DarkBlue               = 21
+    DarkCyan               = 22
+    DarkGoldenRod          = 23
+    DarkGray               = 24
+    DarkGreen              = 25
+    DarkKhaki              = 26
+    DarkMagenta            = 27
+    DarkOliveGreen         = 28
+    DarkOrange             = 29
+    DarkOrchid             = 30
+    DarkRed                = 31
+    DarkSalmon             = 32
+    DarkSeaGreen           = 33
+    DarkSlateBlue          = 34
+    DarkSlateGray          = 35
+    DarkTurquoise          = 36
+    DarkViolet             = 37
+    DeepPink               = 38
+    DeepSkyBlue            = 39
+    DimGray                = 40
+    DodgerBlue             = 41
+    FireBrick              = 42
+    FloralWhite            = 43
+    ForestGreen            = 44
+    Fuchsia                = 45
+    Gainsboro              = 46
+    GhostWhite             = 47
+    Gold                   = 48
+    GoldenRod              = 49
+    Gray                   = 50
+    Green                  = 51
+    GreenYellow            = 52
+    HoneyDew               = 53
+    HotPink                = 54
+    IndianRed              = 55
+    Indigo                 = 56
+    Ivory                  = 57
+    Khaki                  = 58
+    Lavender               = 59
+    LavenderBlush          = 60
+    LawnGreen              = 61
+    LemonChiffon           = 62
+    LightBlue              = 63
+    LightCoral             = 64
+    LightCyan              = 65
+    LightGoldenRodYellow   = 66
+    LightGray              = 67
+    LightGreen             = 68
+    LightPink              = 69
+    LightSalmon            = 70
+    LightSeaGreen          = 71
+    LightSkyBlue           = 72
+    LightSlateGray         = 73
+    LightSteelBlue         = 74
+    LightYellow            = 75
+    Lime                   = 76
+    LimeGreen              = 77
+    Linen                  = 78
+    Magenta                = 79
+    Maroon                 = 80
+    MediumAquaMarine       = 81
+    MediumBlue             = 82
+    MediumOrchid           = 83
+    MediumPurple           = 84
+    MediumSeaGreen         = 85
+    MediumSlateBlue        = 86
+    MediumSpringGreen      = 87
+    MediumTurquoise        = 88
+    MediumVioletRed        = 89
+    MidnightBlue           = 90
+    MintCream              = 91
+    MistyRose              = 92
+    Moccasin               = 93
+    NavajoWhite            = 94
+    Navy                   = 95
+    OldLace                = 96
+    Olive                  = 97
+    OliveDrab              = 98
+    Orange                 = 99
+    OrangeRed              = 100
+    Orchid                 = 101
+    PaleGoldenRod          = 102
+    PaleGreen              = 103
+    PaleTurquoise          = 104
+    PaleVioletRed          = 105
+    PapayaWhip             = 106
+    PeachPuff              = 107
+    Peru                   = 108
+    Pink                   = 109
+    Plum                   = 110
+    PowderBlue             = 111
+    Purple                 = 112
+    RebeccaPurple          = 113
+    Red                    = 114
+    RosyBrown              = 115
+    RoyalBlue              = 116
+    SaddleBrown            = 117
+    Salmon                 = 118
+    SandyBrown             = 119
+    SeaGreen               = 120
+    SeaShell               = 121
+    Sienna                 = 122
+    Silver                 = 123
+    SkyBlue                = 124
+    SlateBlue              = 125
+    SlateGray              = 126
+    Snow                   = 127
+    SpringGreen            = 128
+    SteelBlue              = 129
+    Tan                    = 130
+    Teal                   = 131
+    Thistle                = 132
+    Tomato                 = 133
+    Turquoise              = 134
+    Violet                 = 135
+    Wheat                  = 136
+    White                  = 137
+    WhiteSmoke             = 138
+    Yellow                 = 139
+    YellowGreen            = 140
     
-    EndOfType   = 4
-
-
-
-class JoystickBlock(ISerializable):
-
-    def __init__(self):
-        self.x          = 0
-        self.y          = 0
-        self.direction  = JoystickDirection.None_
-        self.event      = JoystickEvent.None_
-
-
-    @classmethod
-    def getSize(cls):
-        return 4
-
-
-    def toArray(self):
-        return pack('<bbBB', self.x, self.y, self.direction.value, self.event.value)
-
-
-    @classmethod
-    def parse(cls, dataArray):
-        data = JoystickBlock()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-        
-        data.x, data.y, data.direction, data.event = unpack('<bbBB', dataArray)
-
-        data.direction  = JoystickDirection(data.direction)
-        data.event      = JoystickEvent(data.event)
-
-        return data
-
-
-
-class Joystick(ISerializable):
-
-    def __init__(self):
-        self.left       = JoystickBlock()
-        self.right      = JoystickBlock()
-
-
-    @classmethod
-    def getSize(cls):
-        return JoystickBlock().getSize() * 2
-
-
-    def toArray(self):
-        dataArray = bytearray()
-        dataArray.extend(self.left.toArray())
-        dataArray.extend(self.right.toArray())
-        return dataArray
-
-
-    @classmethod
-    def parse(cls, dataArray):
-        data = Joystick()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-        
-        indexStart = 0;        indexEnd  = JoystickBlock.getSize();     data.left   = JoystickBlock.parse(dataArray[indexStart:indexEnd])
-        indexStart = indexEnd; indexEnd += JoystickBlock.getSize();     data.right  = JoystickBlock.parse(dataArray[indexStart:indexEnd])
-
-        return data
-
+    EndOfType              = 141
 
-# Joystick End
 
 
+class LightManual(ISerializable):
 
-# Sensor Raw Start
+    schema = Schema(DataType.LightManual, (
+        ('flags',       'H'),
+        ('brightness',  'B'),
+    ))
 
 
-class RawMotion(ISerializable):
 
-    def __init__(self):
-        self.accelX     = 0
-        self.accelY     = 0
-        self.accelZ     = 0
-        self.gyroRoll   = 0
-        self.gyroPitch  = 0
-        self.gyroYaw    = 0
+class LightMode(ISerializable):
 
+    schema = Schema(DataType.LightMode, (
+        ('mode',      'B'),
+        ('interval',  'H'),
+    ))
 
-    @classmethod
-    def getSize(cls):
-        return 12
 
 
-    def toArray(self):
-        return pack('<hhhhhh', self.accelX, self.accelY, self.accelZ, self.gyroRoll, self.gyroPitch, self.gyroYaw)
+class LightEvent(ISerializable):
 
+    schema = Schema(DataType.LightEvent, (
+        ('event',     'B'),
+        ('interval',  'H'),
+        ('repeat',    'B'),
+    ))
 
-    @classmethod
-    def parse(cls, dataArray):
-        data = RawMotion()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-        
-        data.accelX, data.accelY, data.accelZ, data.gyroRoll, data.gyroPitch, data.gyroYaw = unpack('<hhhhhh', dataArray)
-        
-        return data
 
 
+class LightModeColor(ISerializable):
 
-# Sensor Raw End
+    schema = Schema(DataType.LightMode, (
+        ('mode',   LightMode),
+        ('color',  Color),
+    ))
 
 
 
-# Information Start
+class LightModeColors(ISerializable):
 
+    schema = Schema(DataType.LightMode, (
+        ('mode',    LightMode),
+        ('colors',  'B', Colors),
+    ))
 
-class State(ISerializable):
 
     def __init__(self):
-        self.modeSystem         = ModeSystem.None_
-        self.modeFlight         = ModeFlight.None_
-        self.modeControlFlight  = ModeControlFlight.None_
-        self.modeMovement       = ModeMovement.None_
-        self.headless           = Headless.None_
-        self.controlSpeed       = 0
-        self.sensorOrientation  = SensorOrientation.None_
-        self.battery            = 0
+        super().__init__()
+        self.colors     = Colors.Black
 
 
-    @classmethod
-    def getSize(cls):
-        return 8
 
+class LightEventColor(ISerializable):
 
-    def toArray(self):
-        return pack('<BBBBBBBB', self.modeSystem.value, self.modeFlight.value, self.modeControlFlight.value, self.modeMovement.value, self.headless.value, self.controlSpeed, self.sensorOrientation.value, self.battery)
+    schema = Schema(DataType.LightEvent, (
+        ('event',  LightEvent),
+        ('color',  Color),
+    ))
 
 
-    @classmethod
-    def parse(cls, dataArray):
-        data = State()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-        
-        data.modeSystem, data.modeFlight, data.modeControlFlight, data.modeMovement, data.headless, data.controlSpeed, data.sensorOrientation, data.battery = unpack('<BBBBBBBB', dataArray)
-
-        data.modeSystem         = ModeSystem(data.modeSystem)
-        data.modeFlight         = ModeFlight(data.modeFlight)
-        data.modeControlFlight  = ModeControlFlight(data.modeControlFlight)
-        data.modeMovement       = ModeMovement(data.modeMovement)
-        data.headless           = Headless(data.headless)
-        data.sensorOrientation  = SensorOrientation(data.sensorOrientation)
-        
-        return data
 
+class LightEventColors(ISerializable):
 
+    schema = Schema(DataType.LightEvent, (
+        ('event',   LightEvent),
+        ('colors',  'B', Colors),
+    ))
 
-class Attitude(ISerializable):
 
     def __init__(self):
-        self.roll       = 0
-        self.pitch      = 0
-        self.yaw        = 0
-
-
-    @classmethod
-    def getSize(cls):
-        return 6
-
-
-    def toArray(self):
-        return pack('<hhh', self.roll, self.pitch, self.yaw)
-
+        super().__init__()
+        self.colors     = Colors.Black
 
-    @classmethod
-    def parse(cls, dataArray):
-        data = Attitude()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-        
-        data.roll, data.pitch, data.yaw = unpack('<hhh', dataArray)
-        
-        return data
-        
 
 
-class Position(ISerializable):
+class CommandLightEvent(ISerializable):
 
-    def __init__(self):
-        self.x      = 0
-        self.y      = 0
-        self.z      = 0
+    schema = Schema(DataType.Command, (
+        ('command',  Command),
+        ('event',    LightEvent),
+    ))
 
 
-    @classmethod
-    def getSize(cls):
-        return 12
 
+class CommandLightEventColor(ISerializable):
 
-    def toArray(self):
-        return pack('<fff', self.x, self.y, self.z)
+    schema = Schema(DataType.Command, (
+        ('command',  Command),
+        ('event',    LightEvent),
+        ('color',    Color),
+    ))
 
 
-    @classmethod
-    def parse(cls, dataArray):
-        data = Position()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-        
-        data.x, data.y, data.z = unpack('<fff', dataArray)
-        
-        return data
 
+class CommandLightEventColors(ISerializable):
 
+    schema = Schema(DataType.Command, (
+        ('command',  Command),
+        ('event',    LightEvent),
+        ('colors',   'B', Colors),
+    ))
 
-class Altitude(ISerializable):
 
     def __init__(self):
-        self.temperature    = 0
-        self.pressure       = 0
-        self.altitude       = 0
-        self.rangeHeight    = 0
-
+        super().__init__()
+        self.colors     = Colors.Black
 
-    @classmethod
-    def getSize(cls):
-        return 16
 
+# Light End
 
-    def toArray(self):
-        return pack('<ffff', self.temperature, self.pressure, self.altitude, self.rangeHeight)
 
+# Buzzer Start
 
-    @classmethod
-    def parse(cls, dataArray):
-        data = Altitude()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-        
-        data.temperature, data.pressure, data.altitude, data.rangeHeight = unpack('<ffff', dataArray)
-        
-        return data
 
+class BuzzerMode(Enum):
 
+    Stop                = 0    # 정지(Mode에서의 Stop은 통신에서 받았을 때 Buzzer를 끄는 용도로 사용, set으로만 호출)
 
-class Motion(ISerializable):
+    MuteInstantly       = 1    # 묵음 즉시 적용
+    MuteContinually     = 2    # 묵음 예약
 
-    def __init__(self):
-        self.accelX     = 0
-        self.accelY     = 0
-        self.accelZ     = 0
-        self.gyroRoll   = 0
-        self.gyroPitch  = 0
-        self.gyroYaw    = 0
-        self.angleRoll  = 0
-        self.anglePitch = 0
-        self.angleYaw   = 0
+    ScaleInstantly      = 3    # 음계 즉시 적용
+    ScaleContinually    = 4    # 음계 예약
 
+    HzInstantly         = 5    # 주파수 즉시 적용
+    HzContinually       = 6    # 주파수 예약
 
-    @classmethod
-    def getSize(cls):
-        return 18
+    EndOfType           = 7
 
 
-    def toArray(self):
-        return pack('<hhhhhhhhh', self.accelX, self.accelY, self.accelZ, self.gyroRoll, self.gyroPitch, self.gyroYaw, self.angleRoll, self.anglePitch, self.angleYaw)
 
+class BuzzerScale(Enum):
 
-    @classmethod
-    def parse(cls, dataArray):
-        data = Motion()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-        
-        data.accelX, data.accelY, data.accelZ, data.gyroRoll, data.gyroPitch, data.gyroYaw, data.angleRoll, data.anglePitch, data.angleYaw = unpack('<hhhhhhhhh', dataArray)
-        
-        return data
+    C1 = 0x00; CS1 = 0x01; D1 = 0x02; DS1 = 0x03; E1 = 0x04; F1 = 0x05; FS1 = 0x06; G1 = 0x07; GS1 = 0x08; A1 = 0x09; AS1 = 0x0A; B1 = 0x0B
+    C2 = 0x0C; CS2 = 0x0D; D2 = 0x0E; DS2 = 0x0F; E2 = 0x10; F2 = 0x11; FS2 = 0x12; G2 = 0x13; GS2 = 0x14; A2 = 0x15; AS2 = 0x16; B2 = 0x17
+    C3 = 0x18; CS3 = 0x19; D3 = 0x1A; DS3 = 0x1B; E3 = 0x1C; F3 = 0x1D; FS3 = 0x1E; G3 = 0x1F; GS3 = 0x20; A3 = 0x21; AS3 = 0x22; B3 = 0x23
+    C4 = 0x24; CS4 = 0x25; D4 = 0x26; DS4 = 0x27; E4 = 0x28; F4 = 0x29; FS4 = 0x2A; G4 = 0x2B; GS4 = 0x2C; A4 = 0x2D; AS4 = 0x2E; B4 = 0x2F
 
+    C5 = 0x30; CS5 = 0x31; D5 = 0x32; DS5 = 0x33; E5 = 0x34; F5 = 0x35; FS5 = 0x36; G5 = 0x37; GS5 = 0x38; A5 = 0x39; AS5 = 0x3A; B5 = 0x3B
+    C6 = 0x3C; CS6 = 0x3D; D6 = 0x3E; DS6 = 0x3F; E6 = 0x40; F6 = 0x41; FS6 = 0x42; G6 = 0x43; GS6 = 0x44; A6 = 0x45; AS6 = 0x46; B6 = 0x47
+    C7 = 0x48; CS7 = 0x49; D7 = 0x4A; DS7 = 0x4B; E7 = 0x4C; F7 = 0x4D; FS7 = 0x4E; G7 = 0x4F; GS7 = 0x50; A7 = 0x51; AS7 = 0x52; B7 = 0x53
+    C8 = 0x54; CS8 = 0x55; D8 = 0x56; DS8 = 0x57; E8 = 0x58; F8 = 0x59; FS8 = 0x5A; G8 = 0x5B; GS8 = 0x5C; A8 = 0x5D; AS8 = 0x5E; B8 = 0x5F
 
+    EndOfType   = 0x60
 
-class Range(ISerializable):
+    Mute        = 0xEE  # 묵음
+    Fin         = 0xFF  # 악보의 끝
 
-    def __init__(self):
-        self.left       = 0
-        self.front      = 0
-        self.right      = 0
-        self.rear       = 0
-        self.top        = 0
-        self.bottom     = 0
 
 
-    @classmethod
-    def getSize(cls):
-        return 12
 
 
-    def toArray(self):
-        return pack('<hhhhhh', self.left, self.front, self.right, self.rear, self.top, self.bottom)
+class BuzzerMelody(Enum):
+    
+    DoMiSol     = 0x00		# 도미솔
+    SolMiDo     = 0x01		# 솔미도
+    LaLa        = 0x02		# 라라
+    SiRaSiRa    = 0x03		# 시라시라
+    
+    Warning1    = 0x04		# 경고 1
+    Warning2    = 0x05		# 경고 2
+    Warning3    = 0x06		# 경고 3
+    Warning4    = 0x07		# 경고 4
+    
+    Du          = 0x08		# Trim -
+    DuDu        = 0x09		# Trim - End
+    DiDic       = 0x0A		# Trim Center
+    DiDic2      = 0x0B		# Trim Center 2
+    Di          = 0x0C		# Trim +
+    DiDi        = 0x0D		# Trim + End
+    
+    BuzzSound1   = 0x0E
+    BuzzSound2   = 0x0F
+    BuzzSound3   = 0x10
+    BuzzSound4   = 0x11
+    
+    Button       = 0x12
+    Shot         = 0x13
+    
+    EndOfType    = 0x14
 
 
-    @classmethod
-    def parse(cls, dataArray):
-        data = Range()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-        
-        data.left, data.front, data.right, data.rear, data.top, data.bottom = unpack('<hhhhhh', dataArray)
-        
-        return data
 
 
+class Buzzer(ISerializable):
 
-class Trim(ISerializable):
+    schema = Schema(DataType.Buzzer, (
+        ('mode',   'B', BuzzerMode),
+        ('value',  'H'),
+        ('time',   'H'),
+    ))
 
-    def __init__(self):
-        self.roll       = 0
-        self.pitch      = 0
-        self.yaw        = 0
-        self.throttle   = 0
 
+# Buzzer End
 
-    @classmethod
-    def getSize(cls):
-        return 8
 
+# Button Start
 
-    def toArray(self):
-        return pack('<hhhh', self.roll, self.pitch, self.yaw, self.throttle)
 
+class ButtonFlagController(Enum):
 
-    @classmethod
-    def parse(cls, dataArray):
-        data = Trim()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-        
-        data.roll, data.pitch, data.yaw, data.throttle = unpack('<hhhh', dataArray)
-        
-        return data
+    None_   			= 0x0000
+                
+    # 버튼
+    FrontLeft			= 0x0001
+    FrontRight			= 0x0002
 
+    MidUpLeft			= 0x0004
+    MidUpRight			= 0x0008
 
-# Information End
+    MidUp				= 0x0010
+    MidLeft				= 0x0020
+    MidRight			= 0x0040
+    MidDown				= 0x0080
 
+    BottomLeft			= 0x0100
+    BottomRight			= 0x0200
 
 
-# Sensor Start
 
+class ButtonFlagDrone(Enum):
 
-class VisionSensor(ISerializable):
+    None_               = 0x0000
     
-    def __init__(self):
-        self.x      = 0
-        self.y      = 0
-        self.z      = 0
+    Reset               = 0x0001
 
 
-    @classmethod
-    def getSize(cls):
-        return 12
 
+class ButtonEvent(Enum):
 
-    def toArray(self):
-        return pack('<fff', self.x, self.y, self.z)
+    None_               = 0x00
+    
+    Down                = 0x01  # 누르기 시작
+    Press               = 0x02  # 누르는 중
+    Up                  = 0x03  # 뗌
+    
+    EndContinuePress    = 0x04  # 연속 입력 종료
 
 
-    @classmethod
-    def parse(cls, dataArray):
-        data = VisionSensor()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-        
-        data.x, data.y, data.z = unpack('<fff', dataArray)
-        
-        return data
 
+class Button(ISerializable):
 
+    schema = Schema(DataType.Button, (
+        ('button',  'H'),
+        ('event',   'B', ButtonEvent),
+    ))
 
-class Count(ISerializable):
 
-    def __init__(self):
-        self.timeFlight     = 0
+# Button End
 
-        self.countTakeOff   = 0
-        self.countLanding   = 0
-        self.countAccident  = 0
 
 
-    @classmethod
-    def getSize(cls):
-        return 14
+# Joystick Start
 
 
-    def toArray(self):
-        return pack('<QHHH', self.timeFlight, self.countTakeOff, self.countLanding, self.countAccident)
+class JoystickDirection(Enum):
 
+    None_   = 0x00      # 정의하지 않은 영역(무시함)
 
-    @classmethod
-    def parse(cls, dataArray):
-        data = Count()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-        
-        data.timeFlight, data.countTakeOff, data.countLanding, data.countAccident = unpack('<QHHH', dataArray)
-        
-        return data
+    VT      = 0x10      #   위(세로)
+    VM      = 0x20      # 중앙(세로)
+    VB      = 0x40      # 아래(세로)
 
+    HL      = 0x01      #   왼쪽(가로)
+    HM      = 0x02      #   중앙(가로)
+    HR      = 0x04      # 오른쪽(가로)
 
+    TL = 0x11  
+    TM = 0x12  
+    TR = 0x14
+    ML = 0x21  
+    CN = 0x22  
+    MR = 0x24
+    BL = 0x41  
+    BM = 0x42  
+    BR = 0x44
 
-class Bias(ISerializable):
-    
-    def __init__(self):
-        self.accelX     = 0
-        self.accelY     = 0
-        self.accelZ     = 0
-        self.gyroRoll   = 0
-        self.gyroPitch  = 0
-        self.gyroYaw    = 0
 
 
-    @classmethod
-    def getSize(cls):
-        return 12
+class JoystickEvent(Enum):
 
+    None_       = 0     # 이벤트 없음
+    
+    In          = 1     # 특정 영역에 진입
+    Stay        = 2     # 특정 영역에서 상태 유지
+    Out         = 3     # 특정 영역에서 벗어남
+    
+    EndOfType   = 4
 
-    def toArray(self):
-        return pack('<hhhhhh', self.accelX, self.accelY, self.accelZ, self.gyroRoll, self.gyroPitch, self.gyroYaw)
 
 
-    @classmethod
-    def parse(cls, dataArray):
-        data = Bias()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-        
-        data.accelX, data.accelY, data.accelZ, data.gyroRoll, data.gyroPitch, data.gyroYaw = unpack('<hhhhhh', dataArray)
-        
-        return data
+class JoystickBlock(ISerializable):
 
+    schema = Schema(None, (
+        ('x',          'b'),
+        ('y',          'b'),
+        ('direction',  'B', JoystickDirection),
+        ('event',      'B', JoystickEvent),
+    ))
 
 
-class Weight(ISerializable):
 
-    def __init__(self):
-        self.weight     = 0
+class Joystick(ISerializable):
 
+    schema = Schema(DataType.Joystick, (
+        ('left',   JoystickBlock),
+        ('right',  JoystickBlock),
+    ))
 
-    @classmethod
-    def getSize(cls):
-        return 4
 
+# Joystick End
 
-    def toArray(self):
-        return pack('<f', self.weight)
 
 
-    @classmethod
-    def parse(cls, dataArray):
-        data = Weight()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-        
-        data.weight, = unpack('<f', dataArray)
-        
-        return data
+# Sensor Raw Start
 
 
+class RawMotion(ISerializable):
 
-class LostConnection(ISerializable):
+    schema = Schema(DataType.RawMotion, (
+        ('accelX',     'h'),
+        ('accelY',     'h'),
+        ('accelZ',     'h'),
+        ('gyroRoll',   'h'),
+        ('gyroPitch',  'h'),
+        ('gyroYaw',    'h'),
+    ))
 
-    def __init__(self):
-        self.timeNeutral    = 0
-        self.timeLanding    = 0
-        self.timeStop       = 0
 
 
-    @classmethod
-    def getSize(cls):
-        return 8
+# Sensor Raw End
 
 
-    def toArray(self):
-        return pack('<HHI', self.timeNeutral, self.timeLanding, self.timeStop)
 
+# Information Start
 
-    @classmethod
-    def parse(cls, dataArray):
-        data = LostConnection()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-        
-        data.timeNeutral, data.timeLanding, data.timeStop = unpack('<HHI', dataArray)
-        
-        return data
 
+class State(ISerializable):
 
-# Sensor End
+    schema = Schema(DataType.State, (
+        ('modeSystem',         'B', ModeSystem),
+        ('modeFlight',         'B', ModeFlight),
+        ('modeControlFlight',  'B', ModeControlFlight),
+        ('modeMovement',       'B', ModeMovement),
+        ('headless',           'B', Headless),
+        ('controlSpeed',       'B'),
+        ('sensorOrientation',  'B', SensorOrientation),
+        ('battery',            'B'),
+    ))
 
 
 
-# Device Start
+class Attitude(ISerializable):
 
+    schema = Schema(None, (
+        ('roll',   'h'),
+        ('pitch',  'h'),
+        ('yaw',    'h'),
+    ))
+        
 
-class MotorBlock(ISerializable):
 
-    def __init__(self):
-        self.rotation   = Rotation.None_
-        self.value      = 0
+class Position(ISerializable):
 
+    schema = Schema(None, (
+        ('x',  'f'),
+        ('y',  'f'),
+        ('z',  'f'),
+    ))
 
-    @classmethod
-    def getSize(cls):
-        return 3
 
 
-    def toArray(self):
-        return pack('<Bh', self.rotation.value, self.value)
+class Altitude(ISerializable):
 
+    schema = Schema(DataType.Altitude, (
+        ('temperature',  'f'),
+        ('pressure',     'f'),
+        ('altitude',     'f'),
+        ('rangeHeight',  'f'),
+    ))
 
-    @classmethod
-    def parse(cls, dataArray):
-        data = MotorBlock()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-        
-        data.rotation, data.value = unpack('<Bh', dataArray)
-        data.rotation = Rotation(data.rotation)
-        
-        return data
 
 
+class Motion(ISerializable):
 
-class Motor(ISerializable):
+    schema = Schema(DataType.Motion, (
+        ('accelX',      'h'),
+        ('accelY',      'h'),
+        ('accelZ',      'h'),
+        ('gyroRoll',    'h'),
+        ('gyroPitch',   'h'),
+        ('gyroYaw',     'h'),
+        ('angleRoll',   'h'),
+        ('anglePitch',  'h'),
+        ('angleYaw',    'h'),
+    ))
 
-    def __init__(self):
-        self.motor      = []
-        self.motor.append(MotorBlock())
-        self.motor.append(MotorBlock())
-        self.motor.append(MotorBlock())
-        self.motor.append(MotorBlock())
 
 
-    @classmethod
-    def getSize(cls):
-        return MotorBlock.getSize() * 4
+class Range(ISerializable):
 
+    schema = Schema(None, (
+        ('left',    'h'),
+        ('front',   'h'),
+        ('right',   'h'),
+        ('rear',    'h'),
+        ('top',     'h'),
+        ('bottom',  'h'),
+    ))
 
-    def toArray(self):
-        dataArray = bytearray()
-        dataArray.extend(self.motor[0].toArray())
-        dataArray.extend(self.motor[1].toArray())
-        dataArray.extend(self.motor[2].toArray())
-        dataArray.extend(self.motor[3].toArray())
-        return dataArray
 
 
-    @classmethod
-    def parse(cls, dataArray):
-        data = Motor()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-        
-        indexStart = 0;        indexEnd  = MotorBlock.getSize();    data.motor[0]   = MotorBlock.parse(dataArray[indexStart:indexEnd])
-        indexStart = indexEnd; indexEnd += MotorBlock.getSize();    data.motor[1]   = MotorBlock.parse(dataArray[indexStart:indexEnd])
-        indexStart = indexEnd; indexEnd += MotorBlock.getSize();    data.motor[2]   = MotorBlock.parse(dataArray[indexStart:indexEnd])
-        indexStart = indexEnd; indexEnd += MotorBlock.getSize();    data.motor[3]   = MotorBlock.parse(dataArray[indexStart:indexEnd])
-        
-        return data
+class Trim(ISerializable):
 
+    schema = Schema(DataType.Trim, (
+        ('roll',      'h'),
+        ('pitch',     'h'),
+        ('yaw',       'h'),
+        ('throttle',  'h'),
+    ))
 
-class MotorBlockV(ISerializable):
 
-    def __init__(self):
-        self.value      = 0
+# Information End
 
 
-    @classmethod
-    def getSize(cls):
-        return 2
 
+# Sensor Start
 
-    def toArray(self):
-        return pack('<h', self.value)
 
+class VisionSensor(ISerializable):
 
-    @classmethod
-    def parse(cls, dataArray):
-        data = MotorBlockV()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-        
-        data.value, = unpack('<h', dataArray)
-        
-        return data
+    schema = Schema(DataType.VisionSensor, (
+        ('x',  'f'),
+        ('y',  'f'),
+        ('z',  'f'),
+    ))
 
 
 
-class MotorV(ISerializable):
+class Count(ISerializable):
 
-    def __init__(self):
-        self.motor      = []
-        self.motor.append(MotorBlockV())
-        self.motor.append(MotorBlockV())
-        self.motor.append(MotorBlockV())
-        self.motor.append(MotorBlockV())
+    schema = Schema(DataType.Count, (
+        ('timeFlight',     'Q'),
+        ('countTakeOff',   'H'),
+        ('countLanding',   'H'),
+        ('countAccident',  'H'),
+    ))
 
 
-    @classmethod
-    def getSize(cls):
-        return MotorBlockV.getSize() * 4
 
+class Bias(ISerializable):
 
-    def toArray(self):
-        dataArray = bytearray()
-        dataArray.extend(self.motor[0].toArray())
-        dataArray.extend(self.motor[1].toArray())
-        dataArray.extend(self.motor[2].toArray())
-        dataArray.extend(self.motor[3].toArray())
-        return dataArray
+    schema = Schema(DataType.Bias, (
+        ('accelX',     'h'),
+        ('accelY',     'h'),
+        ('accelZ',     'h'),
+        ('gyroRoll',   'h'),
+        ('gyroPitch',  'h'),
+        ('gyroYaw',    'h'),
+    ))
 
 
-    @classmethod
-    def parse(cls, dataArray):
-        data = MotorV()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-        
-        indexStart = 0;        indexEnd  = MotorBlockV.getSize();    data.motor[0]   = MotorBlockV.parse(dataArray[indexStart:indexEnd])
-        indexStart = indexEnd; indexEnd += MotorBlockV.getSize();    data.motor[1]   = MotorBlockV.parse(dataArray[indexStart:indexEnd])
-        indexStart = indexEnd; indexEnd += MotorBlockV.getSize();    data.motor[2]   = MotorBlockV.parse(dataArray[indexStart:indexEnd])
-        indexStart = indexEnd; indexEnd += MotorBlockV.getSize();    data.motor[3]   = MotorBlockV.parse(dataArray[indexStart:indexEnd])
-        
-        return data
 
+class Weight(ISerializable):
 
+    schema = Schema(None, (
+        ('weight',  'f'),
+    ))
 
-class MotorSingle(ISerializable):
 
-    def __init__(self):
-        self.target     = 0
-        self.rotation   = Rotation.None_
-        self.value      = 0
 
+class LostConnection(ISerializable):
 
-    @classmethod
-    def getSize(cls):
-        return 4
+    schema = Schema(DataType.LostConnection, (
+        ('timeNeutral',  'H'),
+        ('timeLanding',  'H'),
+        ('timeStop',     'I'),
+    ))
 
 
-    def toArray(self):
-        return pack('<BBh', self.target, self.rotation.value, self.value)
+# Sensor End
 
 
-    @classmethod
-    def parse(cls, dataArray):
-        data = MotorSingle()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-        
-        data.target, data.rotation, data.value = unpack('<BBh', dataArray)
-        data.rotation = Rotation(data.rotation)
-        
-        return data
 
+# Device Start
 
 
-class MotorSingleV(ISerializable):
+class MotorBlock(ISerializable):
 
-    def __init__(self):
-        self.target     = 0
-        self.value      = 0
+    schema = Schema(None, (
+        ('rotation',  'B', Rotation),
+        ('value',     'h'),
+    ))
 
 
-    @classmethod
-    def getSize(cls):
-        return 3
 
+class Motor(ISerializable):
 
-    def toArray(self):
-        return pack('<Bh', self.target, self.value)
+    schema = Schema(DataType.Motor, (
+        ('motor',  MotorBlock, 4),
+    ))
 
 
-    @classmethod
-    def parse(cls, dataArray):
-        data = MotorSingleV()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-        
-        data.target, data.value = unpack('<Bh', dataArray)
-        
-        return data
+class MotorBlockV(ISerializable):
 
+    schema = Schema(None, (
+        ('value',  'h'),
+    ))
 
 
-class InformationAssembledForController(ISerializable):
 
-    def __init__(self):
-        self.angleRoll              = 0
-        self.anglePitch             = 0
-        self.angleYaw               = 0
-        
-        self.rpm                    = 0
-        
-        self.positionX              = 0
-        self.positionY              = 0
-        self.positionZ              = 0
-        
-        self.speedX                 = 0
-        self.speedY                 = 0
-        
-        self.rangeHeight            = 0
-        
-        self.rssi                   = 0
+class MotorV(ISerializable):
 
+    schema = Schema(DataType.Motor, (
+        ('motor',  MotorBlockV, 4),
+    ))
 
-    @classmethod
-    def getSize(cls):
-        return 18
 
 
-    def toArray(self):
-        return pack('<hhhHhhhbbBb', self.angleRoll, self.anglePitch, self.angleYaw, 
-                                    self.rpm,
-                                    self.positionX, self.positionY, self.positionZ, 
-                                    self.speedX, self.speedY, 
-                                    self.rangeHeight,
-                                    self.rssi)
+class MotorSingle(ISerializable):
 
+    schema = Schema(DataType.Motor, (
+        ('target',    'B'),
+        ('rotation',  'B', Rotation),
+        ('value',     'h'),
+    ))
 
-    @classmethod
-    def parse(cls, dataArray):
-        data = InformationAssembledForController()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-        
-        (data.angleRoll, data.anglePitch, data.angleYaw, 
-        data.rpm,
-        data.positionX, data.positionY, data.positionZ, 
-        data.speedX, data.speedY, 
-        data.rangeHeight,
-        data.rssi) = unpack('<hhhHhhhbbBb', dataArray)
-        
-        return data
 
 
+class MotorSingleV(ISerializable):
 
-class InformationAssembledForEntry(ISerializable):
+    schema = Schema(DataType.Motor, (
+        ('target',  'B'),
+        ('value',   'h'),
+    ))
 
-    def __init__(self):
-        self.angleRoll      = 0
-        self.anglePitch     = 0
-        self.angleYaw       = 0
-        
-        self.positionX      = 0
-        self.positionY      = 0
-        self.positionZ      = 0
 
-        self.rangeHeight    = 0
-        self.altitude       = 0
 
+class InformationAssembledForController(ISerializable):
 
-    @classmethod
-    def getSize(cls):
-        return 18
+    schema = Schema(DataType.InformationAssembledForController, (
+        ('angleRoll',    'h'),
+        ('anglePitch',   'h'),
+        ('angleYaw',     'h'),
+        ('rpm',          'H'),
+        ('positionX',    'h'),
+        ('positionY',    'h'),
+        ('positionZ',    'h'),
+        ('speedX',       'b'),
+        ('speedY',       'b'),
+        ('rangeHeight',  'B'),
+        ('rssi',         'b'),
+    ))
 
 
-    def toArray(self):
-        return pack('<hhhhhhhf',    self.angleRoll, self.anglePitch, self.angleYaw,
-                                    self.positionX, self.positionY, self.positionZ,
-                                    self.rangeHeight, self.altitude)
 
+class InformationAssembledForEntry(ISerializable):
 
-    @classmethod
-    def parse(cls, dataArray):
-        data = InformationAssembledForEntry()
-        
-        if len(dataArray) != cls.getSize():
-            return None
-        
-        (data.angleRoll, data.anglePitch, data.angleYaw, 
-        data.positionX, data.positionY, data.positionZ, 
-        data.rangeHeight, data.altitude) = unpack('<hhhhhhhf', dataArray)
-        
-        return data
+    schema = Schema(None, (
+        ('angleRoll',    'h'),
+        ('anglePitch',   'h'),
+        ('angleYaw',     'h'),
+        ('positionX',    'h'),
+        ('positionY',    'h'),
+        ('positionZ',    'h'),
+        ('rangeHeight',  'h'),
+        ('altitude',     'f'),
+    ))
 
 
 
@@ -1,7 +1,17 @@
+import re
 import time
+import threading
+from bisect import bisect_right
+from collections import deque
 
 from CodingRider.protocol import *
 from CodingRider.crc import CRC16
+from CodingRider.storage import ReceiveQueueStatistics
+
+
+
+# decode()에서 시작 코드 탐색에 사용(bytes.find()와 달리 memoryview도 복사하지 않고 탐색)
+_patternStart = re.compile(b'\x0A\x55')
 
 
 
@@ -25,11 +35,269 @@ class Section(Enum):
 
 
 
+# 수신 결과
+class ReceiveStatus(Enum):
+
+    None_           = 0x00      # 없음
+
+    Success         = 0x01      # 수신 완료
+
+    TimeOver        = 0x10      # 수신 시간 초과
+    ErrorDataType   = 0x11      # 정의되지 않은 DataType
+    ErrorLength     = 0x12      # 데이터 길이 초과
+    ErrorDeviceType = 0x13      # 정의되지 않은 DeviceType
+    ErrorCrc        = 0x14      # CRC 불일치
+    IndexOver       = 0x15      # 섹션 인덱스 초과
+    SectionOver     = 0x16      # 섹션 초과
+
+
+
+# 수신 대기열이 가득 찼을 때 처리 방법
+class OverflowPolicy(Enum):
+
+    Block           = 0x00      # 공간이 생길 때까지 수신 스레드가 기다림
+    DropOldest      = 0x01      # 가장 오래된 데이터를 버림
+    DropNewest      = 0x02      # 새로 들어온 데이터를 버림
+    Spill           = 0x03      # sizeSpill까지 대기열을 늘리고, 그래도 부족하면 가장 오래된 데이터를 버림
+
+
+
+# 수신 대기열
+# 수신 스레드가 읽어온 (수신 시각, 데이터) 묶음을 check() 등이 처리할 때까지 보관
+# 크기는 바이트 단위로 제한
+class ReceiveQueue:
+
+
+    def __init__(self, sizeQueue = 65536, overflowPolicy = OverflowPolicy.Block, sizeSpill = 16777216):
+
+        self.sizeQueue              = sizeQueue
+        self.overflowPolicy         = overflowPolicy
+        self.sizeSpill              = max(sizeSpill, sizeQueue)
+
+        self.statistics             = ReceiveQueueStatistics()
+
+        self._queue                 = deque()
+        self._size                  = 0
+        self._condition             = threading.Condition()
+        self._flagCancel            = False
+
+
+
+    def __len__(self):
+        return self._size
+
+
+
+    def empty(self):
+        return self._size == 0
+
+
+
+    # 데이터 묶음 추가(데이터를 버린 경우 False 반환)
+    def put(self, item):
+
+        timeReceived, dataArray = item
+        size = len(dataArray)
+
+        with self._condition:
+
+            if (self._size + size) > self.sizeQueue:
+
+                if self.overflowPolicy == OverflowPolicy.Block:
+                    self.statistics.countBlocked += 1
+
+                    # 대기열이 비어 있으면 크기를 넘더라도 추가
+                    while ((self._size + size) > self.sizeQueue) and (self._size > 0) and (not self._flagCancel):
+                        self._condition.wait()
+
+                    if self._flagCancel:
+                        self.statistics.drop(dataArray)
+                        return False
+
+                elif self.overflowPolicy == OverflowPolicy.DropNewest:
+                    self.statistics.drop(dataArray)
+                    return False
+
+                else:
+                    sizeLimit = self.sizeSpill if self.overflowPolicy == OverflowPolicy.Spill else self.sizeQueue
+
+                    while ((self._size + size) > sizeLimit) and (len(self._queue) > 0):
+                        dataArrayOldest = self._queue.popleft()[1]
+                        self._size -= len(dataArrayOldest)
+                        self.statistics.drop(dataArrayOldest)
+
+                    if (self._size + size) > self.sizeQueue:
+                        self.statistics.countSpilledByte += min(size, self._size + size - self.sizeQueue)
+
+            self._queue.append(item)
+            self._size += size
+            self.statistics.updateSize(self._size)
+
+        return True
+
+
+
+    # 쌓인 데이터 묶음을 모두 꺼냄
+    def getAll(self):
+
+        with self._condition:
+            listItem = list(self._queue)
+            self._queue.clear()
+            self._size = 0
+            self.statistics.updateSize(0)
+            self._condition.notify_all()
+
+        return listItem
+
+
+
+    # put()에서 기다리는 수신 스레드를 깨움(close() 호출 시 사용, resume() 전까지 기다리지 않고 버림)
+    def cancel(self):
+
+        with self._condition:
+            self._flagCancel = True
+            self._condition.notify_all()
+
+
+
+    def resume(self):
+
+        with self._condition:
+            self._flagCancel = False
+
+
+
+# 수신 버퍼
+# 읽기/쓰기 위치만 옮기므로 앞쪽 데이터를 버릴 때 남은 데이터를 이동하지 않음
+# 뒤쪽 공간이 부족할 때만 남은 데이터를 앞으로 옮기거나(compaction) 버퍼 크기를 늘림
+class ReceiveBuffer:
+
+
+    def __init__(self, capacity = 4096):
+
+        self.buffer                 = bytearray(capacity)
+        self.indexRead              = 0         # 아직 처리하지 않은 데이터의 시작 위치
+        self.indexWrite             = 0         # 다음 데이터를 기록할 위치
+        self.timestamps             = []        # 데이터 묶음별 [끝 위치, 수신 시각]
+
+
+
+    def __len__(self):
+        return self.indexWrite - self.indexRead
+
+
+
+    def write(self, dataArray, timeReceived = None):
+
+        size = len(dataArray)
+
+        if self.indexWrite + size > len(self.buffer):
+            self._compact(size)
+
+        self.buffer[self.indexWrite:self.indexWrite + size] = dataArray
+        self.indexWrite += size
+
+        if timeReceived != None:
+            self.timestamps.append([self.indexWrite, timeReceived])
+
+
+
+    def consume(self, size):
+
+        self.indexRead = min(self.indexRead + size, self.indexWrite)
+
+        # 남은 데이터가 없으면 처음 위치부터 다시 사용
+        if self.indexRead == self.indexWrite:
+            self.clear()
+            return
+
+        # 모두 처리한 데이터 묶음의 수신 시각 삭제
+        count = 0
+        while (count < len(self.timestamps)) and (self.timestamps[count][0] <= self.indexRead):
+            count += 1
+
+        if count > 0:
+            del self.timestamps[0:count]
+
+
+
+    def view(self):
+        return memoryview(self.buffer)[self.indexRead:self.indexWrite]
+
+
+
+    def clear(self):
+        self.indexRead  = 0
+        self.indexWrite = 0
+        self.timestamps.clear()
+
+
+
+    def _compact(self, sizeRequired):
+
+        length      = len(self)
+        capacity    = len(self.buffer)
+
+        # 남은 데이터가 버퍼의 절반을 넘으면 크기를 늘려서 compaction이 자주 일어나지 않게 함
+        if (length + sizeRequired) * 2 > capacity:
+            while (length + sizeRequired) * 2 > capacity:
+                capacity *= 2
+
+            buffer = bytearray(capacity)
+            buffer[0:length] = self.buffer[self.indexRead:self.indexWrite]
+            self.buffer = buffer
+
+        else:
+            self.buffer[0:length] = self.buffer[self.indexRead:self.indexWrite]
+
+        for timestamp in self.timestamps:
+            timestamp[0] -= self.indexRead
+
+        self.indexRead  = 0
+        self.indexWrite = length
+
+
+
+# 수신 프레임
+# decode()에서 만든 프레임의 data는 수신 버퍼를 직접 가리키는 memoryview이므로 프레임 처리 중에만 유효함
+# 처리가 끝난 뒤에도 데이터를 보관해야 하는 경우 detach()로 복사본을 만들어 사용
+class Frame:
+
+
+    def __init__(self, header = None, data = None, timeReceived = 0):
+
+        self.header                 = header
+        self.data                   = data
+        self.timeReceived           = timeReceived      # 프레임의 마지막 바이트를 수신한 시각(clock 기준, 초)
+
+
+
+    def detach(self):
+
+        if isinstance(self.data, memoryview):
+            view        = self.data
+            self.data   = bytearray(view)
+            view.release()
+
+        return self.data
+
+
+
+    def release(self):
+
+        if isinstance(self.data, memoryview):
+            self.data.release()
+
+
+
 class Receiver:
 
 
-    def __init__(self):
+    # clock: 현재 시각(초)을 반환하는 함수(기본값 time.perf_counter)
+    def __init__(self, clock = None):
         
+        self._clock                 = clock if clock != None else time.perf_counter
+
         self.state                  = StateLoading.Ready
         self.sectionOld             = Section.End
         self.section                = Section.Start
@@ -41,19 +309,30 @@ class Receiver:
 
         self._buffer                = bytearray()
         self.data                   = bytearray()
+        self.frame                  = Frame(self.header, self.data)
 
         self.crc16received          = 0
         self.crc16calculated        = 0
 
-        self.message                = None
+        self.status                 = ReceiveStatus.None_     # 마지막 수신 결과
+        self.statusValue            = None                    # 수신 결과 메세지에 표시할 값
+        self.countStatus            = dict.fromkeys(list(ReceiveStatus), 0)
+
+        self.flagPassthrough        = False     # 정의되지 않은 DataType의 프레임도 CRC가 맞으면 수신 완료 처리(header.dataType은 숫자)
+
+        self.indexDecode            = 0         # decode() 처리가 끝난 위치(이 위치 이전의 데이터는 버려도 됨)
+
+        self.countDiscarded         = 0         # decode()에서 프레임을 찾지 못해 버린 바이트 수
+        self.countRecovered         = 0         # decode()에서 실패한 프레임 안에서 다시 찾아낸 프레임의 바이트 수
 
 
 
     def call(self, data):
         
-        now = time.perf_counter() * 1000
+        timeNow = self._clock()
+        now     = timeNow * 1000
 
-        self.message = None
+        self.status = ReceiveStatus.None_
 
 
         # First Step
@@ -70,7 +349,7 @@ class Receiver:
             # 데이터 수신을 시작한지 600ms 시간이 지난 경우 오류 출력
             if (self.timeReceiveStart + 600) < now:
                 self.state = StateLoading.Failure
-                self.message = "Error / Receiver / StateLoading.Receiving / Time over."
+                self._setStatus(ReceiveStatus.TimeOver)
                 return self.state
 
         elif self.state == StateLoading.Loaded:
@@ -102,7 +381,7 @@ class Receiver:
                     self.section = Section.Header
             else:
                 self.state = StateLoading.Failure
-                self.message = "Error / Receiver / Section.Start / Index over."
+                self._setStatus(ReceiveStatus.IndexOver, Section.Start)
                 return self.state
         
         elif self.section == Section.Header:
@@ -110,12 +389,15 @@ class Receiver:
             if self.index == 0:
                 self.header = Header()
                 
-                try:
-                    self.header.dataType = DataType(data)
+                self.header.dataType = tableDataType[data]
 
-                except:
+                # 정의되지 않은 DataType은 숫자 그대로 전달
+                if (self.header.dataType == None) and self.flagPassthrough:
+                    self.header.dataType = data
+
+                if self.header.dataType == None:
                     self.state = StateLoading.Failure
-                    self.message = "Error / Receiver / Section.Header / DataType Error. 0x{0:02X}".format(data)
+                    self._setStatus(ReceiveStatus.ErrorDataType, data)
                     return self.state
 
                 self.crc16calculated = CRC16.calc(data, 0)
@@ -126,27 +408,25 @@ class Receiver:
 
                 if self.header.length > 128:
                     self.state = StateLoading.Failure
-                    self.message = "Error / Receiver / Section.Header / Data length is longer than 128. [{0}]".format(self.header.length)
+                    self._setStatus(ReceiveStatus.ErrorLength, self.header.length)
                     return self.state
 
             elif self.index == 2:
-                try:
-                    self.header.from_ = DeviceType(data)
+                self.header.from_ = tableDeviceType[data]
 
-                except:
+                if self.header.from_ == None:
                     self.state = StateLoading.Failure
-                    self.message = "Error / Receiver / Section.Header / DeviceType Error. 0x{0:02X}".format(data)
+                    self._setStatus(ReceiveStatus.ErrorDeviceType, data)
                     return self.state
 
                 self.crc16calculated = CRC16.calc(data, self.crc16calculated)
 
             elif self.index == 3:
-                try:
-                    self.header.to_ = DeviceType(data)
+                self.header.to_ = tableDeviceType[data]
 
-                except:
+                if self.header.to_ == None:
                     self.state = StateLoading.Failure
-                    self.message = "Error / Receiver / Section.Header / DeviceType Error. 0x{0:02X}".format(data)
+                    self._setStatus(ReceiveStatus.ErrorDeviceType, data)
                     return self.state
 
                 self.crc16calculated = CRC16.calc(data, self.crc16calculated)
@@ -160,7 +440,7 @@ class Receiver:
 
             else:
                 self.state = StateLoading.Failure
-                self.message = "Error / Receiver / Section.Header / Index over."
+                self._setStatus(ReceiveStatus.IndexOver, Section.Header)
                 return self.state
         
         elif self.section == Section.Data:
@@ -179,24 +459,25 @@ class Receiver:
 
                 if self.crc16received == self.crc16calculated:
                     self.data = self._buffer.copy()
+                    self.frame = Frame(self.header, self.data, timeNow)
                     self.timeReceiveComplete = now
                     self.state = StateLoading.Loaded
-                    self.message = "Success / Receiver / Section.End / Receive complete / {0} / [receive: 0x{1:04X}]".format(self.header.dataType, self.crc16received)
+                    self._setStatus(ReceiveStatus.Success, self.header.dataType)
                     return self.state
 
                 else:
                     self.state = StateLoading.Failure
-                    self.message = "Error / Receiver / Section.End / CRC Error / {0} / [receive: 0x{1:04X}, calculate: 0x{2:04X}]".format(self.header.dataType, self.crc16received, self.crc16calculated)
+                    self._setStatus(ReceiveStatus.ErrorCrc, self.header.dataType)
                     return self.state
 
             else:
                 self.state = StateLoading.Failure
-                self.message = "Error / Receiver / Section.End / Index over."
+                self._setStatus(ReceiveStatus.IndexOver, Section.End)
                 return self.state
 
         else:
             self.state = StateLoading.Failure
-            self.message = "Error / Receiver / Section over."
+            self._setStatus(ReceiveStatus.SectionOver)
             return self.state
 
 
@@ -211,3 +492,242 @@ class Receiver:
     def checked(self):
         self.state = StateLoading.Ready
 
+
+
+    # index 위치의 데이터를 수신한 시각
+    # listIndexEnd는 timestamps의 끝 위치 목록(오름차순)
+    @staticmethod
+    def _getTime(timestamps, listIndexEnd, index, timeDefault):
+
+        position = bisect_right(listIndexEnd, index)
+
+        if position < len(timestamps):
+            return timestamps[position][1]
+
+        return timeDefault
+
+
+
+    def _setStatus(self, status, value = None):
+        self.status                 = status
+        self.statusValue            = value
+        self.countStatus[status]    += 1
+
+
+
+    # 수신 결과 메세지(필요할 때만 문자열을 만듦)
+    @property
+    def message(self):
+
+        status  = self.status
+        value   = self.statusValue
+
+        if   status == ReceiveStatus.None_:
+            return None
+
+        elif status == ReceiveStatus.Success:
+            return "Success / Receiver / Section.End / Receive complete / {0} / [receive: 0x{1:04X}]".format(value, self.crc16received)
+
+        elif status == ReceiveStatus.TimeOver:
+            return "Error / Receiver / StateLoading.Receiving / Time over."
+
+        elif status == ReceiveStatus.ErrorDataType:
+            return "Error / Receiver / Section.Header / DataType Error. 0x{0:02X}".format(value)
+
+        elif status == ReceiveStatus.ErrorLength:
+            return "Error / Receiver / Section.Header / Data length is longer than 128. [{0}]".format(value)
+
+        elif status == ReceiveStatus.ErrorDeviceType:
+            return "Error / Receiver / Section.Header / DeviceType Error. 0x{0:02X}".format(value)
+
+        elif status == ReceiveStatus.ErrorCrc:
+            return "Error / Receiver / Section.End / CRC Error / {0} / [receive: 0x{1:04X}, calculate: 0x{2:04X}]".format(value, self.crc16received, self.crc16calculated)
+
+        elif status == ReceiveStatus.IndexOver:
+            return "Error / Receiver / {0} / Index over.".format(value)
+
+        elif status == ReceiveStatus.SectionOver:
+            return "Error / Receiver / Section over."
+
+        return None
+
+
+
+    # 버퍼 단위 수신 처리
+    # dataArray는 bytes, bytearray, memoryview이며 복사하지 않고 그대로 탐색함(프레임의 data도 dataArray를 가리킴)
+    # dataArray[indexStart:indexEnd] 범위에서 프레임 수신을 완료할 때마다 StateLoading.Loaded,
+    # 수신에 실패할 때마다 StateLoading.Failure를 반환
+    # self.indexDecode 이전의 데이터는 처리가 끝난 것이므로 호출한 쪽에서 버려도 되며,
+    # 이후의 데이터(수신중인 프레임)는 다음 호출 시 새로 들어온 데이터와 함께 다시 전달해야 함
+    # call()과 수신 상태를 공유하지 않으므로 같은 Receiver에서 두 방식을 섞어 사용하지 않음
+    # timestamps([[데이터 묶음의 끝 위치, 수신 시각], ...])를 지정하면 데이터 묶음별 수신 시각을 사용하고
+    # 지정하지 않으면 호출한 시각을 모든 데이터의 수신 시각으로 사용
+    def decode(self, dataArray, indexStart = 0, indexEnd = None, timestamps = None):
+
+        if timestamps:
+            timeNow         = timestamps[-1][1]
+            listIndexEnd    = [timestamp[0] for timestamp in timestamps]
+        else:
+            timestamps      = ()
+            listIndexEnd    = ()
+            timeNow         = self._clock()
+
+        now = timeNow * 1000
+
+        # bytes, bytearray, memoryview는 복사하지 않고 그대로 사용(list 등은 bytes로 변환)
+        if isinstance(dataArray, memoryview):
+            if (dataArray.format != 'B') or (dataArray.ndim != 1):
+                dataArray = dataArray.cast('B')
+
+        elif not isinstance(dataArray, (bytes, bytearray)):
+            dataArray = bytes(dataArray)
+
+        if indexEnd == None:
+            indexEnd = len(dataArray)
+
+        view                = memoryview(dataArray)
+        search              = _patternStart.search
+        index               = indexStart
+        indexPending        = -1
+        indexFailure        = -1        # 마지막으로 실패한 프레임에서 오류가 발생한 위치
+        self.indexDecode    = index
+        self.status         = ReceiveStatus.None_
+
+        # 이전 호출에서 수신중이던 프레임은 indexStart 위치에서 다시 시작함
+        if self.state == StateLoading.Receiving:
+            if (self.timeReceiveStart + 600) < now:
+                # 수신중이던 프레임의 범위만 실패한 것으로 처리
+                # (헤더가 없거나 올바르지 않으면 시작 코드까지만)
+                if  (index + 6 <= indexEnd) and \
+                    (dataArray[index + 3] <= 128) and \
+                    (tableDeviceType[dataArray[index + 4]] != None) and \
+                    (tableDeviceType[dataArray[index + 5]] != None):
+                    indexFailure        = index + 8 + dataArray[index + 3]
+                else:
+                    indexFailure        = index + 2
+                index                   = index + 1
+                self.countDiscarded     += 1
+                self.indexDecode        = index
+                self.state              = StateLoading.Failure
+                self._setStatus(ReceiveStatus.TimeOver)
+                yield self.state
+
+            else:
+                indexPending = index
+
+        self.state = StateLoading.Ready
+
+        while index < indexEnd:
+
+            # Start
+            match = search(dataArray, index, indexEnd)
+
+            if match != None:
+                indexFound = match.start()
+            else:
+                # 마지막 바이트가 시작 코드의 첫 바이트일 수 있으므로 남겨둠
+                if dataArray[indexEnd - 1] == 0x0A:
+                    indexFound = indexEnd - 1
+                else:
+                    indexFound = indexEnd
+
+            self.countDiscarded += indexFound - index
+            index = indexFound
+
+            if (index < indexEnd) and (index != indexPending):
+                self.timeReceiveStart = self._getTime(timestamps, listIndexEnd, index, timeNow) * 1000
+
+            if index + 6 > indexEnd:
+                break
+
+            # Header
+            dataType    = tableDataType[dataArray[index + 2]]
+            length      = dataArray[index + 3]
+            from_       = tableDeviceType[dataArray[index + 4]]
+            to_         = tableDeviceType[dataArray[index + 5]]
+
+            # 정의되지 않은 DataType은 숫자 그대로 전달
+            if (dataType == None) and self.flagPassthrough:
+                dataType = dataArray[index + 2]
+
+            if dataType == None:
+                self._setStatus(ReceiveStatus.ErrorDataType, dataArray[index + 2])
+                indexError = index + 3
+
+            elif length > 128:
+                self._setStatus(ReceiveStatus.ErrorLength, length)
+                indexError = index + 4
+
+            elif (from_ == None) or (to_ == None):
+                self._setStatus(ReceiveStatus.ErrorDeviceType, dataArray[index + 4] if from_ == None else dataArray[index + 5])
+                indexError = index + 6
+
+            else:
+                # Data, End
+                indexData   = index + 6
+                indexCrc    = indexData + length
+
+                if indexCrc + 2 > indexEnd:
+                    break
+
+                timeReceived = self._getTime(timestamps, listIndexEnd, indexCrc + 1, timeNow)
+
+                self.crc16calculated    = CRC16.calc(view[index + 2:indexCrc], 0)
+                self.crc16received      = dataArray[indexCrc] | (dataArray[indexCrc + 1] << 8)
+
+                # 프레임을 수신하는 도중 시간 초과
+                if (self.timeReceiveStart + 600) < (timeReceived * 1000):
+                    self._setStatus(ReceiveStatus.TimeOver)
+                    indexError = indexCrc + 2
+
+                elif self.crc16received == self.crc16calculated:
+                    self.header             = Header()
+                    self.header.dataType    = dataType
+                    self.header.length      = length
+                    self.header.from_       = from_
+                    self.header.to_         = to_
+
+                    self.data                   = view[indexData:indexCrc]
+                    self.frame                  = Frame(self.header, self.data, timeReceived)
+                    self.timeReceiveComplete    = timeReceived * 1000
+
+                    # 실패한 프레임 안에서 찾은 프레임
+                    if index < indexFailure:
+                        self.countRecovered += indexCrc + 2 - index
+
+                    index               = indexCrc + 2
+                    self.indexDecode    = index
+                    self.state          = StateLoading.Loaded
+                    self._setStatus(ReceiveStatus.Success, dataType)
+
+                    # 프레임 처리가 끝나면(detach()하지 않은 경우) 수신 버퍼 참조를 해제
+                    try:
+                        yield self.state
+                    finally:
+                        self.frame.release()
+
+                    self.state      = StateLoading.Ready
+                    self.status     = ReceiveStatus.None_
+                    continue
+
+                else:
+                    self._setStatus(ReceiveStatus.ErrorCrc, dataType)
+                    indexError = indexCrc + 2
+
+            # 실패한 프레임의 시작 코드만 버리고 바로 다음 바이트부터 다시 탐색
+            # (실패한 프레임 안에 실제 프레임이 겹쳐 있을 수 있음)
+            indexFailure            = max(indexFailure, indexError)
+            index                   += 1
+            self.countDiscarded     += 1
+            self.indexDecode        = index
+            self.state              = StateLoading.Failure
+            yield self.state
+
+            self.state      = StateLoading.Ready
+            self.status     = ReceiveStatus.None_
+
+        # 수신중인 프레임이 남아있는 경우 다음 호출에서 이어서 처리
+        if index < indexEnd:
+            self.state = StateLoading.Receiving
+
+        self.indexDecode = index
@@ -39,32 +39,189 @@ class StorageCount:
 
 
 
+# Storage Time
+class StorageTime:
+
+    def __init__(self):
+        self.d = dict.fromkeys(list(DataType))
+
+
+
+# Batch Statistics
+class BatchStatistics:
+
+    def __init__(self):
+        self.countBatch         = 0     # checkBatch() 호출 횟수
+
+        self.countFrame         = 0     # 마지막 호출에서 처리한 프레임 수
+        self.sizeReceived       = 0     # 마지막 호출에서 수신 버퍼로 옮긴 바이트 수
+        self.timeElapsed        = 0     # 마지막 호출의 처리 시간(초)
+
+        self.countFrameTotal    = 0
+        self.sizeReceivedTotal  = 0
+        self.timeElapsedTotal   = 0
+
+
+    def update(self, countFrame, sizeReceived, timeElapsed):
+        self.countBatch         += 1
+
+        self.countFrame         = countFrame
+        self.sizeReceived       = sizeReceived
+        self.timeElapsed        = timeElapsed
+
+        self.countFrameTotal    += countFrame
+        self.sizeReceivedTotal  += sizeReceived
+        self.timeElapsedTotal   += timeElapsed
+
+
+
+class ReceiveQueueStatistics:
+
+    def __init__(self):
+        self.size               = 0     # 수신 대기열에 쌓인 바이트 수
+        self.sizeHighWater      = 0     # 수신 대기열의 최대 크기(바이트)
+
+        self.countBlocked       = 0     # 대기열이 가득 차서 수신 스레드가 기다린 횟수
+        self.countDroppedByte   = 0     # 버린 바이트 수
+        self.countDroppedFrame  = 0     # 버린 프레임 수(버린 데이터에 포함된 시작 코드 수로 추정)
+        self.countSpilledByte   = 0     # 기본 크기를 넘어 추가 공간에 저장한 바이트 수
+
+
+    def updateSize(self, size):
+        self.size               = size
+        self.sizeHighWater      = max(self.sizeHighWater, size)
+
+
+    def drop(self, dataArray):
+        self.countDroppedByte   += len(dataArray)
+        self.countDroppedFrame  += bytes(dataArray).count(b'\x0A\x55')
+
+
+
+class TransferStatistics:
+
+    def __init__(self):
+        self.depth              = 0     # 송신 대기열에 남아 있는 프레임 수
+        self.depthMax           = 0     # 송신 대기열의 최대 길이
+
+        self.countFrame         = 0     # 전송한 프레임 수
+        self.countWrite         = 0     # write() 호출 횟수
+        self.sizeWritten        = 0     # 전송한 바이트 수
+        self.countDropped       = 0     # 우선 순위가 높은 프레임 때문에 전송하지 않고 취소한 Control 프레임 수
+
+        self.latency            = 0     # 마지막 프레임의 대기열 진입부터 전송 완료까지 걸린 시간(초)
+        self.latencyMax         = 0
+        self.latencyTotal       = 0
+
+
+    def updateDepth(self, depth):
+        self.depth              = depth
+        self.depthMax           = max(self.depthMax, depth)
+
+
+    def update(self, listLatency, sizeWritten):
+        self.countFrame         += len(listLatency)
+        self.countWrite         += 1
+        self.sizeWritten        += sizeWritten
+
+        self.latency            = listLatency[-1]
+        self.latencyMax         = max(self.latencyMax, max(listLatency))
+        self.latencyTotal       += sum(listLatency)
+
+
+
+class HubStatistics:
+
+    def __init__(self, timeStart = 0):
+        self.timeStart          = timeStart     # DroneHub에 등록된 시각(초)
+
+        self.countRead          = 0     # 수신 이벤트 처리 횟수
+        self.sizeReceived       = 0     # 수신한 바이트 수
+        self.countFrame         = 0     # 처리한 프레임 수
+        self.timeCpu            = 0     # 수신 및 프레임 처리에 사용한 CPU 시간(초)
+
+
+    def update(self, sizeReceived, countFrame, timeCpu):
+        self.countRead          += 1
+        self.sizeReceived       += sizeReceived
+        self.countFrame         += countFrame
+        self.timeCpu            += timeCpu
+
+
+
 # Storage
+# protocol.dictMessage에 등록된 모든 메세지 클래스를 DataType별로 사용
+# 하나의 DataType에 여러 구조가 있으면 데이터 길이로 구분
+# 메세지 클래스가 없는 DataType은 수신한 데이터를 bytes로 그대로 저장
 class Parser:
 
     def __init__(self):
-        self.d = dict.fromkeys(list(DataType))
+        self.d = dict.fromkeys(list(DataType))                      # DataType별 parse 함수
+        self.c = {dataType: [] for dataType in DataType}            # DataType별 메세지 클래스 목록
+        self.m = dict.fromkeys(list(DataType), DecodeMode.Object)   # DataType별 변환 방식
+
+        for dataType in DataType:
+            for cls in dictMessage.get(dataType, []):
+                self.c[dataType].append(cls)
+
+        # schema가 없는 클래스
+        self.c[DataType.Pairing].append(Pairing)
+
+        for dataType in DataType:
+            self._update(dataType)
+
+
+    def register(self, dataType, cls):
+        if cls not in self.c[dataType]:
+            self.c[dataType].append(cls)
+
+        self._update(dataType)
+
+
+    # schema가 없는 클래스가 있는 DataType은 DecodeMode.Object만 사용 가능
+    def setDecodeMode(self, dataType, decodeMode):
+
+        if len(self.c[dataType]) == 0:
+            return False
+
+        if (decodeMode != DecodeMode.Object) and (None in [cls.schema for cls in self.c[dataType]]):
+            return False
+
+        self.m[dataType] = decodeMode
+        self._update(dataType)
+
+        return True
+
+
+    def _update(self, dataType):
+
+        listClass   = self.c[dataType]
+        decodeMode  = self.m[dataType]
 
-        self.d[DataType.Ping]               = Ping.parse
-        self.d[DataType.Ack]                = Ack.parse
-        self.d[DataType.Error]              = Error.parse
-        self.d[DataType.Information]        = Information.parse
-        self.d[DataType.VisionSensor]       = VisionSensor.parse
-        self.d[DataType.Pairing]            = Pairing.parse
+        if len(listClass) == 0:
+            self.d[dataType] = bytes
+            return
 
-        self.d[DataType.RawMotion]          = RawMotion.parse
+        if decodeMode == DecodeMode.Tuple:
+            listParse = [cls.parseTuple for cls in listClass]
+        elif decodeMode == DecodeMode.Record:
+            listParse = [cls.parseRecord for cls in listClass]
+        else:
+            listParse = [cls.parse for cls in listClass]
 
-        self.d[DataType.State]              = State.parse
-    
-        self.d[DataType.Altitude]           = Altitude.parse
-        self.d[DataType.Motion]             = Motion.parse
+        if len(listClass) == 1:
+            self.d[dataType] = listParse[0]
+            return
 
-        self.d[DataType.Count]              = Count.parse
-        self.d[DataType.Trim]               = Trim.parse
+        # 길이가 같은 구조가 있으면 먼저 등록된 클래스를 사용
+        dictParse = {}
+        for cls, parse in zip(listClass, listParse):
+            dictParse.setdefault(cls.getSize(), parse)
 
-        self.d[DataType.Button]             = Button.parse
-        self.d[DataType.Joystick]           = Joystick.parse
+        def parseBySize(dataArray):
+            parse = dictParse.get(len(dataArray))
+            return parse(dataArray) if parse != None else None
 
-        self.d[DataType.InformationAssembledForController]  = InformationAssembledForController.parse
+        self.d[dataType] = parseBySize
 
 
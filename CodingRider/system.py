@@ -1,6 +1,20 @@
 from enum import Enum
 
 
+
+# 바이트 값(0 ~ 255)으로 Enum을 바로 찾을 수 있는 변환 테이블 생성
+# 정의되지 않은 값은 None
+def makeEnumTable(enumType):
+
+    table = [None] * 256
+
+    for member in enumType.__members__.values():
+        if 0 <= member.value < 256:
+            table[member.value] = member
+
+    return tuple(table)
+
+
 class ModelNumber(Enum):
     
     None_                   = 0x00000000
@@ -81,6 +95,10 @@ class DeviceType(Enum):
 
 
 
+tableDeviceType = makeEnumTable(DeviceType)
+
+
+
 class ModeDrone(Enum) :
     
     None_       = 0x00      # 없음
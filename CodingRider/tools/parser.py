@@ -191,6 +191,8 @@ class Parser():
             drone.sendRequest(deviceType, dataType)
             sleep(interval)
 
+        drone.close()
+
 
     def command(self, commandType, option = 0):
 
@@ -203,6 +205,9 @@ class Parser():
         # 데이터 요청
         drone.sendCommand(commandType, option)
 
+        # 송신 대기열에 남은 데이터를 전송한 후 종료
+        drone.close()
+
 
     def control(self, roll, pitch, yaw, throttle, timeMs):
 
@@ -216,6 +221,8 @@ class Parser():
         drone.sendControlWhile(roll, pitch, yaw, throttle, timeMs)
         drone.sendControlWhile(0, 0, 0, 0, 200)
 
+        drone.close()
+
 
     def controlPosition(self, x, y, z, velocity, heading, rotationalVelocity):
 
@@ -227,7 +234,9 @@ class Parser():
 
         # 데이터 요청
         drone.sendControlPosition(x, y, z, velocity, heading, rotationalVelocity)
-        sleep(0.1)
+
+        # 송신 대기열에 남은 데이터를 전송한 후 종료
+        drone.close()
 
 
     def lightModeRgb(self, strLightPart, strLightMode, interval, r, g, b):
@@ -279,6 +288,8 @@ class Parser():
         if lightModeHigh != LightModeDrone.None_ and lightModeLow != LightModeDrone.None_:
             drone.sendLightModeColor(lightMode, interval, r, g, b)
 
+        drone.close()
+
 
     def lightModeSingle(self, strLightPart, strLightMode, interval):
 
@@ -326,6 +337,8 @@ class Parser():
         if lightModeHigh != LightModeDrone.None_ and lightModeLow != LightModeDrone.None_:
             drone.sendLightMode(lightMode, interval)
 
+        drone.close()
+
 
     def buzzer(self, target, hz, time):
 
@@ -354,6 +367,8 @@ class Parser():
         drone.transfer(header, data)
         sleep(time / 1000)
 
+        drone.close()
+
 
     def help(self):
 
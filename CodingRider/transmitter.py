@@ -0,0 +1,237 @@
+import time
+import atexit
+import weakref
+import threading
+from collections import deque
+from concurrent.futures import Future
+from enum import Enum
+
+from CodingRider.protocol import DataType
+from CodingRider.storage import TransferStatistics
+
+
+
+# 송신 우선 순위(값이 작을수록 먼저 전송)
+class TransferPriority(Enum):
+
+    High        = 0     # 정지, 착륙 등 비행 명령(대기열 길이 제한을 받지 않음)
+    Normal      = 1
+    Low         = 2     # 조명, 버저 등
+
+
+
+# 프로그램이 끝날 때 대기열에 남은 데이터를 전송하기 위해 실행중인 송신 스레드를 기록
+_setTransmitter = weakref.WeakSet()
+
+
+
+@atexit.register
+def _flushAll():
+    for transmitter in list(_setTransmitter):
+        transmitter.flush(1)
+
+
+
+# 데이터 송신
+# 우선 순위가 높은 프레임이 대기중이면 낮은 프레임보다 먼저 전송하며, 우선 순위가 다른 프레임은 한 번에 묶지 않음
+# 우선 순위가 높은 프레임(정지, 착륙 등)을 넣으면 대기중인 조종 입력(Control)은 전송하지 않고 취소
+# 송신 요청은 대기열에 넣고 바로 반환하며, 송신 스레드가 대기중인 프레임을 모아서 한 번의 write()로 전송
+class Transmitter:
+
+    # eventHandlerError는 송신 오류 메세지(문자열)를 받을 함수
+    def __init__(self, clock = None, sizeQueue = 256, sizeWriteMax = 256, eventHandlerError = None):
+
+        self._clock             = clock if clock != None else time.perf_counter
+        self._sizeQueue         = max(sizeQueue, 1)         # 대기열 최대 길이(가득 차면 put()이 대기)
+        self._sizeWriteMax      = max(sizeWriteMax, 1)      # 한 번에 전송할 최대 크기(우선 순위가 높은 프레임이 기다리는 최대 시간을 결정)
+
+        self._eventHandlerError = eventHandlerError
+        self._transport         = None
+        self._queue             = {priority: deque() for priority in TransferPriority}     # (대기열 진입 시각, 데이터, Future)
+        self._countQueue        = 0                         # 대기열 전체 길이
+        self._countWriting      = 0                         # 전송중인 프레임 수
+        self._condition         = threading.Condition()
+
+        self._thread            = None
+        self._flagRun           = False
+
+        self.statistics         = TransferStatistics()
+        self.statisticsPriority = {priority: TransferStatistics() for priority in TransferPriority}
+
+
+
+    def isRunning(self):
+        return self._flagRun
+
+
+
+    def start(self, transport):
+
+        self.stop(False)
+
+        self._transport     = transport
+        self._flagRun       = True
+        self._thread        = threading.Thread(target=self._writing, args=(), daemon=True)
+        self._thread.start()
+
+        _setTransmitter.add(self)
+
+
+
+    # flagFlush가 True이면 대기열에 남은 데이터를 모두 전송한 후 종료
+    def stop(self, flagFlush = True, timeout = 1):
+
+        if self._thread == None:
+            return
+
+        if flagFlush:
+            self.flush(timeout)
+
+        with self._condition:
+            self._flagRun = False
+            self._condition.notify_all()
+
+        self._thread.join(timeout)
+        self._thread = None
+
+        _setTransmitter.discard(self)
+
+        # 전송하지 못한 요청은 취소
+        with self._condition:
+            for priority in TransferPriority:
+                while len(self._queue[priority]) > 0:
+                    self._queue[priority].popleft()[2].cancel()
+
+                self.statisticsPriority[priority].updateDepth(0)
+
+            self._countQueue = 0
+            self.statistics.updateDepth(0)
+
+
+
+    # 전송 요청을 대기열에 추가하고 전송 완료를 알려주는 Future를 반환
+    def put(self, dataArray, priority = TransferPriority.Normal):
+
+        future = Future()
+
+        with self._condition:
+            while (priority != TransferPriority.High) and (self._countQueue >= self._sizeQueue) and self._flagRun:
+                self._condition.wait()
+
+            if not self._flagRun:
+                future.cancel()
+                return future
+
+            # 정지 명령 뒤에 이전 조종 입력이 전송되지 않게 함
+            if priority == TransferPriority.High:
+                self._dropControl()
+
+            self._queue[priority].append((self._clock(), dataArray, future))
+            self._countQueue += 1
+            self._updateDepth(priority)
+            self._condition.notify_all()
+
+        return future
+
+
+
+    # 대기열이 빌 때까지 대기(timeout 초과 시 False 반환)
+    def flush(self, timeout = None):
+
+        with self._condition:
+            return self._condition.wait_for(lambda: ((self._countQueue == 0) and (self._countWriting == 0)) or (not self._flagRun), timeout)
+
+
+
+    # 대기중인 Control 프레임 취소(_condition을 잡은 상태에서 호출)
+    def _dropControl(self):
+
+        for priority in (TransferPriority.Normal, TransferPriority.Low):
+
+            queue   = self._queue[priority]
+            count   = len(queue)
+
+            for i in range(count):
+                item        = queue.popleft()
+                dataArray   = item[1]
+
+                # 여러 프레임을 묶은 데이터(TransferBatch)는 그대로 전송
+                if (len(dataArray) > 3) and (dataArray[2] == DataType.Control.value) and (len(dataArray) == dataArray[3] + 8):
+                    item[2].cancel()
+                    self._countQueue -= 1
+                    self.statistics.countDropped += 1
+                    self.statisticsPriority[priority].countDropped += 1
+                else:
+                    queue.append(item)
+
+            if len(queue) != count:
+                self._updateDepth(priority)
+
+
+
+    def _updateDepth(self, priority):
+        self.statistics.updateDepth(self._countQueue)
+        self.statisticsPriority[priority].updateDepth(len(self._queue[priority]))
+
+
+
+    def _writing(self):
+
+        while True:
+
+            with self._condition:
+                while (self._countQueue == 0) and self._flagRun:
+                    self._condition.wait()
+
+                if not self._flagRun:
+                    break
+
+                # 우선 순위가 가장 높은 대기열에서 프레임을 sizeWriteMax 이내로 모음
+                for priority in TransferPriority:
+                    if len(self._queue[priority]) > 0:
+                        queue = self._queue[priority]
+                        break
+
+                listItem    = [queue.popleft()]
+                size        = len(listItem[0][1])
+
+                while (len(queue) > 0) and (size + len(queue[0][1]) <= self._sizeWriteMax):
+                    listItem.append(queue.popleft())
+                    size += len(listItem[-1][1])
+
+                self._countQueue    -= len(listItem)
+                self._countWriting  = len(listItem)
+                self._updateDepth(priority)
+                self._condition.notify_all()
+
+            error = None
+
+            try:
+                if len(listItem) == 1:
+                    self._transport.write(listItem[0][1])
+                else:
+                    self._transport.write(b''.join([item[1] for item in listItem]))
+
+            except Exception as e:
+                error = e
+
+                # 오류 메세지 출력(flagFuture 없이 호출한 경우에도 알 수 있도록)
+                if self._eventHandlerError != None:
+                    self._eventHandlerError("Transmitter / Write error. {0}: {1}".format(type(e).__name__, e))
+
+            timeNow = self._clock()
+
+            with self._condition:
+                if error == None:
+                    listLatency = [timeNow - item[0] for item in listItem]
+                    self.statistics.update(listLatency, size)
+                    self.statisticsPriority[priority].update(listLatency, size)
+
+                self._countWriting = 0
+                self._condition.notify_all()
+
+            for item in listItem:
+                if error == None:
+                    item[2].set_result(item[1])
+                else:
+                    item[2].set_exception(error)
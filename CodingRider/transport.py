@@ -0,0 +1,369 @@
+import io
+import os
+import abc
+import select
+import socket
+import threading
+
+import serial
+from serial.tools.list_ports import comports
+
+
+
+# ITransport Start
+
+
+# 통신 경로
+# read(size)는 수신 대기중인 데이터를 최대 size 바이트까지 한 번에 읽음
+# 수신 대기중인 데이터가 없으면 timeout 동안 데이터를 기다리고, 그래도 없으면 빈 bytes를 반환
+class ITransport:
+
+    __metaclass__ = abc.ABCMeta
+
+    @abc.abstractmethod
+    def open(self):
+        pass
+
+    @abc.abstractmethod
+    def close(self):
+        pass
+
+    @abc.abstractmethod
+    def isOpen(self):
+        pass
+
+    @abc.abstractmethod
+    def read(self, size):
+        pass
+
+    @abc.abstractmethod
+    def write(self, dataArray):
+        pass
+
+    # 통신 속도 변경을 지원하지 않는 경로는 False를 반환
+    def setBaudrate(self, baudrate):
+        return False
+
+    # 이벤트 루프에서 수신 대기에 사용할 파일 디스크립터(지원하지 않으면 None)
+    def fileno(self):
+        return None
+
+    # 다른 스레드에서 대기중인 read()를 바로 반환하게 함(close() 전에 호출)
+    def cancelRead(self):
+        pass
+
+
+# ITransport End
+
+
+
+# SerialTransport Start
+
+
+class SerialTransport(ITransport):
+
+    def __init__(self, portname, baudrate = 57600, timeout = 0.01, bytesize = serial.EIGHTBITS, parity = serial.PARITY_NONE, stopbits = serial.STOPBITS_ONE):
+        self.portname       = portname
+        self.baudrate       = baudrate
+        self.timeout        = timeout
+        self.bytesize       = bytesize
+        self.parity         = parity
+        self.stopbits       = stopbits
+        self.serialNumber   = None      # USB 시리얼 번호(다시 연결할 때 포트 이름이 바뀌었으면 이 번호로 포트를 찾음)
+
+        self._serialport    = None
+
+
+    def open(self):
+        nodes = comports()
+
+        if self.serialNumber != None:
+            if self.portname not in [node.device for node in nodes]:
+                for node in nodes:
+                    if node.serial_number == self.serialNumber:
+                        self.portname = node.device
+                        break
+        else:
+            for node in nodes:
+                if node.device == self.portname:
+                    self.serialNumber = node.serial_number
+                    break
+
+        self._serialport = serial.Serial(
+            port        = self.portname,
+            baudrate    = self.baudrate,
+            bytesize    = self.bytesize,
+            parity      = self.parity,
+            stopbits    = self.stopbits,
+            timeout     = self.timeout)
+
+        return self.isOpen()
+
+
+    def close(self):
+        if self._serialport != None:
+            self._serialport.close()
+
+
+    def isOpen(self):
+        if self._serialport != None:
+            return self._serialport.isOpen()
+        else:
+            return False
+
+
+    def read(self, size):
+        return self._serialport.read(min(max(self._serialport.in_waiting, 1), size))
+
+
+    def write(self, dataArray):
+        return self._serialport.write(dataArray)
+
+
+    # POSIX에서만 지원(Windows의 pyserial은 파일 디스크립터가 없으므로 None을 반환)
+    def fileno(self):
+        if self._serialport != None:
+            try:
+                return self._serialport.fileno()
+            except (AttributeError, io.UnsupportedOperation):
+                return None
+        else:
+            return None
+
+
+    def cancelRead(self):
+        if (self._serialport != None) and hasattr(self._serialport, "cancel_read"):
+            self._serialport.cancel_read()
+
+
+    # 포트를 닫지 않고 통신 속도 변경
+    def setBaudrate(self, baudrate):
+        self.baudrate = baudrate
+
+        if self._serialport != None:
+            self._serialport.baudrate = baudrate
+            self._serialport.reset_input_buffer()
+
+        return True
+
+
+# SerialTransport End
+
+
+
+# TcpTransport Start
+
+
+# 시리얼-TCP 변환 장치(serial over IP) 연결
+class TcpTransport(ITransport):
+
+    def __init__(self, host, port, timeout = 0.01, timeoutConnect = 3):
+        self.host               = host
+        self.port               = port
+        self.timeout            = timeout
+        self.timeoutConnect     = timeoutConnect
+
+        self._socket            = None
+
+
+    def open(self):
+        self._socket = socket.create_connection((self.host, self.port), self.timeoutConnect)
+        self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._socket.settimeout(self.timeout)
+
+        return True
+
+
+    def close(self):
+        if self._socket != None:
+            self._socket.close()
+            self._socket = None
+
+
+    def isOpen(self):
+        return self._socket != None
+
+
+    def read(self, size):
+        try:
+            dataArray = self._socket.recv(size)
+
+        except socket.timeout:
+            return b''
+
+        # 상대편에서 연결을 끊은 경우
+        if len(dataArray) == 0:
+            self.close()
+
+        return dataArray
+
+
+    def write(self, dataArray):
+        self._socket.sendall(dataArray)
+        return len(dataArray)
+
+
+    def fileno(self):
+        if self._socket != None:
+            return self._socket.fileno()
+        else:
+            return None
+
+
+    def cancelRead(self):
+        if self._socket != None:
+            try:
+                self._socket.shutdown(socket.SHUT_RD)
+            except OSError:
+                pass
+
+
+# TcpTransport End
+
+
+
+# PtyTransport Start
+
+
+# 가상 터미널(pty) 연결(POSIX 전용)
+# open() 후 portname에 표시된 장치를 시뮬레이터 등에서 시리얼 포트처럼 열어서 사용
+class PtyTransport(ITransport):
+
+    def __init__(self, timeout = 0.01):
+        self.timeout        = timeout
+        self.portname       = None
+
+        self._fdMaster      = None
+        self._fdSlave       = None
+        self._fdWakeRead    = None      # cancelRead()에서 select() 대기를 깨우는데 사용
+        self._fdWakeWrite   = None
+
+
+    def open(self):
+        import tty
+
+        self._fdMaster, self._fdSlave = os.openpty()
+        tty.setraw(self._fdMaster)
+        tty.setraw(self._fdSlave)
+
+        self._fdWakeRead, self._fdWakeWrite = os.pipe()
+
+        self.portname = os.ttyname(self._fdSlave)
+
+        return True
+
+
+    def close(self):
+        if self._fdMaster != None:
+            os.close(self._fdMaster)
+            os.close(self._fdSlave)
+            os.close(self._fdWakeRead)
+            os.close(self._fdWakeWrite)
+            self._fdMaster      = None
+            self._fdSlave       = None
+            self._fdWakeRead    = None
+            self._fdWakeWrite   = None
+
+
+    def isOpen(self):
+        return self._fdMaster != None
+
+
+    def read(self, size):
+        readable, _, _ = select.select([self._fdMaster, self._fdWakeRead], [], [], self.timeout)
+
+        if self._fdWakeRead in readable:
+            os.read(self._fdWakeRead, 4096)
+            return b''
+
+        if len(readable) == 0:
+            return b''
+
+        return os.read(self._fdMaster, size)
+
+
+    def write(self, dataArray):
+        return os.write(self._fdMaster, dataArray)
+
+
+    def fileno(self):
+        return self._fdMaster
+
+
+    def cancelRead(self):
+        if self._fdWakeWrite != None:
+            os.write(self._fdWakeWrite, b'\x00')
+
+
+# PtyTransport End
+
+
+
+# LoopbackTransport Start
+
+
+# 메모리 연결
+# peer를 지정하지 않으면 자기 자신에게 쓴 데이터를 다시 읽음
+# LoopbackTransport.pair()는 서로 연결된 두 개의 LoopbackTransport를 생성
+class LoopbackTransport(ITransport):
+
+    def __init__(self, peer = None, timeout = 0.01):
+        self.peer           = peer if peer != None else self
+        self.timeout        = timeout
+
+        self._buffer        = bytearray()
+        self._condition     = threading.Condition()
+        self._flagOpen      = False
+
+
+    @classmethod
+    def pair(cls, timeout = 0.01):
+        a       = cls(None, timeout)
+        b       = cls(a, timeout)
+        a.peer  = b
+        return a, b
+
+
+    def open(self):
+        self._flagOpen = True
+        return True
+
+
+    def close(self):
+        with self._condition:
+            self._flagOpen = False
+            self._condition.notify_all()
+
+
+    def isOpen(self):
+        return self._flagOpen
+
+
+    def read(self, size):
+        with self._condition:
+            if (len(self._buffer) == 0) and self._flagOpen:
+                self._condition.wait(self.timeout)
+
+            dataArray = bytes(self._buffer[0:size])
+            del self._buffer[0:size]
+
+        return dataArray
+
+
+    def write(self, dataArray):
+        self.peer._receive(dataArray)
+        return len(dataArray)
+
+
+    def cancelRead(self):
+        with self._condition:
+            self._condition.notify_all()
+
+
+    def _receive(self, dataArray):
+        with self._condition:
+            self._buffer.extend(dataArray)
+            self._condition.notify_all()
+
+
+# LoopbackTransport End
@@ -0,0 +1,49 @@
+# DataType, DeviceType 변환 시간 측정
+# Enum 생성자를 try/except로 호출하던 이전 방식과 256개 항목의 변환 표(tableDataType, tableDeviceType)를 비교
+#
+# python benchmarks/bench_enum_table.py
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from CodingRider.protocol import DataType, DeviceType, tableDataType, tableDeviceType
+
+
+
+# 이전 방식
+def convertEnum(enumType, value):
+    try:
+        return enumType(value)
+    except ValueError:
+        return None
+
+
+
+def measure(statement, listValue, number, **kwargs):
+    time = timeit.timeit(statement, number = number, globals = dict(kwargs, listValue = listValue, convertEnum = convertEnum))
+    return time / (number * len(listValue)) * 1e9
+
+
+
+def main():
+
+    number = 200
+
+    for enumType, table in ((DataType, tableDataType), (DeviceType, tableDeviceType)):
+
+        listAll     = list(range(256))
+        listValid   = [value for value in listAll if table[value] != None]
+
+        for name, listValue in (("all 256 values", listAll), ("valid values only", listValid)):
+            timeEnum    = measure("[convertEnum(enumType, value) for value in listValue]", listValue, number, enumType = enumType)
+            timeTable   = measure("[table[value] for value in listValue]", listValue, number, table = table)
+
+            print("{0:<10} {1:<18} Enum(v) + try/except {2:8.1f} ns/lookup, table[v] {3:6.1f} ns/lookup".format(enumType.__name__, name, timeEnum, timeTable))
+
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+# 수신 버퍼의 바이트당 처리 시간 측정
+# 쌓여 있는 수신 데이터(backlog)가 커져도 ReceiveBuffer의 바이트당 처리 시간이 일정한지 확인
+# bytearray.pop(0)로 한 바이트씩 꺼내는 이전 방식과 비교
+#
+# python benchmarks/bench_receive_buffer.py
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from CodingRider.crc import CRC16
+from CodingRider.protocol import DataType, DeviceType, Motion
+from CodingRider.receiver import ReceiveBuffer, Receiver, StateLoading
+
+
+
+def makeFrame(payload):
+    body    = bytes((DataType.Motion.value, len(payload), DeviceType.Drone.value, DeviceType.Base.value)) + payload
+    crc     = CRC16.calc(body, 0)
+    return b'\x0A\x55' + body + bytes((crc & 0xFF, crc >> 8))
+
+
+
+def makeBacklog(size):
+    frame       = makeFrame(bytes(range(Motion.getSize())))
+    count       = max(size // len(frame), 1)
+    return frame * count
+
+
+
+# 이전 방식: 쌓인 데이터를 pop(0)로 한 바이트씩 꺼냄
+def drainPop(dataArray):
+    buffer = bytearray(dataArray)
+
+    timeStart = time.perf_counter()
+    while len(buffer) > 0:
+        buffer.pop(0)
+
+    return time.perf_counter() - timeStart
+
+
+
+# ReceiveBuffer: 512 바이트 단위로 들어온 데이터를 decode()로 처리하고 consume()으로 삭제
+def drainReceiveBuffer(dataArray, sizeChunk = 512):
+    bufferReceive   = ReceiveBuffer()
+    receiver        = Receiver()
+    countFrame      = 0
+
+    timeStart = time.perf_counter()
+
+    for index in range(0, len(dataArray), sizeChunk):
+        bufferReceive.write(dataArray[index:index + sizeChunk], 0)
+
+    for state in receiver.decode(bufferReceive.buffer, bufferReceive.indexRead, bufferReceive.indexWrite, bufferReceive.timestamps):
+        if state == StateLoading.Loaded:
+            countFrame += 1
+
+    bufferReceive.consume(receiver.indexDecode - bufferReceive.indexRead)
+
+    return time.perf_counter() - timeStart, countFrame
+
+
+
+# 수신 데이터가 계속 들어오는 동안 backlog 크기만큼 쌓인 상태를 유지하며 처리(compaction 발생)
+def streamReceiveBuffer(sizeBacklog, sizeTotal, sizeChunk = 512):
+    frame           = makeFrame(bytes(range(Motion.getSize())))
+    chunk           = frame * max(sizeChunk // len(frame), 1)
+    bufferReceive   = ReceiveBuffer()
+    receiver        = Receiver()
+    sizeWritten     = 0
+
+    timeStart = time.perf_counter()
+
+    while sizeWritten < sizeTotal:
+        bufferReceive.write(chunk, 0)
+        sizeWritten += len(chunk)
+
+        if len(bufferReceive) < sizeBacklog:
+            continue
+
+        # backlog 중 chunk 크기만큼만 처리
+        for state in receiver.decode(bufferReceive.buffer, bufferReceive.indexRead, bufferReceive.indexRead + len(chunk), bufferReceive.timestamps):
+            pass
+
+        bufferReceive.consume(receiver.indexDecode - bufferReceive.indexRead)
+
+    return time.perf_counter() - timeStart, sizeWritten
+
+
+
+def main():
+
+    print("backlog(B)   pop(0) drain(ns/B)   ReceiveBuffer decode(ns/B)   stream with backlog(ns/B)")
+
+    for sizeBacklog in (2048, 20480, 204800, 2048000):
+        dataArray = makeBacklog(sizeBacklog)
+
+        if len(dataArray) <= 204800:
+            timePop = "{0:10.1f}".format(drainPop(dataArray) / len(dataArray) * 1e9)
+        else:
+            timePop = "{0:>10}".format("-")
+
+        timeDecode, countFrame  = drainReceiveBuffer(dataArray)
+        timeStream, sizeStream  = streamReceiveBuffer(len(dataArray), 4 * 1024 * 1024)
+
+        print("{0:10}   {1}           {2:10.1f}                  {3:10.1f}".format(
+            len(dataArray), timePop, timeDecode / len(dataArray) * 1e9, timeStream / sizeStream * 1e9))
+
+
+
+if __name__ == '__main__':
+    main()
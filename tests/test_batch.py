@@ -0,0 +1,108 @@
+import threading
+
+from CodingRider.drone import Drone, TransferBatch
+from CodingRider.protocol import DataType, DeviceType, Header, Trim
+from CodingRider.receiver import Receiver, StateLoading
+from CodingRider.transport import LoopbackTransport
+
+
+
+# write() 호출별 데이터를 기록
+class RecordTransport(LoopbackTransport):
+
+    def __init__(self):
+        super().__init__()
+        self.listWrite  = []
+        self.lock       = threading.Lock()
+
+    def write(self, dataArray):
+        with self.lock:
+            self.listWrite.append(bytes(dataArray))
+        return len(dataArray)
+
+
+
+def openDrone():
+    transport   = RecordTransport()
+    drone       = Drone(False, flagTransferBackground = False)
+    assert drone.open(transport = transport)
+    return drone, transport
+
+
+
+def decodeTrim(dataArray):
+    receiver = Receiver()
+    return [Trim.parse(bytes(receiver.data)).roll for state in receiver.decode(dataArray) if state == StateLoading.Loaded]
+
+
+
+def test_add_packs_immediately():
+    drone, transport = openDrone()
+
+    header          = Header()
+    header.dataType = DataType.Trim
+    header.length   = Trim.getSize()
+    header.from_    = DeviceType.Base
+    header.to_      = DeviceType.Drone
+
+    trim    = Trim()
+    batch   = TransferBatch(drone)
+
+    # 같은 객체를 재사용
+    for roll in range(5):
+        trim.roll = roll
+        assert batch.add(header, trim)
+
+    trim.roll = 100
+    batch.flush()
+    drone.close()
+
+    assert len(transport.listWrite) == 1
+    assert decodeTrim(transport.listWrite[0]) == [0, 1, 2, 3, 4]
+
+
+
+def test_nested_batch():
+    drone, transport = openDrone()
+
+    with drone.batch():
+        drone.sendTrim(1, 0, 0, 0)
+
+        with drone.batch() as batchInner:
+            drone.sendTrim(2, 0, 0, 0)
+            assert len(batchInner) == 1
+
+        drone.sendTrim(3, 0, 0, 0)
+
+    drone.sendTrim(4, 0, 0, 0)
+    drone.close()
+
+    assert len(transport.listWrite) == 2
+    assert decodeTrim(transport.listWrite[0]) == [1, 2, 3]
+    assert decodeTrim(transport.listWrite[1]) == [4]
+
+
+
+def test_batch_per_thread():
+    drone, transport = openDrone()
+
+    barrier = threading.Barrier(2)
+
+    def run(roll):
+        with drone.batch() as batch:
+            barrier.wait()
+            for i in range(10):
+                drone.sendTrim(roll, 0, 0, 0)
+            barrier.wait()
+            assert len(batch) == 10
+
+    listThread = [threading.Thread(target = run, args = (roll,)) for roll in (1, 2)]
+    for thread in listThread:
+        thread.start()
+    for thread in listThread:
+        thread.join()
+
+    drone.sendTrim(3, 0, 0, 0)
+    drone.close()
+
+    assert sorted(decodeTrim(dataArray) for dataArray in transport.listWrite) == [[1] * 10, [2] * 10, [3]]
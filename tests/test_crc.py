@@ -0,0 +1,76 @@
+import random
+from binascii import crc_hqx
+
+from CodingRider.crc import CRC16, CRC16Stream
+
+
+
+# 표를 사용하는 기존 계산 방식(기준값)
+def calcTable(data, crc):
+    for byte in data:
+        index   = ((crc >> 8) ^ byte) & 0x00FF
+        crc     = ((crc << 8) ^ CRC16.table[index]) & 0xFFFF
+    return crc
+
+
+
+def makeVectors():
+    r = random.Random(4)
+    vectors = [b'', b'\x00', b'\xFF', b'\x0A\x55', bytes(range(256))]
+    vectors += [bytes(r.randrange(256) for i in range(r.randrange(1, 200))) for j in range(50)]
+    return vectors
+
+
+
+def test_check_value():
+    assert CRC16.calc(b'123456789', 0) == 0x31C3
+    assert crc_hqx(b'123456789', 0) == 0x31C3
+    assert calcTable(b'123456789', 0) == 0x31C3
+
+
+
+def test_calc_matches_table_for_every_type():
+    for data in makeVectors():
+        for crc in (0, 1, 0x1D0F, 0x8005, 0xFFFF):
+            expected = calcTable(data, crc)
+
+            assert crc_hqx(data, crc) == expected
+            assert CRC16.calc(bytes(data), crc) == expected
+            assert CRC16.calc(bytearray(data), crc) == expected
+            assert CRC16.calc(memoryview(data), crc) == expected
+            assert CRC16.calc(list(data), crc) == expected
+
+
+
+def test_calc_single_byte():
+    for byte in range(256):
+        for crc in (0, 0x1234, 0xFFFF):
+            assert CRC16.calc(byte, crc) == calcTable(bytes((byte,)), crc)
+
+
+
+def test_stream_split_equals_one_shot():
+    r = random.Random(7)
+
+    for data in makeVectors():
+        for crc in (0, 0xFFFF):
+            stream  = CRC16Stream(crc)
+            index   = 0
+
+            while index < len(data):
+                size = r.randrange(1, 17)
+                stream.update(memoryview(data)[index:index + size])
+                index += size
+
+            assert stream.crc == CRC16.calc(data, crc)
+            assert stream.digest() == bytes((stream.crc & 0xFF, stream.crc >> 8))
+
+
+
+def test_verify_frame():
+    payload     = bytes((0x44, 4, 0x10, 0x70, 1, 2, 3, 4))
+    crc         = CRC16.calc(payload, 0)
+    frame       = b'\x0A\x55' + payload + bytes((crc & 0xFF, crc >> 8))
+
+    assert CRC16.verifyFrame(frame)
+    assert not CRC16.verifyFrame(frame[:-1] + bytes((frame[-1] ^ 1,)))
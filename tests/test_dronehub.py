@@ -0,0 +1,44 @@
+import os
+import time
+
+from CodingRider.drone import Drone
+from CodingRider.dronehub import DroneHub
+from CodingRider.transport import PtyTransport
+
+
+
+# read()에서 예외가 발생하지만 포트는 열려 있다고 나오는 통신 경로(USB 분리 등)
+class BrokenPtyTransport(PtyTransport):
+
+    def read(self, size):
+        raise OSError("device reports readiness to read but returned no data")
+
+
+
+def test_poll_drops_drone_when_read_raises():
+    hub         = DroneHub()
+    drone       = Drone(False, flagTransferBackground = False)
+    transport   = BrokenPtyTransport()
+
+    assert hub.add(drone, transport = transport)
+
+    fd = os.open(transport.portname, os.O_RDWR)
+    try:
+        os.write(fd, b'\x0A\x55')
+
+        # add()에서 보낸 wake 신호가 먼저 처리될 수 있음
+        timeEnd = time.perf_counter() + 1
+        while transport.isOpen() and (time.perf_counter() < timeEnd):
+            hub.poll(0.1)
+
+        assert not transport.isOpen()
+        assert all(key.data is not drone for key in hub._selector.get_map().values())
+
+        # 더 이상 이벤트가 없으므로 timeout 동안 대기
+        timeStart = time.perf_counter()
+        assert hub.poll(0.1) == 0
+        assert time.perf_counter() - timeStart >= 0.09
+
+    finally:
+        os.close(fd)
+        hub.close()
@@ -0,0 +1,92 @@
+from CodingRider.crc import CRC16
+from CodingRider.drone import Drone
+from CodingRider.protocol import *
+from CodingRider.receiver import ReceiveStatus
+from CodingRider.storage import Parser
+
+
+
+def makeFrame(dataType, payload, from_ = DeviceType.Drone, to_ = DeviceType.Base):
+    body    = bytes((dataType, len(payload), from_.value, to_.value)) + bytes(payload)
+    crc     = CRC16.calc(body, 0)
+    return b'\x0A\x55' + body + bytes((crc & 0xFF, crc >> 8))
+
+
+
+def test_parser_covers_message_classes():
+    parser = Parser()
+
+    for dataType, listClass in dictMessage.items():
+        assert parser.c[dataType][:len(listClass)] == listClass
+
+
+
+def test_parser_dispatch_by_length():
+    parser = Parser()
+
+    for dataType in DataType:
+        listClass = parser.c[dataType]
+
+        if len(listClass) < 2:
+            continue
+
+        for cls in listClass:
+            data = parser.d[dataType](bytes(cls.getSize()))
+
+            # 길이가 같은 구조가 있으면 먼저 등록된 클래스를 사용
+            assert type(data) is next(other for other in listClass if other.getSize() == cls.getSize())
+
+        # 등록된 구조와 길이가 다르면 None
+        assert parser.d[dataType](bytes(200)) == None
+
+    assert type(parser.d[DataType.Control](bytes(4))) is ControlQuad8
+    assert type(parser.d[DataType.Control](bytes(5))) is ControlQuad8AndRequestData
+    assert type(parser.d[DataType.Control](bytes(12))) is ControlPosition16
+    assert type(parser.d[DataType.Control](bytes(20))) is ControlPosition
+    assert type(parser.d[DataType.Motor](bytes(3))) is MotorSingleV
+
+
+
+def test_parser_register():
+    parser = Parser()
+
+    class Control3(ISerializable):
+        schema = Schema(None, (
+            ('value0', 'b'),
+            ('value1', 'b'),
+            ('value2', 'b'),
+        ))
+
+    assert parser.d[DataType.Control](bytes(3)) == None
+
+    parser.register(DataType.Control, Control3)
+    assert type(parser.d[DataType.Control](bytes(3))) is Control3
+    assert type(parser.d[DataType.Control](bytes(4))) is ControlQuad8
+
+
+
+def test_unknown_data_type_is_error_by_default():
+    drone = Drone(False)
+    drone._bufferQueue.put((0, makeFrame(0x99, b'\x01\x02\x03')))
+
+    assert drone.checkBatch() == []
+    assert drone._receiver.countStatus[ReceiveStatus.ErrorDataType] == 1
+
+
+
+def test_passthrough_is_opt_in():
+    drone       = Drone(False)
+    listData    = []
+    drone.setEventHandlerPassthrough(lambda header, dataArray: listData.append((header.dataType, dataArray)))
+
+    drone._bufferQueue.put((0, makeFrame(0x99, b'\x01\x02\x03') + makeFrame(DataType.Ping.value, bytes(8))))
+
+    assert drone.checkBatch() == [0x99, DataType.Ping]
+    assert listData == [(0x99, b'\x01\x02\x03')]
+
+    # 해제하면 다시 오류로 처리
+    drone.setEventHandlerPassthrough(None)
+    drone._bufferQueue.put((0, makeFrame(0x99, b'\x01\x02\x03')))
+
+    assert drone.checkBatch() == []
+    assert listData == [(0x99, b'\x01\x02\x03')]
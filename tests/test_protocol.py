@@ -0,0 +1,50 @@
+from CodingRider.drone import Drone, FrameTemplate
+from CodingRider.protocol import *
+
+
+
+def makeFrame(data, from_ = DeviceType.Base, to_ = DeviceType.Drone):
+    header          = Header()
+    header.dataType = data.schema.dataType
+    header.length   = data.getSize()
+    header.from_    = from_
+    header.to_      = to_
+
+    return bytes(Drone.makeTransferDataArray(None, header, data))
+
+
+
+def test_frame_template_uses_schema():
+    control             = ControlQuad8()
+    control.roll        = -10
+    control.pitch       = 20
+    control.yaw         = -30
+    control.throttle    = 40
+    assert FrameTemplate(ControlQuad8.schema).make(-10, 20, -30, 40) == makeFrame(control)
+
+    position                    = ControlPosition()
+    position.positionX          = 1.5
+    position.positionY          = -2.0
+    position.positionZ          = 0.25
+    position.velocity           = 0.5
+    position.heading            = -90
+    position.rotationalVelocity = 30
+    assert FrameTemplate(ControlPosition.schema).make(1.5, -2.0, 0.25, 0.5, -90, 30) == makeFrame(position)
+
+    request             = Request()
+    request.dataType    = DataType.Motion
+    assert FrameTemplate(Request.schema, DeviceType.Base, DeviceType.Controller).make(DataType.Motion.value) == makeFrame(request, to_ = DeviceType.Controller)
+
+
+
+def test_enum_tables_match_enum():
+    for enumType, table in ((DataType, tableDataType), (DeviceType, tableDeviceType)):
+        assert len(table) == 256
+
+        for value in range(256):
+            try:
+                expected = enumType(value)
+            except ValueError:
+                expected = None
+
+            assert table[value] == expected
@@ -0,0 +1,70 @@
+from CodingRider.receiver import ReceiveBuffer
+
+
+
+# compaction에서 옮긴 바이트 수를 기록
+class CountingBuffer(ReceiveBuffer):
+
+    def __init__(self, capacity = 4096):
+        super().__init__(capacity)
+        self.sizeMoved      = 0
+        self.countCompact   = 0
+
+    def _compact(self, sizeRequired):
+        self.sizeMoved      += len(self)
+        self.countCompact   += 1
+        super()._compact(sizeRequired)
+
+
+
+def runStream(sizeBacklog, sizeTotal, sizeChunk = 500):
+    buffer      = CountingBuffer()
+    chunk       = bytes(range(250)) * (sizeChunk // 250)
+    sizeWritten = 0
+
+    while sizeWritten < sizeTotal:
+        buffer.write(chunk, sizeWritten)
+        sizeWritten += len(chunk)
+
+        # backlog 크기를 유지하면서 앞에서부터 처리
+        if len(buffer) > sizeBacklog:
+            buffer.consume(len(buffer) - sizeBacklog)
+
+    return buffer, sizeWritten
+
+
+
+def test_write_consume_keeps_order():
+    buffer  = ReceiveBuffer(16)
+    data    = bytes(range(256)) * 4
+    output  = bytearray()
+
+    for index in range(0, len(data), 7):
+        buffer.write(data[index:index + 7], index)
+        size = min(len(buffer), 5)
+        output += buffer.view()[:size]
+        buffer.consume(size)
+
+    output += buffer.view()
+    assert bytes(output) == data
+
+
+
+def test_compaction_cost_is_bounded():
+    # 처리 시간 대신 compaction에서 옮긴 바이트 수로 확인(수신한 바이트당 일정 횟수 이내로만 옮겨야 함)
+    for sizeBacklog in (2000, 20000, 200000):
+        buffer, sizeWritten = runStream(sizeBacklog, 4000000)
+
+        assert buffer.sizeMoved <= sizeWritten
+        assert len(buffer.buffer) <= 4 * (sizeBacklog + 500)
+
+
+
+def test_timestamps_follow_compaction():
+    buffer, sizeWritten = runStream(2000, 100000)
+
+    # 남아 있는 데이터 묶음의 끝 위치는 읽기 위치 이후이고 쓰기 위치 이내
+    listIndexEnd = [timestamp[0] for timestamp in buffer.timestamps]
+    assert listIndexEnd == sorted(listIndexEnd)
+    assert buffer.indexRead < listIndexEnd[0]
+    assert listIndexEnd[-1] == buffer.indexWrite
@@ -0,0 +1,133 @@
+import threading
+import time
+
+from CodingRider.receiver import OverflowPolicy, ReceiveQueue
+
+
+
+def makeItem(index, size = 4):
+    return (index, bytes([index]) * size)
+
+
+
+def test_put_get_all():
+    queue = ReceiveQueue(100)
+
+    for index in range(5):
+        assert queue.put(makeItem(index))
+
+    assert len(queue) == 20
+    assert queue.getAll() == [makeItem(index) for index in range(5)]
+    assert queue.empty()
+    assert queue.statistics.size == 0
+    assert queue.statistics.sizeHighWater == 20
+
+
+
+def test_drop_newest():
+    queue = ReceiveQueue(8, OverflowPolicy.DropNewest)
+
+    assert queue.put(makeItem(1))
+    assert queue.put(makeItem(2))
+    assert not queue.put((3, b'\x0A\x55\x00\x00'))
+
+    assert queue.getAll() == [makeItem(1), makeItem(2)]
+    assert queue.statistics.countDroppedByte == 4
+    assert queue.statistics.countDroppedFrame == 1
+
+
+
+def test_drop_oldest():
+    queue = ReceiveQueue(8, OverflowPolicy.DropOldest)
+
+    assert queue.put((1, b'\x0A\x55\x0A\x55'))
+    assert queue.put(makeItem(2))
+    assert queue.put(makeItem(3))
+
+    assert queue.getAll() == [makeItem(2), makeItem(3)]
+    assert queue.statistics.countDroppedByte == 4
+    assert queue.statistics.countDroppedFrame == 2
+
+
+
+def test_spill():
+    queue = ReceiveQueue(8, OverflowPolicy.Spill, 16)
+
+    for index in range(4):
+        assert queue.put(makeItem(index))
+
+    # sizeQueue를 넘은 8 바이트는 추가 공간에 저장
+    assert len(queue) == 16
+    assert queue.statistics.countSpilledByte == 8
+    assert queue.statistics.countDroppedByte == 0
+
+    # sizeSpill을 넘으면 가장 오래된 데이터를 버림
+    assert queue.put(makeItem(4))
+    assert queue.getAll() == [makeItem(index) for index in range(1, 5)]
+    assert queue.statistics.countDroppedByte == 4
+    assert queue.statistics.countSpilledByte == 12
+    assert queue.statistics.sizeHighWater == 16
+
+
+
+def test_spill_size_is_at_least_queue_size():
+    queue = ReceiveQueue(16, OverflowPolicy.Spill, 4)
+    assert queue.sizeSpill == 16
+
+
+
+def test_block_waits_for_get_all():
+    queue = ReceiveQueue(8, OverflowPolicy.Block)
+
+    assert queue.put(makeItem(1))
+    assert queue.put(makeItem(2))
+
+    listResult  = []
+    thread      = threading.Thread(target = lambda: listResult.append(queue.put(makeItem(3))))
+    thread.start()
+
+    time.sleep(0.05)
+    assert thread.is_alive()
+    assert queue.statistics.countBlocked == 1
+
+    assert queue.getAll() == [makeItem(1), makeItem(2)]
+    thread.join(1)
+
+    assert listResult == [True]
+    assert queue.getAll() == [makeItem(3)]
+    assert queue.statistics.countDroppedByte == 0
+
+
+
+def test_block_accepts_large_item_when_empty():
+    queue = ReceiveQueue(8, OverflowPolicy.Block)
+
+    assert queue.put(makeItem(1, 20))
+    assert len(queue) == 20
+
+
+
+def test_cancel_releases_blocked_put():
+    queue = ReceiveQueue(4, OverflowPolicy.Block)
+    assert queue.put(makeItem(1))
+
+    listResult  = []
+    thread      = threading.Thread(target = lambda: listResult.append(queue.put((2, b'\x0A\x55\x00\x00'))))
+    thread.start()
+
+    time.sleep(0.05)
+    queue.cancel()
+    thread.join(1)
+
+    assert listResult == [False]
+    assert queue.statistics.countDroppedByte == 4
+    assert queue.statistics.countDroppedFrame == 1
+
+    # cancel() 이후에는 기다리지 않고 버림
+    assert not queue.put(makeItem(3))
+
+    # resume() 이후에는 다시 기다림
+    queue.resume()
+    queue.getAll()
+    assert queue.put(makeItem(4))
+    assert queue.getAll() == [makeItem(4)]
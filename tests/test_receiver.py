@@ -0,0 +1,224 @@
+import random
+
+from CodingRider.crc import CRC16
+from CodingRider.protocol import DataType, DeviceType
+from CodingRider.receiver import ReceiveBuffer, Receiver, ReceiveStatus, StateLoading
+
+
+
+def makeFrame(payload, dataType = DataType.Motion):
+    body    = bytes((dataType.value, len(payload), DeviceType.Drone.value, DeviceType.Base.value)) + bytes(payload)
+    crc     = CRC16.calc(body, 0)
+    return b'\x0A\x55' + body + bytes((crc & 0xFF, crc >> 8))
+
+
+
+def makeStream(count, seed = 1, flagNoise = True):
+    r           = random.Random(seed)
+    dataArray   = bytearray()
+    listPayload = []
+
+    for i in range(count):
+        payload = bytes(r.randrange(256) for j in range(r.choice((8, 12, 18))))
+        listPayload.append(payload)
+
+        if flagNoise and r.random() < 0.3:
+            dataArray += bytes(r.randrange(256) for j in range(r.randrange(1, 5)))
+
+        dataArray += makeFrame(payload)
+
+    return bytes(dataArray), listPayload
+
+
+
+# 한 번에 전달할 데이터를 size 단위로 나누어 decode()에 전달
+def decodeChunks(receiver, dataArray, size, clock = None):
+    buffer      = bytearray()
+    listPayload = []
+
+    for index in range(0, len(dataArray), size):
+        buffer += dataArray[index:index + size]
+
+        for state in receiver.decode(buffer):
+            if state == StateLoading.Loaded:
+                listPayload.append(bytes(receiver.data))
+
+        del buffer[:receiver.indexDecode]
+
+    return listPayload
+
+
+
+def test_decode_clean_stream():
+    dataArray, listPayload = makeStream(200, flagNoise = False)
+
+    receiver = Receiver()
+    assert [bytes(receiver.data) for state in receiver.decode(dataArray) if state == StateLoading.Loaded] == listPayload
+    assert receiver.countDiscarded == 0
+    assert receiver.countRecovered == 0
+
+
+
+def test_decode_resync_through_noise():
+    dataArray, listPayload = makeStream(300, seed = 3)
+
+    for size in (1, 7, 64, len(dataArray)):
+        assert decodeChunks(Receiver(), dataArray, size) == listPayload
+
+
+
+def test_decode_matches_call():
+    dataArray, listPayload = makeStream(100, seed = 5)
+
+    receiver    = Receiver()
+    listCall    = []
+    for data in dataArray:
+        if receiver.call(data) == StateLoading.Loaded:
+            listCall.append(bytes(receiver.data))
+            receiver.checked()
+
+    assert listCall == listPayload
+    assert decodeChunks(Receiver(), dataArray, 16) == listPayload
+
+
+
+def test_decode_recovers_frame_inside_broken_frame():
+    payload = bytes(range(8))
+    frame   = makeFrame(payload)
+
+    # 길이가 큰 헤더 뒤에 실제 프레임이 이어지는 경우
+    broken      = b'\x0A\x55' + bytes((DataType.Motion.value, 40, DeviceType.Drone.value, DeviceType.Base.value))
+    padding     = bytes(40 + 2 - len(frame))
+    receiver    = Receiver()
+    states      = []
+    listPayload = []
+    for state in receiver.decode(broken + frame + padding):
+        states.append(state)
+        if state == StateLoading.Loaded:
+            listPayload.append(bytes(receiver.data))
+
+    assert listPayload == [payload]
+    assert states[0] == StateLoading.Failure
+    assert receiver.countStatus[ReceiveStatus.ErrorCrc] == 1
+    assert receiver.countRecovered == len(frame)
+
+
+
+def test_decode_crc_error_skips_frame():
+    frameBad    = bytearray(makeFrame(bytes(8)))
+    frameBad[-1] ^= 0xFF
+    frameGood   = makeFrame(bytes(range(8)))
+
+    receiver    = Receiver()
+    listPayload = [bytes(receiver.data) for state in receiver.decode(bytes(frameBad) + frameGood) if state == StateLoading.Loaded]
+
+    assert listPayload == [bytes(range(8))]
+    assert receiver.countStatus[ReceiveStatus.ErrorCrc] == 1
+    assert receiver.countRecovered == 0
+
+
+
+class Clock:
+
+    def __init__(self):
+        self.time = 0.0
+
+    def __call__(self):
+        return self.time
+
+
+
+def test_decode_timeout_does_not_count_recovered():
+    payload = bytes(range(12))
+    frame   = makeFrame(payload)
+    clock   = Clock()
+
+    receiver    = Receiver(clock)
+    buffer      = bytearray(frame[:10])
+    assert list(receiver.decode(buffer)) == []
+    assert receiver.state == StateLoading.Receiving
+    del buffer[:receiver.indexDecode]
+
+    # 시간 초과 후 나머지 데이터와 정상 프레임이 이어서 들어옴
+    clock.time  = 1.0
+    buffer      += frame[10:] + frame + frame
+    listPayload = []
+    states      = []
+    for state in receiver.decode(buffer):
+        states.append(state)
+        if state == StateLoading.Loaded:
+            listPayload.append(bytes(receiver.data))
+
+    assert states[0] == StateLoading.Failure
+    assert receiver.countStatus[ReceiveStatus.TimeOver] == 1
+    assert listPayload == [payload, payload]
+    assert receiver.countRecovered == 0
+
+
+
+def test_decode_timeout_without_header():
+    frame   = makeFrame(bytes(8))
+    clock   = Clock()
+
+    receiver    = Receiver(clock)
+    buffer      = bytearray(frame[:3])
+    assert list(receiver.decode(buffer)) == []
+    del buffer[:receiver.indexDecode]
+
+    clock.time  = 1.0
+    buffer      += frame
+    listPayload = [bytes(receiver.data) for state in receiver.decode(buffer) if state == StateLoading.Loaded]
+
+    assert listPayload == [bytes(8)]
+    assert receiver.countStatus[ReceiveStatus.TimeOver] == 1
+    assert receiver.countRecovered == 0
+
+
+
+def test_decode_uses_chunk_time():
+    dataArray, listPayload = makeStream(50, seed = 9)
+
+    bufferReceive   = ReceiveBuffer()
+    listTimeEnd     = []
+    for index in range(0, len(dataArray), 5):
+        bufferReceive.write(dataArray[index:index + 5], index / 1000)
+
+    receiver    = Receiver()
+    listTime    = []
+    for state in receiver.decode(bufferReceive.buffer, bufferReceive.indexRead, bufferReceive.indexWrite, bufferReceive.timestamps):
+        if state == StateLoading.Loaded:
+            listTime.append(receiver.frame.timeReceived)
+
+    # 프레임의 마지막 바이트가 들어있는 데이터 묶음의 수신 시각
+    indexEnd = 0
+    for payload in listPayload:
+        indexEnd = dataArray.find(makeFrame(payload), indexEnd) + len(payload) + 8
+        listTimeEnd.append(((indexEnd - 1) // 5 * 5) / 1000)
+
+    assert listTime == listTimeEnd
+
+
+
+def test_decode_memoryview_in_place():
+    dataArray, listPayload = makeStream(100, seed = 11)
+
+    buffer      = bytearray(b'\xFF' * 10 + dataArray + b'\xFF' * 10)
+    view        = memoryview(buffer)[10:10 + len(dataArray)]
+    receiver    = Receiver()
+    listLoaded  = []
+
+    for state in receiver.decode(view):
+        if state == StateLoading.Loaded:
+            # 프레임 데이터는 전달한 버퍼를 직접 가리킴
+            assert receiver.data.obj is buffer
+            listLoaded.append(bytes(receiver.data))
+
+    assert listLoaded == listPayload
+    assert receiver.indexDecode == len(dataArray)
+
+    # 다른 형식의 memoryview와 list도 처리
+    receiver = Receiver()
+    assert [bytes(receiver.data) for state in receiver.decode(memoryview(dataArray).cast('c')) if state == StateLoading.Loaded] == listPayload
+
+    receiver = Receiver()
+    assert [bytes(receiver.data) for state in receiver.decode(list(makeFrame(bytes(8)))) if state == StateLoading.Loaded] == [bytes(8)]
@@ -0,0 +1,315 @@
+import pytest
+
+from CodingRider.protocol import *
+
+
+
+# 수정 전(schema 도입 전) protocol.py의 parse(), toArray()로 만든 값
+# (클래스 이름, 전송 데이터, 값 목록(하위 클래스 필드는 풀어 쓰고 Enum은 숫자로))
+VECTORS = [
+    ('Header',                                bytes.fromhex('07b3a110'),
+        (7, 179, 161, 16)),
+    ('Ping',                                  bytes.fromhex('6cf11e8bac60825b'),
+        (6593939098608529772,)),
+    ('Ack',                                   bytes.fromhex('ac8f8d29bd7509265138db'),
+        (2740851303538069420, 81, 56120)),
+    ('Error',                                 bytes.fromhex('dc496d2eac3a5bafa0540d112b14da97'),
+        (12635757690705758684, 286086304, 2547651627)),
+    ('Request',                               bytes.fromhex('71'),
+        (113,)),
+    ('RequestOption',                         bytes.fromhex('64902fd3ca'),
+        (100, 3402837904)),
+    ('SystemInformation',                     bytes.fromhex('bb2bebb58d1bef3b'),
+        (3052088251, 1005525901)),
+    ('Version',                               bytes.fromhex('1df270f4'),
+        (61981, 112, 244)),
+    ('Information',                           bytes.fromhex('0301100b00c0373f8a5f401565'),
+        (3, 724993, 14272, 63, 138, 16479, 21, 101)),
+    ('UpdateLocation',                        bytes.fromhex('1429'),
+        (10516,)),
+    ('ResponseRate',                          bytes.fromhex('5a'),
+        (90,)),
+    ('Rssi',                                  bytes.fromhex('b0'),
+        (-80,)),
+    ('Command',                               bytes.fromhex('03bb'),
+        (3, 187)),
+    ('ControlQuad8',                          bytes.fromhex('6f84bbb7'),
+        (111, -124, -69, -73)),
+    ('ControlQuad8AndRequestData',            bytes.fromhex('efbf2c5c64'),
+        (-17, -65, 44, 92, 100)),
+    ('ControlPosition16',                     bytes.fromhex('e6201dc1855bc947197ab712'),
+        (8422, -16099, 23429, 18377, 31257, 4791)),
+    ('ControlPosition',                       bytes.fromhex('00fca3c4005b67c400e1394400dc99c3b6882d8b'),
+        (-1311.875, -925.421875, 743.515625, -307.71875, -30538, -29907)),
+    ('Color',                                 bytes.fromhex('d1ada0'),
+        (209, 173, 160)),
+    ('LightManual',                           bytes.fromhex('93b66d'),
+        (46739, 109)),
+    ('LightMode',                             bytes.fromhex('e7032a'),
+        (231, 10755)),
+    ('LightEvent',                            bytes.fromhex('66aaae26'),
+        (102, 44714, 38)),
+    ('LightModeColor',                        bytes.fromhex('24b36ea2ffbd'),
+        (36, 28339, 162, 255, 189)),
+    ('LightModeColors',                       bytes.fromhex('68913c85'),
+        (104, 15505, 133)),
+    ('LightEventColor',                       bytes.fromhex('92894ceaf6c9d5'),
+        (146, 19593, 234, 246, 201, 213)),
+    ('LightEventColors',                      bytes.fromhex('af491a2104'),
+        (175, 6729, 33, 4)),
+    ('CommandLightEvent',                     bytes.fromhex('0ae536197a36'),
+        (10, 229, 54, 31257, 54)),
+    ('CommandLightEventColor',                bytes.fromhex('05db260b4ca327402d'),
+        (5, 219, 38, 19467, 163, 39, 64, 45)),
+    ('CommandLightEventColors',               bytes.fromhex('0581283c02fe44'),
+        (5, 129, 40, 572, 254, 68)),
+    ('Buzzer',                                bytes.fromhex('07aa93fd33'),
+        (7, 37802, 13309)),
+    ('Button',                                bytes.fromhex('f44904'),
+        (18932, 4)),
+    ('JoystickBlock',                         bytes.fromhex('24cf2400'),
+        (36, -49, 36, 0)),
+    ('Joystick',                              bytes.fromhex('7a2d4402d05e0003'),
+        (122, 45, 68, 2, -48, 94, 0, 3)),
+    ('RawMotion',                             bytes.fromhex('83fc81c9c59ab7bd29f20f68'),
+        (-893, -13951, -25915, -16969, -3543, 26639)),
+    ('State',                                 bytes.fromhex('0612110500d904f7'),
+        (6, 18, 17, 5, 0, 217, 4, 247)),
+    ('Attitude',                              bytes.fromhex('ada946c47d59'),
+        (-22099, -15290, 22909)),
+    ('Position',                              bytes.fromhex('00c78f4400f2e6c300c423c4'),
+        (1150.21875, -461.890625, -655.0625)),
+    ('Altitude',                              bytes.fromhex('0022c3c400d2bac3009c594300101242'),
+        (-1561.0625, -373.640625, 217.609375, 36.515625)),
+    ('Motion',                                bytes.fromhex('8c6786a33cf382a9877fd84f9bbb59211c56'),
+        (26508, -23674, -3268, -22142, 32647, 20440, -17509, 8537, 22044)),
+    ('Range',                                 bytes.fromhex('e41e3ec0d83fc043464f2da1'),
+        (7908, -16322, 16344, 17344, 20294, -24275)),
+    ('Trim',                                  bytes.fromhex('aa2e82d09c1c2743'),
+        (11946, -12158, 7324, 17191)),
+    ('VisionSensor',                          bytes.fromhex('008050c200a4954300604cc3'),
+        (-52.125, 299.28125, -204.375)),
+    ('Count',                                 bytes.fromhex('ea62ca08cc7bdf7b67c2dde4d6c7'),
+        (8925989102722638570, 49767, 58589, 51158)),
+    ('Bias',                                  bytes.fromhex('bd3f0a7d1b501cb4d77d4390'),
+        (16317, 32010, 20507, -19428, 32215, -28605)),
+    ('Weight',                                bytes.fromhex('809693c4'),
+        (-1180.703125,)),
+    ('LostConnection',                        bytes.fromhex('162f1b04b33b31f6'),
+        (12054, 1051, 4130421683)),
+    ('MotorBlock',                            bytes.fromhex('015261'),
+        (1, 24914)),
+    ('Motor',                                 bytes.fromhex('0325e301aced02e02f01beb3'),
+        (3, -7387, 1, -4692, 2, 12256, 1, -19522)),
+    ('MotorBlockV',                           bytes.fromhex('ae99'),
+        (-26194,)),
+    ('MotorV',                                bytes.fromhex('7fa0ece403198649'),
+        (-24449, -6932, 6403, 18822)),
+    ('MotorSingle',                           bytes.fromhex('5d03a4a1'),
+        (93, 3, -24156)),
+    ('MotorSingleV',                          bytes.fromhex('939e25'),
+        (147, 9630)),
+    ('InformationAssembledForController',     bytes.fromhex('c9aae9b221b02afdea007229690432063eee'),
+        (-21815, -19735, -20447, 64810, 234, 10610, 1129, 50, 6, 62, -18)),
+    ('InformationAssembledForEntry',          bytes.fromhex('6e6554ab85fec3eddefb0fab019a004846c4'),
+        (25966, -21676, -379, -4669, -1058, -21745, -26111, -793.125)),
+]
+
+
+
+def getClass(name):
+    return globals()[name]
+
+
+
+def flatten(data):
+    listValue = []
+
+    for field in data.schema.fields:
+        value = getattr(data, field[0])
+
+        if isinstance(field[1], str):
+            listValue.append(value.value if isinstance(value, Enum) else value)
+        elif len(field) > 2:
+            for item in value:
+                listValue.extend(flatten(item))
+        else:
+            listValue.extend(flatten(value))
+
+    return tuple(listValue)
+
+
+
+def test_vectors_cover_every_schema_class():
+    names = {cls.__name__ for listClass in dictMessage.values() for cls in listClass}
+    assert names <= {name for name, dataArray, values in VECTORS}
+
+
+
+@pytest.mark.parametrize("name, dataArray, values", VECTORS)
+def test_parse_matches_baseline(name, dataArray, values):
+    cls = getClass(name)
+
+    assert cls.getSize() == len(dataArray)
+
+    data = cls.parse(dataArray)
+    assert flatten(data) == values
+
+
+
+@pytest.mark.parametrize("name, dataArray, values", VECTORS)
+def test_to_array_matches_baseline(name, dataArray, values):
+    cls = getClass(name)
+
+    data = cls.parse(dataArray)
+    assert bytes(data.toArray()) == dataArray
+
+    buffer = bytearray(len(dataArray) + 3)
+    data.packInto(buffer, 3)
+    assert bytes(buffer[3:]) == dataArray
+
+    assert flatten(cls.unpackFrom(b'xyz' + dataArray, 3)) == values
+
+
+
+@pytest.mark.parametrize("name, dataArray, values", VECTORS)
+def test_parse_rejects_wrong_length(name, dataArray, values):
+    cls = getClass(name)
+
+    assert cls.parse(dataArray + b'\x00') == None
+    assert cls.parseTuple(dataArray[:-1]) == None
+    assert cls.parseRecord(dataArray + b'\x00') == None
+
+
+
+def test_default_object_packs_to_schema_size():
+    for name, dataArray, values in VECTORS:
+        cls = getClass(name)
+        assert len(cls().toArray()) == cls.getSize()
+
+
+
+def getSubclasses(cls):
+    for subClass in cls.__subclasses__():
+        yield subClass
+        yield from getSubclasses(subClass)
+
+
+
+def test_slots_on_every_message_class():
+    listClass = list(getSubclasses(ISerializable))
+    assert len(listClass) > 50
+
+    for cls in listClass:
+        assert '__slots__' in cls.__dict__, cls.__name__
+        assert not hasattr(cls(), '__dict__'), cls.__name__
+
+
+
+@pytest.mark.parametrize("name, dataArray, values", VECTORS)
+def test_parse_tuple_and_record(name, dataArray, values):
+    cls = getClass(name)
+
+    assert cls.parseTuple(dataArray) == values
+
+    record = cls.parseRecord(dataArray)
+    assert tuple(record) == values
+    assert record._fields == cls.schema.namesFlat
+
+
+
+def test_parser_decode_mode():
+    from CodingRider.storage import Parser
+
+    parser = Parser()
+
+    for name, dataArray, values in VECTORS:
+        cls         = getClass(name)
+        dataType    = cls.schema.dataType
+
+        # 같은 길이의 다른 구조가 먼저 등록된 DataType은 제외
+        if (dataType == None) or (parser.c[dataType][[other.getSize() for other in parser.c[dataType]].index(len(dataArray))] is not cls):
+            continue
+
+        if Pairing in parser.c[dataType]:
+            assert not parser.setDecodeMode(dataType, DecodeMode.Tuple)
+            continue
+
+        assert parser.setDecodeMode(dataType, DecodeMode.Tuple)
+        assert parser.d[dataType](dataArray) == values
+
+        assert parser.setDecodeMode(dataType, DecodeMode.Record)
+        assert tuple(parser.d[dataType](dataArray)) == values
+        assert type(parser.d[dataType](dataArray)) is cls.schema.record
+
+        assert parser.setDecodeMode(dataType, DecodeMode.Object)
+        data = parser.d[dataType](dataArray)
+        assert isinstance(data, cls)
+        assert flatten(data) == values
+
+
+
+# 최상위 필드 중 읽을 때 변환하는 Enum 필드와 값 목록에서의 위치
+def getLazyFields(schema):
+    listField   = []
+    index       = 0
+
+    for field in schema.fields:
+        if schema._isLazy(field):
+            listField.append((index, field))
+
+        if isinstance(field[1], str):
+            index += 1
+        else:
+            index += len(field[1].schema.namesFlat) * (field[2] if len(field) > 2 else 1)
+
+    return listField
+
+
+
+def getUndefinedValue(enumType, format):
+    listDefined = [member.value for member in enumType]
+    return next(value for value in range(1 << (8 * calcsize('<' + format))) if value not in listDefined)
+
+
+
+def test_lazy_enum_fields_exist():
+    assert sum(len(getLazyFields(getClass(name).schema)) for name, dataArray, values in VECTORS) > 20
+
+
+
+@pytest.mark.parametrize("name, dataArray, values", VECTORS)
+def test_unknown_enum_value_is_kept(name, dataArray, values):
+    cls = getClass(name)
+
+    for index, field in getLazyFields(cls.schema):
+        fieldName, format, enumType = field[0], field[1], field[2]
+
+        value               = getUndefinedValue(enumType, format)
+        listValue           = list(values)
+        listValue[index]    = value
+        dataUnknown         = cls.schema.struct.pack(*listValue)
+
+        # 정의되지 않은 값은 예외 없이 숫자 그대로 사용
+        data = cls.parse(dataUnknown)
+        assert data != None
+        assert getattr(data, fieldName) == value
+        assert bytes(data.toArray()) == dataUnknown
+
+        # 정의된 값은 읽을 때 Enum으로 변환
+        data = cls.parse(dataArray)
+        assert getattr(data, fieldName) == enumType(values[index])
+
+        # Enum과 숫자 모두 지정 가능
+        setattr(data, fieldName, value)
+        assert getattr(data, fieldName) == value
+        setattr(data, fieldName, enumType(values[index]))
+        assert bytes(data.toArray()) == dataArray
+
+
+
+def test_header_rejects_unknown_data_type():
+    # Header는 parse()에서 변환하므로 정의되지 않은 DataType이면 None
+    dataArray = bytes((0x99, 4, DeviceType.Drone.value, DeviceType.Base.value))
+    assert Header.parse(dataArray) == None
+    assert Header.parse(bytes((DataType.Motion.value, 4, DeviceType.Drone.value, DeviceType.Base.value))).dataType == DataType.Motion
@@ -0,0 +1,283 @@
+import os
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from CodingRider.drone import Drone
+from CodingRider.protocol import Command, CommandType, DataType, DeviceType, Header
+from CodingRider.transmitter import TransferPriority, Transmitter
+from CodingRider.transport import LoopbackTransport
+
+
+
+# write() 호출별 데이터를 기록
+class RecordTransport(LoopbackTransport):
+
+    def __init__(self, flagFail = False):
+        super().__init__()
+        self.listWrite  = []
+        self.flagFail   = flagFail
+
+    def write(self, dataArray):
+        if self.flagFail:
+            raise OSError("port is gone")
+
+        self.listWrite.append(bytes(dataArray))
+        return len(dataArray)
+
+
+
+def makeStop():
+    header          = Header()
+    header.dataType = DataType.Command
+    header.length   = Command.getSize()
+    header.from_    = DeviceType.Base
+    header.to_      = DeviceType.Drone
+
+    data                = Command()
+    data.commandType    = CommandType.Stop
+    data.option         = 0
+
+    return header, data
+
+
+
+def test_synchronous_by_default():
+    transport   = RecordTransport()
+    drone       = Drone(False)
+    assert drone.open(transport = transport)
+
+    drone.sendStop()
+    assert len(transport.listWrite) == 1
+
+    drone.close()
+
+
+
+def test_synchronous_write_error_raises():
+    transport   = RecordTransport(True)
+    drone       = Drone(False)
+    assert drone.open(transport = transport)
+
+    with pytest.raises(OSError):
+        drone.sendStop()
+
+    drone.close()
+
+
+
+def test_background_write_error_is_reported(capsys):
+    transport   = RecordTransport(True)
+    drone       = Drone(False, flagShowErrorMessage = True, flagTransferBackground = True)
+    assert drone.open(transport = transport)
+
+    future = drone.transfer(*makeStop(), flagFuture = True)
+    assert isinstance(future.exception(1), OSError)
+
+    drone.close()
+    assert "port is gone" in capsys.readouterr().out
+
+
+
+# close()하지 않고 프로그램이 끝나도 대기열의 데이터를 모두 전송
+SCRIPT_EXIT = """
+import sys, time
+from CodingRider.drone import Drone
+from CodingRider.protocol import DataType, DeviceType
+from CodingRider.transmitter import TransferPriority, Transmitter
+from CodingRider.transport import LoopbackTransport
+
+class SlowTransport(LoopbackTransport):
+    def write(self, dataArray):
+        time.sleep(0.002)
+        with open(sys.argv[1], "ab") as file:
+            file.write(dataArray)
+        return len(dataArray)
+
+drone = Drone(False, flagTransferBackground = True)
+drone.open(transport = SlowTransport())
+for i in range(50):
+    drone.sendRequest(DeviceType.Drone, DataType.State)
+drone.sendLanding()
+"""
+
+
+
+def test_background_queue_flushed_at_exit(tmp_path):
+    path = tmp_path / "port.bin"
+    path.write_bytes(b'')
+
+    environ = dict(os.environ)
+    environ["PYTHONPATH"] = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    subprocess.run([sys.executable, "-c", SCRIPT_EXIT, str(path)], env = environ, check = True, timeout = 30)
+
+    listDataType = getDataTypes([path.read_bytes()])
+    assert listDataType.count(DataType.Request) == 50
+    assert listDataType.count(DataType.Command) == 1
+
+
+
+# 첫 번째 write()를 release()할 때까지 멈춰 두는 통신 경로
+class GateTransport(RecordTransport):
+
+    def __init__(self):
+        super().__init__()
+        self.eventEntered   = threading.Event()
+        self.eventRelease   = threading.Event()
+
+    def write(self, dataArray):
+        self.eventEntered.set()
+        self.eventRelease.wait(5)
+        return super().write(dataArray)
+
+
+
+def getDataTypes(listWrite):
+    listDataType = []
+
+    for dataArray in listWrite:
+        index = 0
+        while index < len(dataArray):
+            listDataType.append(DataType(dataArray[index + 2]))
+            index += dataArray[index + 3] + 8
+
+    return listDataType
+
+
+
+def test_high_priority_drops_pending_control():
+    transport   = GateTransport()
+    drone       = Drone(False, flagTransferBackground = True)
+    assert drone.open(transport = transport)
+
+    drone.sendControl(1, 0, 0, 0)
+    assert transport.eventEntered.wait(5)
+
+    # 송신 스레드가 첫 번째 write()에서 멈춰 있는 동안 대기열에 추가
+    for i in range(5):
+        drone.sendControl(2, 0, 0, 0)
+    drone.sendBuzzerHz(440, 100)
+    drone.sendStop()
+
+    transport.eventRelease.set()
+    assert drone.flush(5)
+
+    drone.sendControl(3, 0, 0, 0)
+    drone.close()
+
+    assert getDataTypes(transport.listWrite) == [DataType.Control, DataType.Command, DataType.Buzzer, DataType.Control]
+    assert [dataArray[6] for dataArray in transport.listWrite if dataArray[2] == DataType.Control.value] == [1, 3]
+    assert drone.getTransferStatistics().countDropped == 5
+
+
+
+def startGated(sizeWriteMax = 256, sizeQueue = 256):
+    transport   = GateTransport()
+    transmitter = Transmitter(sizeQueue = sizeQueue, sizeWriteMax = sizeWriteMax)
+    transmitter.start(transport)
+
+    # 첫 번째 write()가 멈춰 있는 동안 나머지를 대기열에 추가
+    transmitter.put(b'first')
+    assert transport.eventEntered.wait(5)
+
+    return transport, transmitter
+
+
+
+def test_coalesce_pending_frames():
+    transport, transmitter = startGated(sizeWriteMax = 100)
+
+    listData    = [bytes([index]) * 10 for index in range(25)]
+    listFuture  = [transmitter.put(dataArray) for dataArray in listData]
+
+    transport.eventRelease.set()
+    assert transmitter.flush(5)
+    transmitter.stop()
+
+    # 대기중이던 250 바이트는 100 바이트 이내로 묶어서 3번에 전송
+    assert transport.listWrite[0] == b'first'
+    assert [len(dataArray) for dataArray in transport.listWrite[1:]] == [100, 100, 50]
+    assert b''.join(transport.listWrite[1:]) == b''.join(listData)
+
+    assert [future.result(1) for future in listFuture] == listData
+    assert transmitter.statistics.countFrame == 26
+    assert transmitter.statistics.countWrite == 4
+    assert transmitter.statistics.sizeWritten == 255
+    assert transmitter.statistics.depthMax == 25
+
+
+
+def test_coalesce_frame_larger_than_limit():
+    transport, transmitter = startGated(sizeWriteMax = 8)
+
+    listData = [bytes([index]) * 10 for index in range(3)]
+    for dataArray in listData:
+        transmitter.put(dataArray)
+
+    transport.eventRelease.set()
+    assert transmitter.flush(5)
+    transmitter.stop()
+
+    # 최대 크기보다 큰 프레임도 하나씩 전송
+    assert transport.listWrite[1:] == listData
+
+
+
+def test_stop_cancels_pending():
+    transport, transmitter = startGated()
+
+    future = transmitter.put(b'pending')
+    transmitter.stop(False, 0.1)
+    transport.eventRelease.set()
+
+    assert future.cancelled()
+    assert transmitter.put(b'after stop').cancelled()
+
+
+
+def test_priority_order_and_no_mixing():
+    transport, transmitter = startGated()
+
+    transmitter.put(b'low-1', TransferPriority.Low)
+    transmitter.put(b'normal-1', TransferPriority.Normal)
+    transmitter.put(b'high-1', TransferPriority.High)
+    transmitter.put(b'normal-2', TransferPriority.Normal)
+    transmitter.put(b'low-2', TransferPriority.Low)
+    transmitter.put(b'high-2', TransferPriority.High)
+
+    transport.eventRelease.set()
+    assert transmitter.flush(5)
+    transmitter.stop()
+
+    # 우선 순위가 높은 순서로 전송하며, 같은 우선 순위의 프레임끼리만 묶음
+    assert transport.listWrite == [b'first', b'high-1high-2', b'normal-1normal-2', b'low-1low-2']
+
+    assert transmitter.statisticsPriority[TransferPriority.High].countWrite == 1
+    assert transmitter.statisticsPriority[TransferPriority.Normal].countWrite == 2
+    assert transmitter.statisticsPriority[TransferPriority.Low].countWrite == 1
+
+
+
+def test_high_priority_does_not_wait_for_full_queue():
+    transport, transmitter = startGated(sizeQueue = 2)
+
+    transmitter.put(b'normal-1')
+    transmitter.put(b'normal-2')
+
+    listFuture  = []
+    thread      = threading.Thread(target = lambda: listFuture.append(transmitter.put(b'high', TransferPriority.High)))
+    thread.start()
+    thread.join(1)
+
+    # 대기열이 가득 차 있어도 바로 추가
+    assert not thread.is_alive()
+
+    transport.eventRelease.set()
+    assert transmitter.flush(5)
+    transmitter.stop()
+
+    assert listFuture[0].result(1) == b'high'
+    assert transport.listWrite == [b'first', b'high', b'normal-1normal-2']